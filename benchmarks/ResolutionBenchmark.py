@@ -0,0 +1,63 @@
+import os
+import sys
+import time
+import pygame
+sys.path.append(os.getcwd())
+from config import GET_PROJECT_PATH, LOGICAL_RESOLUTION
+
+
+def draw_scene(screen: pygame.Surface, background: pygame.Surface, sprite: pygame.Surface):
+    """Desenha um frame parecido com o do combate (Fundo, container, projéteis e textos)
+
+    Args:
+        screen (pygame.Surface): Superfície onde o frame é desenhado
+        background (pygame.Surface): Imagem de fundo da batalha
+        sprite (pygame.Surface): Imagem usada como projétil
+    """
+    width, height = screen.get_size()
+    screen.fill((0, 0, 0))
+    screen.blit(pygame.transform.scale(background, (width/1.2, height*300/720)), (width/12, 10))
+    pygame.draw.rect(screen, (255, 255, 255), (width/3, height/2, width/3, height/3))
+    pygame.draw.rect(screen, (0, 0, 0), (width/3+5, height/2+5, width/3-10, height/3-10))
+    for i in range(200):
+        screen.blit(sprite, ((i*37) % width, (i*53) % height))
+
+
+def benchmark(native_size: tuple[int], frames: int = 120) -> dict[str, float]:
+    """Compara desenhar na resolução nativa com desenhar na lógica e ampliar uma vez
+
+    Args:
+        native_size (tuple[int]): Resolução nativa simulada
+        frames (int, optional): Quantos frames desenhar em cada caminho. Defaults to 120.
+
+    Returns:
+        dict[str, float]: Milissegundos por frame de cada caminho
+    """
+    background = pygame.image.load(os.path.join(GET_PROJECT_PATH(), 'sprites', 'hud', 'battle-background.png'))
+    sprite = pygame.image.load(os.path.join(GET_PROJECT_PATH(), 'sprites', 'player', 'hearts', 'heart.png'))
+
+    native = pygame.Surface(native_size)
+    logical = pygame.Surface(LOGICAL_RESOLUTION or (1280, 720))
+
+    results = {}
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw_scene(native, background, sprite)
+    results['native'] = (time.perf_counter() - start)*1000/frames
+
+    # Ampliação manual, o pygame.SCALED faz essa etapa na placa de vídeo
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw_scene(logical, background, sprite)
+        pygame.transform.scale(logical, native_size, native)
+    results['logical'] = (time.perf_counter() - start)*1000/frames
+
+    return results
+
+
+if __name__ == '__main__':
+    pygame.init()
+    size = tuple(int(value) for value in sys.argv[1].split('x')) if len(sys.argv) > 1 else (3840, 2160)
+    for path, ms in benchmark(size).items():
+        print(f'{path}: {ms:.2f} ms/frame')
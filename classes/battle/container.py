@@ -52,6 +52,11 @@ class BattleContainer:
         self.inner_rect.size = (self.out_rect.width-10, self.out_rect.height-10)
         self.inner_rect.center = self.out_rect.center
 
+    @property
+    def width_settled(self) -> bool:
+        """Se a largura já chegou na pedida no último resize (Ela só muda de novo com outro tamanho)"""
+        return abs(self.out_rect.width - self.resize_new_width) <= 10
+
     def draw(self):
         """Função que desenha as caixas
         """
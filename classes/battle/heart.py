@@ -8,6 +8,7 @@ import random
 from config import GET_PROJECT_PATH, FPS
 from config.eventmanager import EventManager
 from config.combatmanager import CombatManager
+from config.rendermanager import RenderManager
 
 from classes.battle.container import BattleContainer
 from classes.player import Player
@@ -68,20 +69,8 @@ class Heart(Player):
         self.circle_drawn = False
         self.next_x = self.rect.x
         self.next_y = self.rect.y
-        w = self.container.inner_rect.width
-        h = self.container.inner_rect.height
         self.current_node = 'E'
-        self.graph = {
-            'A': {'pos': (w/1.3, h), 'neighbors': ['B', 'D']},
-            'B': {'pos': (w, h), 'neighbors': ['A', 'C', 'E']},
-            'C': {'pos': (1.25*w, h), 'neighbors': ['B', 'F']},
-            'D': {'pos': (w/1.3, (h+1.8*h)/2), 'neighbors': ['A', 'E', 'G']},
-            'E': {'pos': (w, (h+1.8*h)/2), 'neighbors': ['B', 'D', 'F', 'H']},
-            'F': {'pos': (1.25*w, (h+1.8*h)/2), 'neighbors': ['C', 'E', 'I']},
-            'G': {'pos': (w/1.3, 1.8*h), 'neighbors': ['D', 'H']},
-            'H': {'pos': (w, 1.8*h), 'neighbors': ['E','G', 'I']},
-            'I': {'pos': (1.25*w, 1.8*h), 'neighbors': ['F', 'H']}
-        }
+        self.build_lattice(*self.container.inner_rect.size)  # Os nós ficam sempre no mesmo lugar da tela
         self.current_pos = self.graph[self.current_node]['pos']
         self.damage_taken = False
         self.counter = 0
@@ -135,7 +124,7 @@ class Heart(Player):
         # Desenha o círculo na posição futura
         if self.circle_drawn and actual_time < self.next_position_time:
             pygame.draw.circle(
-                pygame.display.get_surface(),
+                RenderManager.display,
                 (255, 165, 0),
                 (self.next_x + self.rect.width // 2, self.next_y + self.rect.height // 2),
                 5
@@ -152,50 +141,71 @@ class Heart(Player):
             self.next_position_time = actual_time + self.delay_time
             self.circle_drawn = False
 
-    def draw_graph(self, graph:dict):
+    def build_lattice(self, w: float, h: float):
+        """Calcula o grafo do efeito prisioned (Posição dos nós e vizinho em cada direção) e desenha ele
+        em uma imagem, assim cada frame do efeito só cola essa imagem na tela
+
+        Args:
+            w (float): Largura usada para posicionar os nós (A do container quando o coração é criado)
+            h (float): Altura usada para posicionar os nós
+        """
+        self.graph = {
+            'A': {'pos': (w/1.3, h), 'neighbors': ['B', 'D']},
+            'B': {'pos': (w, h), 'neighbors': ['A', 'C', 'E']},
+            'C': {'pos': (1.25*w, h), 'neighbors': ['B', 'F']},
+            'D': {'pos': (w/1.3, (h+1.8*h)/2), 'neighbors': ['A', 'E', 'G']},
+            'E': {'pos': (w, (h+1.8*h)/2), 'neighbors': ['B', 'D', 'F', 'H']},
+            'F': {'pos': (1.25*w, (h+1.8*h)/2), 'neighbors': ['C', 'E', 'I']},
+            'G': {'pos': (w/1.3, 1.8*h), 'neighbors': ['D', 'H']},
+            'H': {'pos': (w, 1.8*h), 'neighbors': ['E','G', 'I']},
+            'I': {'pos': (1.25*w, 1.8*h), 'neighbors': ['F', 'H']}
+        }
+
+        # Vizinho de cada nó em cada direção, pela posição na matriz 3x3 (None se não tiver aresta)
+        node_matrix = ['ABC', 'DEF', 'GHI']
+        steps = {'up': (-1, 0), 'down': (1, 0), 'left': (0, -1), 'right': (0, 1)}
+        self.graph_moves: dict[str, dict[str, str | None]] = {}
+        for i, row in enumerate(node_matrix):
+            for j, node in enumerate(row):
+                self.graph_moves[node] = {}
+                for direction, (di, dj) in steps.items():
+                    next_node = node_matrix[i+di][j+dj] if 0 <= i+di < 3 and 0 <= j+dj < 3 else None
+                    self.graph_moves[node][direction] = next_node if next_node in self.graph[node]['neighbors'] else None
+
+        # A imagem começa em uma posição inteira, assim o desenho fica igual ao feito direto na tela
+        radius = 7
+        left = math.floor(min(data['pos'][0] for data in self.graph.values())) - radius - 1
+        top = math.floor(min(data['pos'][1] for data in self.graph.values())) - radius - 1
+        right = math.ceil(max(data['pos'][0] for data in self.graph.values())) + radius + 1
+        bottom = math.ceil(max(data['pos'][1] for data in self.graph.values())) + radius + 1
+        self.graph_image = pygame.Surface((right - left, bottom - top), pygame.SRCALPHA)
+        self.graph_image_position = (left, top)
+        self.draw_graph(self.graph, self.graph_image, (-left, -top))
+
+    def draw_graph(self, graph: dict, surface: pygame.Surface, offset: tuple[float, float] = (0, 0)):
         # Desenhando o grafo
         for node, data in graph.items():
             for neighbor in data["neighbors"]:
                 pygame.draw.line(
-                    surface=pygame.display.get_surface(), 
+                    surface=surface, 
                     color=(255,255,255),
-                    start_pos=data["pos"],
-                    end_pos=graph[neighbor]["pos"],
+                    start_pos=(data["pos"][0] + offset[0], data["pos"][1] + offset[1]),
+                    end_pos=(graph[neighbor]["pos"][0] + offset[0], graph[neighbor]["pos"][1] + offset[1]),
                     width=2)
                 
         # Desenhando os nós
         for node, data in graph.items():
             pygame.draw.circle(
-                surface=pygame.display.get_surface(),
+                surface=surface,
                 color=(233, 153, 247),
-                center=data["pos"],
+                center=(data["pos"][0] + offset[0], data["pos"][1] + offset[1]),
                 radius=7
             )
 
     def move_to_neighbor(self, direction):
-        # Inicializa a matriz de nós
-        node_matrix = np.array(list("ABCDEFGHI")).reshape(3, 3)
-
-        # Encontra a posição atual do nó em que o personagem está
-        current_node = self.current_node  # 'A', 'B', ..., 'I'
-        current_index = np.argwhere(node_matrix == current_node)[0]  # Posição na matriz (i, j)
-
-        i, j = current_index
-
-        
-        # Define o próximo índice com base na direção
-        if direction == "up" and i > 0:
-            i -= 1
-        elif direction == "down" and i < 2:
-            i += 1
-        elif direction == "left" and j > 0:
-            j -= 1
-        elif direction == "right" and j < 2:
-            j += 1
-
         # Atualiza o nó atual apenas se houver conexão no grafo
-        next_node = node_matrix[i, j]
-        if next_node in self.graph[current_node]['neighbors']:
+        next_node = self.graph_moves[self.current_node][direction]
+        if next_node is not None:
             self.current_node = next_node
             self.rect.center = self.graph[next_node]['pos']  # Move o personagem para o próximo nó
 
@@ -215,8 +225,8 @@ class Heart(Player):
         # Inicialização da posição do coração
         self.rect.center = self.graph[self.current_node]['pos']
 
-        # Desenho o grafo
-        self.draw_graph(graph=self.graph)
+        # Desenho o grafo (Já pronto na imagem)
+        RenderManager.display.blit(self.graph_image, self.graph_image_position)
 
     def update(self, *args, **kwargs):
         # Obtendo as teclas pressionadas
@@ -8,6 +8,7 @@ from config import *
 from config.fontmanager import FontManager
 from config.soundmanager import SoundManager
 from config.eventmanager import EventManager
+from config.rendermanager import RenderManager
 
 from classes.battle.container import BattleContainer
 from classes.battle.menus import BattleMenu
@@ -23,7 +24,7 @@ class ActMenu(BattleMenu):
     def __init__(self, battle_container: BattleContainer):
         self.__options: list[dict] = []  # Lista de opções
         self.container = battle_container  # Container dos menus
-        self.display = pygame.display.get_surface()  # A tela do jogo
+        self.display = RenderManager.display  # A tela do jogo
 
         self.selected_option = 0
         self.trying_to_move_cursor = False  # Variável responsável por controlar e mexer apenas uma opção por vez, sem que o cursor mexa que nem doido
@@ -53,6 +54,17 @@ class ActMenu(BattleMenu):
         """
         self.selected_option = (self.selected_option+increment)%len(self.__options)
     
+    def prepare_responses(self, options: list[dict], max_length: float):
+        """Prepara em segundo plano todas as respostas das opções de ação
+
+        Args:
+            options (list[dict]): Opções de ação do boss
+            max_length (float): Largura em que as respostas vão ser mostradas
+        """
+        for option in options:
+            for response in option['responses']:
+                self.response_text.prepare(response, max_length)
+
     def on_first_execution(self):
         self.runtime_counter += 1
         EventManager.clear()
@@ -65,6 +77,10 @@ class ActMenu(BattleMenu):
 
         # Bloco que executa se eu não tiver selecionado nenhuma opção
         if not self.showing_act_response:
+            # Enquanto o player escolhe, as respostas são preparadas na largura em que vão aparecer
+            if self.container.width_settled:
+                self.prepare_responses(self.__options, self.container.inner_rect.width)
+
             # Ajusto o cursor
             self.cursor_rect.center = self.__options[self.selected_option%len(self.__options)]['text'].rect.center
             self.cursor_rect.right = self.__options[self.selected_option%len(self.__options)]['text'].rect.left
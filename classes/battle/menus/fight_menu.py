@@ -7,6 +7,7 @@ from config.fontmanager import FontManager
 from config.soundmanager import SoundManager
 from config.combatmanager import CombatManager
 from config.eventmanager import EventManager
+from config.rendermanager import RenderManager
 
 from classes.battle.menus import BattleMenu
 from classes.battle.menus.battle_menu_manager import BattleMenuManager
@@ -18,7 +19,7 @@ class FightMenu(BattleMenu):
     def __init__(self):
         self.__options: list[dict] = []  # Lista de opções
         self.container = CombatManager.get_variable('battle_container')  # Container dos menus
-        self.display = pygame.display.get_surface()  # A tela do jogo
+        self.display = RenderManager.display  # A tela do jogo
 
         self.selected_option = 0
         self.trying_to_move_cursor = False  # Variável responsável por controlar e mexer apenas uma opção por vez, sem que o cursor mexa que nem doido
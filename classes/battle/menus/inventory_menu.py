@@ -7,6 +7,7 @@ from config.fontmanager import FontManager
 from config.soundmanager import SoundManager
 from config.eventmanager import EventManager
 from config.combatmanager import CombatManager
+from config.rendermanager import RenderManager
 
 from classes.battle.container import BattleContainer
 from classes.battle.menus import BattleMenu
@@ -22,7 +23,7 @@ class InventoryMenu(BattleMenu):
     def __init__(self, battle_container: BattleContainer):
         self.__options: list[dict] = []  # Lista de opções
         self.container = battle_container  # Container dos menus
-        self.display = pygame.display.get_surface()  # A tela do jogo
+        self.display = RenderManager.display  # A tela do jogo
 
         self.selected_option = 0
         self.trying_to_move_cursor = False  # Variável responsável por controlar e mexer apenas uma opção por vez, sem que o cursor mexa que nem doido
@@ -1,9 +1,13 @@
 import pygame
 from abc import ABC, abstractmethod
 from config.soundmanager import SoundManager
+from classes.bosses.pool import ProjectilePool
+from classes.bosses.timeline import Timeline
 
 
 class Boss(pygame.sprite.Sprite, ABC):
+    images: list[str] = []  # Imagens lidas ao criar o boss (O CombatManager lê elas antes da luta)
+
     @abstractmethod
     def take_damage(self, amount: float):...
 
@@ -22,7 +26,7 @@ class Boss(pygame.sprite.Sprite, ABC):
     
     def take_damage(self, amount):
         self.life = self.life - amount*amount/(amount+self.defense)
-        SoundManager.play_sound('damage.wav', 0)
+        SoundManager.play_sound('damage.wav')
         if self.life <= 0:
             self.life = 0
             self.dead = True
@@ -33,6 +37,30 @@ class Boss(pygame.sprite.Sprite, ABC):
         for attack in self.attacks:
             attack.restart()
 
+    def register(self):
+        """Registra as hitboxes e as camadas do boss e dos ataques no CombatManager (Chamada no começo da luta,
+        criar o boss não mexe em nada global)
+        """
+        for attack in self.attacks:
+            attack.register()
+
+    def count_entities(self) -> int:
+        """Conta quantos projéteis estão vivos no ataque atual, somando as pools do próprio boss (Que valem em todos os ataques)
+
+        Returns:
+            int: Quantidade de projéteis ativos
+        """
+        attack = self.current_attack
+        own = sum(len(pool) for pool in vars(self).values() if isinstance(pool, ProjectilePool))
+        return own + (attack.count_entities() if attack is not None else 0)
+
+    @property
+    def current_attack(self) -> 'Attack':
+        """Ataque que está sendo executado nesse frame (None se o boss não estiver atacando)"""
+        if self.dead or self.speaking or not 0 <= self.attack_to_execute < len(self.attacks):
+            return None
+        return self.attacks[self.attack_to_execute]
+
     @property
     @abstractmethod
     def attacks(self):...
@@ -107,6 +135,8 @@ class Boss(pygame.sprite.Sprite, ABC):
 
 
 class Attack(ABC):
+    timeline: Timeline = None  # Roteiro do ataque, compilado antes de cada turno
+
     @property
     @abstractmethod
     def player(self):...
@@ -125,3 +155,59 @@ class Attack(ABC):
     @abstractmethod
     def restart(self):...
 
+    def register(self):
+        """Registra as hitboxes e as camadas do ataque no CombatManager (Chamada pelo register do boss)
+        """
+
+    def schedule(self, timeline: Timeline):
+        """Coloca na timeline tudo que o ataque dispara, com os parâmetros já sorteados pelo timeline.rng
+        (Ataques que não usam timeline não precisam sobrescrever)
+
+        Args:
+            timeline (Timeline): Timeline vazia
+        """
+
+    def compile_timeline(self, seed: int = None) -> Timeline:
+        """Cria a timeline do ataque (Chamada no restart, antes do turno começar)
+
+        Args:
+            seed (int, optional): Seed dos sorteios. Defaults to uma seed aleatória.
+
+        Returns:
+            Timeline: A timeline criada
+        """
+        self.timeline = Timeline(seed)
+        self.schedule(self.timeline)
+        return self.timeline
+
+    def play_timeline(self, frame: int):
+        """Executa o que a timeline marcou para o frame
+
+        Args:
+            frame (int): Frame atual do ataque
+        """
+        if self.timeline is None:
+            self.compile_timeline()
+        self.timeline.play(frame)
+
+    def seek(self, frame: int, seed: int = None):
+        """Reinicia o ataque e roda ele direto até o frame pedido (Para testes e execuções sem tela)
+
+        Args:
+            frame (int): Frame onde o ataque deve parar
+            seed (int, optional): Seed da timeline. Defaults to uma seed aleatória.
+        """
+        self.restart()
+        if seed is not None:
+            self.compile_timeline(seed)
+        while self.duration_counter < frame:
+            self.run()
+
+    def count_entities(self) -> int:
+        """Conta quantos projéteis do ataque estão vivos (Soma de todas as pools dele)
+
+        Returns:
+            int: Quantidade de projéteis ativos
+        """
+        return sum(len(pool) for pool in vars(self).values() if isinstance(pool, ProjectilePool))
+
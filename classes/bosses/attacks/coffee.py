@@ -6,6 +6,8 @@ from config import *
 from config.combatmanager import CombatManager
 from config.soundmanager import SoundManager
 
+from classes.bosses.pool import Projectile
+
 class CoffeeCup(pygame.sprite.Sprite):
     def __init__(self, x, y, drops_group, *groups):
         """
@@ -31,8 +33,6 @@ class CoffeeCup(pygame.sprite.Sprite):
         self.counter_rate = FPS*0.5
         self.drops_group = pygame.sprite.Group()
 
-        CombatManager.global_groups.append(self.drops_group)
-
     def start_flip(self):
         """Inicia a animação de virar a xícara."""
         self.flipping = True
@@ -64,26 +64,43 @@ class CoffeeCup(pygame.sprite.Sprite):
             if self.drop_timer >= self.drop_interval:
                 self.drop_timer = 0
         
-class CoffeeDrop(pygame.sprite.Sprite):
-    def __init__(self, *groups):
-        super().__init__(*groups)
+class CoffeeDrop(Projectile):
+    lifetime = None  # Só some quando sai da tela
+
+    def __init__(self, pool=None):
+        super().__init__(pool)
+
+        # Criando os sprites para gotas (Compartilhados entre todas as gotas)
+        self.image, self.mask = self.get_asset(('drop_coffee', 40), lambda: pygame.transform.scale(
+            CombatManager.load_image(os.path.join(GET_PROJECT_PATH(), 'sprites', 'effects', 'drop_coffee.png')).convert_alpha(),
+            (40, 40)
+        ))
 
-        # Criando os sprites para gotas
-        self.image_path = pygame.image.load(
-            os.path.join(GET_PROJECT_PATH(), 'sprites', 'effects', 'drop_coffee.png')
-        ).convert_alpha()
-        self.image = pygame.transform.scale(self.image_path, (40, 40))
+        self.gravity = 0.05  # Aceleração para queda
+
+    @staticmethod
+    def plan(rng: random.Random) -> tuple:
+        """Sorteia onde a gota surge (Fração da largura do container)
+
+        Args:
+            rng (random.Random): Gerador da timeline do ataque
+
+        Returns:
+            tuple: Os parâmetros do spawn
+        """
+        return (rng.random(),)
+
+    def spawn(self, offset: float):
         self.rect = self.image.get_rect()
-        self.coffee_mask = pygame.mask.from_surface(self.image)
-        
+
         # Velocidade da gota
         self.flip_speed = 0.5  # Velocidade aleatória para variação
-        self.gravity = 0.05  # Aceleração para queda
 
-        self.randomize_position()
+        self.place(offset)
+        self.set_motion((0, self.flip_speed), (0, self.gravity))  # Cai cada vez mais rápido
 
-    def randomize_position(self):
-        """Define uma posição aleatória para as gotas."""
+    def place(self, offset: float):
+        """Define a posição da gota."""
 
         battle_container = CombatManager.get_variable('battle_container')
         display_rect = battle_container.inner_rect
@@ -91,7 +108,7 @@ class CoffeeDrop(pygame.sprite.Sprite):
         self.rect.top = display_rect.top - 50  # Começa logo acima do container
 
         # Reduzindo a chance de uma gota ser criada
-        self.rect.x = random.randint(display_rect.left, display_rect.right)
+        self.rect.x = display_rect.left + int(offset*(display_rect.width + 1))
         self.rect.y += self.gravity
 
     def draw_drops(self, surface):
@@ -102,8 +119,3 @@ class CoffeeDrop(pygame.sprite.Sprite):
             surface (pygame.Surface): Superfície onde os elementos serão desenhados.
         """
         self.drops_group.draw(surface)
-
-    def update(self, *args, **kwargs):
-        # Atualizar posição
-        self.rect.y += self.flip_speed
-        self.flip_speed += self.gravity  # Aplicar gravidade
@@ -1,50 +1,76 @@
 import pygame
 import os
 import random
+import numpy as np
 
 from config import *
 from config.combatmanager import CombatManager
 
 from classes.sprites.spritesheet import SpriteSheet
+from classes.bosses.pool import Projectile
 
 
-class Dice(pygame.sprite.Sprite):
-    def __init__(self, *groups):
-        super().__init__(*groups)
-        self.sprites = SpriteSheet(
-            1,
-            6,
-            os.path.join(GET_PROJECT_PATH(), 'sprites', 'effects', 'dice.png'),
-            16,
-            16,
-            scale_by=3
-        )
+class Dice(Projectile):
+    lifetime = None  # Só some quando sai da tela
+    sprites: SpriteSheet = None  # Quadros do dado, compartilhados entre todos os dados
+    masks: list[pygame.mask.Mask] = []
 
+    def __init__(self, pool=None):
+        super().__init__(pool)
+        if Dice.sprites is None:
+            Dice.sprites = SpriteSheet(
+                1,
+                6,
+                os.path.join(GET_PROJECT_PATH(), 'sprites', 'effects', 'dice.png'),
+                16,
+                16,
+                scale_by=3
+            )
+            Dice.masks = [pygame.mask.from_surface(frame) for frame in Dice.sprites[0]]
+
+        self.change_frame_rate = FPS/10
+        self.gravity = 0.5
+
+    @staticmethod
+    def plan(rng: random.Random) -> tuple:
+        """Sorteia os parâmetros de um disparo: onde ele surge (Fração da largura do container) e para qual lado vai
+
+        Args:
+            rng (random.Random): Gerador da timeline do ataque
+
+        Returns:
+            tuple: Os parâmetros do spawn
+        """
+        return rng.random(), rng.choice([1, -1])
+
+    def spawn(self, offset: float, direction: int):
         self.actual_sprite = 1
 
         self.image: pygame.Surface = self.sprites[0][self.actual_sprite]
+        self.mask = self.masks[self.actual_sprite]
         self.rect = self.image.get_rect()
 
-        self.change_frame_rate = FPS/10
         self.change_frame_counter = 0
 
-        self.gravity = 0.5
         self.force = 25
 
-        self.dir = 0
+        self.dir = direction
 
-        self.randomize_position()
+        self.place(offset)
+
+        # Sobe com a força inicial e a gravidade puxa para baixo, até a velocidade máxima de queda
+        self.set_motion((self.dir, -self.force), (0, self.gravity), (np.inf, 10))
     
-    def randomize_position(self):
+    def place(self, offset: float):
         container = CombatManager.get_variable('battle_container')
 
-        self.dir = random.choice([1, -1])
-
-        self.rect.x = random.randint(container.inner_rect.left, container.inner_rect.right)
+        # O container pode mudar de tamanho até o disparo, então a posição só é calculada aqui
+        self.rect.x = container.inner_rect.left + int(offset*(container.inner_rect.width + 1))
         self.rect.y = pygame.display.get_surface().get_height()
     
     def change_sprites(self):
         self.image: pygame.Surface = self.sprites[0][self.actual_sprite]
+        self.mask = self.masks[self.actual_sprite]
         self.rect = self.image.get_rect(center=self.rect.center)
     
     def update(self):
@@ -54,10 +80,3 @@ class Dice(pygame.sprite.Sprite):
             self.change_frame_counter = 0
             self.actual_sprite = (self.actual_sprite+1)%len(self.sprites[0])
             self.change_sprites()
-        
-        self.rect.x += (1*self.dir)
-
-        self.rect.y -= self.force
-        self.force -= self.gravity
-        if self.force <= -10:
-            self.force = -10
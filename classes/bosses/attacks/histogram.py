@@ -13,6 +13,7 @@ import random
 from config import *
 from config.combatmanager import CombatManager
 from config.soundmanager import SoundManager
+from config.rendermanager import RenderManager
 
 class Histogram(pygame.sprite.Sprite):
     def __init__(self, *groups):
@@ -32,7 +33,6 @@ class Histogram(pygame.sprite.Sprite):
         # Inicializando os grupos
         self.bars_group = pygame.sprite.Group()
         self.axis_group = pygame.sprite.Group()
-        CombatManager.global_draw_functions.append(self.draw_bars)
 
         self.counter = 0
 
@@ -66,11 +66,15 @@ class Histogram(pygame.sprite.Sprite):
             self.rects.append(rect)
             self.speeds.append(random.randint(1, 5))  # Velocidades aleatórias
 
+    def collide(self, rect: pygame.Rect, mask: pygame.mask.Mask) -> list[pygame.Rect]:
+        """Retorna as barras que encostam no retângulo (As barras não têm máscara, então ela é ignorada)"""
+        return [self.rects[i] for i in rect.collidelistall(self.rects)]
+
     def draw_bars(self, *args, **kwargs):
         """Desenha as barras na tela."""
         if self.on_attack:
             for rect in self.rects:
-                pygame.draw.rect(pygame.display.get_surface(), self.rects_color, rect)
+                pygame.draw.rect(RenderManager.display, self.rects_color, rect)
     
     def restart(self):
         self.counter = 0
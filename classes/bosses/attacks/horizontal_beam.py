@@ -6,6 +6,8 @@ from config import *
 from config.combatmanager import CombatManager
 from config.soundmanager import SoundManager
 
+from classes.bosses.hitbox import RectHitbox
+
 
 class HorizontalBeam(pygame.sprite.Sprite):
     def __init__(self, *groups):
@@ -17,7 +19,6 @@ class HorizontalBeam(pygame.sprite.Sprite):
         self.max_rect_height = 0
         self.image = pygame.Surface((self.actual_display.get_width(), 10), pygame.SRCALPHA)
         self.image.fill(self.color)
-        self.update_mask()
         self.rect = self.image.get_rect()
 
         self.animating = False
@@ -30,8 +31,13 @@ class HorizontalBeam(pygame.sprite.Sprite):
 
         self.correct_center_position = (0,0)
     
-    def update_mask(self):
-        self.mask = pygame.mask.from_surface(self.image)
+    @property
+    def hitbox(self) -> RectHitbox:
+        return RectHitbox(self.rect)  # O raio é um retângulo cheio, não precisa de máscara
+
+    @property
+    def dangerous(self) -> bool:
+        return self.animating and self.color.a > 127  # Só depois que o raio aparece forte na tela
 
     def fade_out_rect(self):
         self.alpha -= self.fading_counter
@@ -47,17 +53,16 @@ class HorizontalBeam(pygame.sprite.Sprite):
         self.color = pygame.Color(255, 0, 0, self.alpha)
         self.image.fill(self.color)
     
+    # A imagem é pintada de novo logo depois (fade), então não precisa ampliar a antiga
     def shrink_rect(self):
         if not self.rect.height - 10 < 0:
-            self.image = pygame.transform.scale(self.image, (self.rect.width, self.rect.height-10))
+            self.image = pygame.Surface((self.rect.width, self.rect.height-10), pygame.SRCALPHA)
             self.rect = self.image.get_rect()
-            self.update_mask()
     
     def grow_rect(self):
         if not self.rect.height + 10 > self.max_rect_height:
-            self.image = pygame.transform.scale(self.image, (self.rect.width, self.rect.height+10))
+            self.image = pygame.Surface((self.rect.width, self.rect.height+10), pygame.SRCALPHA)
             self.rect = self.image.get_rect()
-            self.update_mask()
 
     def update(self):
         self.fading_counter += 1
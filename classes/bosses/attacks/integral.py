@@ -4,32 +4,46 @@ import os
 from config import *
 from config.combatmanager import CombatManager
 
+from classes.bosses.pool import Projectile
 
-class Integral(pygame.sprite.Sprite):
-    def __init__(self, dir, angle, *groups):
-        super().__init__(*groups)
+
+class Integral(Projectile):
+    lifetime = None  # Só some quando sai da tela
+
+    def __init__(self, pool=None):
+        super().__init__(pool)
 
         self.display: pygame.Surface = pygame.display.get_surface()
-        self.container = CombatManager.get_variable('battle_container')
+        self.speed = 5
 
-        self.image = pygame.image.load(os.path.join(GET_PROJECT_PATH(), 'sprites', 'effects', 'integral.png'))
-        self.image: pygame.Surface = pygame.transform.scale(
-            self.image,
-            (
-                self.image.get_height(),
-                self.container.inner_rect.width//2
-            )
-        )
-        self.image = pygame.transform.rotate(self.image, angle)
+    def spawn(self, dir, angle):
+        self.container = CombatManager.get_variable('battle_container')
 
+        self.image, self.mask = self.get_asset(('integral', angle, self.container.inner_rect.width), lambda: self.load_image(angle))
         self.rect = self.image.get_rect()
-        self.mask = pygame.mask.from_surface(self.image)
 
         self.dir = dir
-        self.speed = 5
 
         self.rect.y = self.display.get_height()//2 + self.display.get_height()//2*dir
         self.rect.centerx = self.container.inner_rect.centerx + self.rect.width//2*dir
 
-    def update(self, *args, **kwargs):
-        self.rect.y += self.speed*self.dir*-1
+        self.set_motion((0, self.speed*self.dir*-1))
+
+    def load_image(self, angle: float) -> pygame.Surface:
+        """Carrega a imagem da integral, do tamanho do container e rotacionada
+
+        Args:
+            angle (float): Ângulo da integral
+
+        Returns:
+            pygame.Surface: A imagem
+        """
+        image = pygame.image.load(os.path.join(GET_PROJECT_PATH(), 'sprites', 'effects', 'integral.png'))
+        image = pygame.transform.scale(
+            image,
+            (
+                image.get_height(),
+                self.container.inner_rect.width//2
+            )
+        )
+        return pygame.transform.rotate(image, angle)
@@ -81,20 +81,19 @@ class IntegralSword(pygame.sprite.Sprite):
 
         self.cuts_amount = 1
 
-        CombatManager.global_groups.append(self.slash_group)
         self.player = CombatManager.get_variable('player')
 
         self.moving = False
 
         self.cuts_list: list[Slash] = []
 
-        self.image = pygame.image.load(os.path.join(GET_PROJECT_PATH(), 'sprites', 'effects', 'integral.png'))
+        self.image = CombatManager.load_image(os.path.join(GET_PROJECT_PATH(), 'sprites', 'effects', 'integral.png'))
         self.image = pygame.transform.scale_by(self.image, self.scale)
         self.image = pygame.transform.rotate(self.image, self.initial_angle)
         self.rect = self.image.get_rect()
     
     def rotate_image_to(self, angle):
-        self.image = pygame.image.load(os.path.join(GET_PROJECT_PATH(), 'sprites', 'effects', 'integral.png'))
+        self.image = CombatManager.load_image(os.path.join(GET_PROJECT_PATH(), 'sprites', 'effects', 'integral.png'))
         self.image = pygame.transform.scale_by(self.image, self.scale)
         self.image = pygame.transform.rotate(self.image, angle)
         self.rect = self.image.get_rect(center=self.rect.center)
@@ -106,13 +105,6 @@ class IntegralSword(pygame.sprite.Sprite):
     def update(self):
         for slash in self.cuts_list:
             slash.update()
-            if slash.rect.colliderect(self.player.rect) and slash.animating:
-                if (
-                    (slash.type == 'movement' and self.player.direction.length() == 0)
-                    or
-                    (slash.type == 'stop' and self.player.direction.length() != 0)
-                ):
-                    self.player.take_damage(CombatManager.enemy.damage)
     
     def cut(self, type):
         if len(self.cuts_list) < 5:
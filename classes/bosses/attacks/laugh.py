@@ -5,21 +5,27 @@ from config import *
 from config.combatmanager import CombatManager
 from config.soundmanager import SoundManager
 
+from classes.bosses.pool import Projectile
 
-class Laugh(pygame.sprite.Sprite):
-    def __init__(self, enemy, *groups):
-        super().__init__(*groups)
 
+class Laugh(Projectile):
+    lifetime = None  # Só some quando sai da tela
+
+    def __init__(self, pool=None):
+        super().__init__(pool)
+
+        self.scale = 2
+        self.speed = 5
+
+    def spawn(self, enemy):
         self.player = CombatManager.get_variable('player')
         self.enemy = enemy
 
-        self.scale = 2
-        self.image = pygame.transform.scale_by(
+        self.image, self.mask = self.get_asset(('laugh', self.scale), lambda: pygame.transform.scale_by(
             pygame.image.load(os.path.join(GET_PROJECT_PATH(), 'sprites', 'effects', 'laugh.png')),
             self.scale
-        )
+        ))
         self.rect = self.image.get_rect()
-        self.mask = pygame.mask.from_surface(self.image)
 
         self.rect.center = self.enemy.rect.center
 
@@ -29,10 +35,6 @@ class Laugh(pygame.sprite.Sprite):
         )
         if self.direction.length() > 0:
             self.direction = self.direction.normalize()
-        self.speed = 5
+        self.set_motion(tuple(self.direction*self.speed))
 
         SoundManager.play_sound('branco_laugh.wav')
-
-    def update(self, *args, **kwargs):
-        self.rect.x += self.direction.x*self.speed
-        self.rect.y += self.direction.y*self.speed
@@ -1,7 +1,9 @@
 import pygame
 
 from config import *
-from config.combatmanager import CombatManager
+
+from classes.effects.compositor import Compositor
+from classes.bosses.hitbox import CircleHitbox
 
 
 class NodeExplosion:
@@ -12,8 +14,6 @@ class NodeExplosion:
 
         self.damage = damage
 
-        self.player = CombatManager.get_variable('player')
-
         self.radius = 0
         self.max_radius = 20
 
@@ -41,20 +41,21 @@ class NodeExplosion:
                 self.radius -= 2
             else:
                 self.state = 'dead'
-        
-            if self.player.rect.center == self.position:
-                self.player.take_damage(self.damage)
+
+    @property
+    def hitbox(self) -> CircleHitbox:
+        return CircleHitbox(self.position, self.radius)
     
     def draw(self, screen: pygame.Surface):
         if self.state == 'warning':
-            pygame.draw.circle(
+            Compositor.draw_circle(
                 screen,
                 self.warning_color,
                 self.position,
                 self.radius
             )
         if self.state == 'boom':
-            pygame.draw.circle(
+            Compositor.draw_circle(
                 screen,
                 self.boom_color,
                 self.position,
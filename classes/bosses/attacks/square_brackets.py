@@ -14,7 +14,7 @@ class SquareBracket(pygame.sprite.Sprite):
         self.dir = dir
         self.actual_alpha = 255
         self.image = pygame.transform.scale(
-            pygame.image.load(os.path.join(GET_PROJECT_PATH(), 'sprites', 'effects', 'square_brackets.png')),
+            CombatManager.load_image(os.path.join(GET_PROJECT_PATH(), 'sprites', 'effects', 'square_brackets.png')),
             (
                 100,
                 self.container.out_rect.height+60
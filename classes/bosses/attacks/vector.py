@@ -8,35 +8,49 @@ from config import *
 from config.combatmanager import CombatManager
 from config.soundmanager import SoundManager
 
+from classes.bosses.pool import Projectile
+
 from utils import angle_between_vectors
 
 
-class Vector(pygame.sprite.Sprite):
-    def __init__(self, *groups):
-        super().__init__(*groups)
+class Vector(Projectile):
+    lifetime = None  # Só some quando sai da tela
 
-        # Vou randomizar com 10% de chance de ser um vetor verde "Aplica o efeito de inversa"
-        self.type = 'Normal'
-        if random.randint(0, 100) <= 15:
-            self.type = 'Inverted'
+    def __init__(self, pool=None):
+        super().__init__(pool)
 
-        # Inicializo a imagem do vetor
-        self.actual_alpha = 255
-        self.image_path = os.path.join(GET_PROJECT_PATH(), 'sprites', 'effects', 'vector.png')
-        self.image = pygame.image.load(self.image_path)
+        self.fade_in_secs = FPS
+        self.rotation_duration = FPS*0.5
+        self.speed = 7
 
-        self.change_image_color()
+    @staticmethod
+    def plan(rng: random.Random) -> tuple:
+        """Sorteia os parâmetros de um disparo: tipo, posição e para onde ele é empurrado se surgir no container
+
+        Args:
+            rng (random.Random): Gerador da timeline do ataque
+
+        Returns:
+            tuple: Os parâmetros do spawn
+        """
+        display_rect = pygame.display.get_surface().get_rect()
+        return (
+            'Inverted' if rng.randint(0, 100) <= 15 else 'Normal',  # 15% de chance de ser um vetor verde "Aplica o efeito de inversa"
+            (rng.randint(30, display_rect.width-30), rng.randint(30, display_rect.height-30)),  # Dentro da tela
+            (rng.choice([1, -1]), rng.choice([1, -1]))
+        )
 
-        # self.image.set_alpha(self.actual_alpha)
-        self.mask = pygame.mask.from_surface(self.image)
-        self.max_rotation_angle = 0
-        self.rect = self.image.get_rect()
-        self.randomize_position()
+    def spawn(self, vector_type: str, position: tuple[int, int], push: tuple[int, int]):
+        self.type = vector_type
 
-        self.fade_in_secs = FPS
+        # Inicializo a imagem do vetor
+        self.image_path = os.path.join(GET_PROJECT_PATH(), 'sprites', 'effects', 'vector.png')
 
-        self.rotation_duration = FPS*0.5
         self.rotate_angle = 0
+        self.image, self.mask = self.load_image()
+        self.rect = self.image.get_rect()
+        self.place(position, push)
+
         self.rotating = True
         self.where_image_is_pointing = np.array([0, 1])
         self.player_rect = CombatManager.get_variable('player').rect.copy()
@@ -51,21 +65,21 @@ class Vector(pygame.sprite.Sprite):
 
         self.counter = 0
 
-        self.speed = 7
         SoundManager.play_sound('spearappear.wav')
 
-    def fade_image(self):
-        if self.counter <= 255:
-            self.image.set_alpha(self.counter*(255/FPS))
+    def load_image(self) -> tuple[pygame.Surface, pygame.mask.Mask]:
+        """Retorna a imagem do vetor (Já colorida pelo tipo) no ângulo atual e a sua máscara, compartilhadas entre todos os vetores
+
+        Returns:
+            tuple[pygame.Surface, pygame.mask.Mask]: A imagem e a máscara
+        """
+        image, _ = self.get_asset((self.image_path, self.type), lambda: self.change_image_color(pygame.image.load(self.image_path)))
+        return self.get_asset((self.image_path, self.type, self.rotate_angle), lambda: pygame.transform.rotate(image, self.rotate_angle))
 
     def rotate_image(self):
-        self.image = pygame.transform.rotate(  # Rotaciono a imagem
-            pygame.image.load(self.image_path),
-            self.rotate_angle
-        )
-        self.change_image_color()
-        self.mask = pygame.mask.from_surface(self.image)
+        self.image, self.mask = self.load_image()  # Pego a imagem já rotacionada
         self.rect = self.image.get_rect(center=self.rect.center)  # Centralizo o retangulo no anterior
+        self.sync()
 
         # Rotacionando o vetor que indica para onde a flecha está apontando
         converted_angle = (self.rotate_angle*math.pi)/180
@@ -92,31 +106,26 @@ class Vector(pygame.sprite.Sprite):
                 else:
                     self.stop_rotating()
     
-    def randomize_position(self):
+    def place(self, position: tuple[int, int], push: tuple[int, int]):
         battle_container = CombatManager.get_variable('battle_container')  # Pego o container
-        display_rect = pygame.display.get_surface().get_rect()  # Pego a superfície da tela
-        self.rect.x = random.randint(30, display_rect.width-30)  # Gero aleatoriamente dentro da tela
-        self.rect.y = random.randint(30, display_rect.height-30)
+        self.rect.topleft = position
 
         if self.rect.colliderect(battle_container.out_rect):  # Para sempre surgir fora do container
-            self.rect.x += battle_container.out_rect.width * random.choice([1, -1])
-            self.rect.y += battle_container.out_rect.height * random.choice([1, -1])
+            self.rect.x += battle_container.out_rect.width * push[0]
+            self.rect.y += battle_container.out_rect.height * push[1]
 
     def update(self, *args, **kwargs):
         self.counter += 1
 
-        if not self.rotating:
-            self.rect.x += self.vector_pointing_to_player[0]*self.speed
-            self.rect.y += self.vector_pointing_to_player[1]*self.speed
-        
+        # Depois de girar, quem move é a pool
         self.rotate()
-        # self.fade_image()
     
-    def change_image_color(self):
+    def change_image_color(self, image: pygame.Surface) -> pygame.Surface:
         if self.type == 'Inverted':
-            greenSurface = pygame.Surface(self.image.get_size())
+            greenSurface = pygame.Surface(image.get_size())
             greenSurface.fill((48, 255, 97))
-            self.image.blit(greenSurface, (0,0), special_flags=pygame.BLEND_MULT)
+            image.blit(greenSurface, (0,0), special_flags=pygame.BLEND_MULT)
+        return image
 
     def stop_rotating(self):
         self.rotating = False
@@ -125,4 +134,5 @@ class Vector(pygame.sprite.Sprite):
             self.player_rect.centery - self.rect.centery
         ])
         self.vector_pointing_to_player = self.vector_pointing_to_player / np.linalg.norm(self.vector_pointing_to_player)
+        self.set_motion(self.vector_pointing_to_player*self.speed)
         SoundManager.play_sound('arrow.wav')
@@ -8,14 +8,16 @@ from config.eventmanager import EventManager
 from config.combatmanager import CombatManager
 from config.soundmanager import SoundManager
 from config.fontmanager import FontManager
+from config.rendermanager import RenderManager
 
 from classes.bosses import Boss, Attack
 from classes.battle.heart import Heart
 from classes.bosses.hp import BossHP
+from classes.bosses.pool import ProjectilePool
 
 from classes.bosses.attacks.laugh import Laugh
 from classes.bosses.attacks.integral import Integral
-from classes.bosses.attacks.integral_sword import IntegralSword
+from classes.bosses.attacks.integral_sword import IntegralSword, Slash
 
 from classes.bosses.attacks.empty_attack import EmptyAttack
 
@@ -24,11 +26,16 @@ from classes.text.dialogue_box import DialogueBox
 from classes.effects.explosion import Explosion
 from classes.effects.eye_flash import EyeFlash
 
-from constants import PLAYER_TURN_EVENT, BOSS_TURN_EVENT, BOSS_ACT_EFFECT
+from constants import PLAYER_TURN_EVENT, BOSS_TURN_EVENT, BOSS_ACT_EFFECT, PROJECTILES_LAYER
 
 
 class Branco(Boss):
     name = 'Branco'
+    images = [  # Imagens lidas ao criar o boss
+        os.path.join(GET_PROJECT_PATH(), 'sprites', 'bosses', 'branco.png'),
+        DialogueBox.image_path,
+        os.path.join(GET_PROJECT_PATH(), 'sprites', 'effects', 'integral.png'),
+    ]
 
     def __init__(self, infos: dict, *groups):
         """Inicialização da classe Yuri
@@ -40,7 +47,7 @@ class Branco(Boss):
         super().__init__(*groups)
         
         # Carregando o sprite do Yuri
-        self.image = pygame.image.load(os.path.join(GET_PROJECT_PATH(), 'sprites', 'bosses', 'branco.png'))
+        self.image = CombatManager.load_image(os.path.join(GET_PROJECT_PATH(), 'sprites', 'bosses', 'branco.png'))
         self.rect = self.image.get_rect()
         self.__state = 'idle'
         self.__counter = 0
@@ -53,9 +60,7 @@ class Branco(Boss):
         self.laugh_animation_counter = 0
         self.laugh_rate = FPS
         self.laugh_group = pygame.sprite.Group()
-        self.laughs_list: list[Laugh] = []
-
-        CombatManager.global_groups.append(self.laugh_group)
+        self.laugh_pool = ProjectilePool(Laugh, self.laugh_group, int(FPS*10//self.laugh_rate) + 1)  # Uma risada por segundo nos ataques de 10 segundos
 
         self.player: Heart = CombatManager.get_variable('player')
 
@@ -95,12 +100,21 @@ class Branco(Boss):
         self.__death_explosions: list[Explosion] = []
         self.death_loops_counter = 255
     
+    def register(self):
+        """Registra as hitboxes e as camadas no CombatManager (Chamada no começo da luta)
+        """
+        CombatManager.register_hitbox(self, self.laugh_pool, lambda laughs: self.player.apply_effect('laugh'))
+        CombatManager.add_layer(self, self.integral_sword.slash_group, PROJECTILES_LAYER)
+        CombatManager.add_layer(self, self.laugh_group, PROJECTILES_LAYER)
+
+        super().register()
+
     def show_black(self):
         self.image = pygame.image.load(os.path.join(GET_PROJECT_PATH(), 'sprites', 'bosses', 'preto.png'))
         self.rect = self.image.get_rect(center=self.rect.center)
     
     def show_white(self):
-        self.image = pygame.image.load(os.path.join(GET_PROJECT_PATH(), 'sprites', 'bosses', 'branco.png'))
+        self.image = CombatManager.load_image(os.path.join(GET_PROJECT_PATH(), 'sprites', 'bosses', 'branco.png'))
         self.rect = self.image.get_rect(center=self.rect.center)
 
     def speak(self):
@@ -110,8 +124,7 @@ class Branco(Boss):
 
     def restart_attacks(self):
         super().restart_attacks()
-        self.laughs_list.clear()
-        self.laugh_group.empty()
+        self.laugh_pool.release_all()
     
     def death_animation(self):
         self.__death_animation_counter += 1
@@ -176,8 +189,7 @@ class Branco(Boss):
             if 0 <= self.attack_to_execute < len(self.__attacks) and not self.speaking:
                 if self.__attacks[self.attack_to_execute].duration_counter >= self.__attacks[self.attack_to_execute].duration:
                     self.attack_to_execute = -1
-                    self.laughs_list.clear()
-                    self.laugh_group.empty()
+                    self.laugh_pool.release_all()
                     self.laugh_animation_counter = 0
                     self.laughing = False
                     self.integral_sword.rotate_image_to(60)
@@ -216,15 +228,10 @@ class Branco(Boss):
         wave_factor = math.sin(10*counter_in_radians)
         self.rect.y += 1 * wave_factor
 
-        for laugh in self.laughs_list:
-            laugh.update()
-            offset = (laugh.rect.x - self.player.rect.x, laugh.rect.y - self.player.rect.y)
-
-            if self.player.mask.overlap(laugh.mask, offset):
-                self.player.apply_effect('laugh')
+        self.laugh_pool.step()
 
         if self.laugh_counter >= self.laugh_rate:
-            self.laughs_list.append(Laugh(self, self.laugh_group))
+            self.laugh_pool.acquire(self)
             self.laugh_counter = 0
     
     @property
@@ -310,41 +317,44 @@ class IntegralsAttack(Attack):
         self.damage = damage
 
         self.integral_group = pygame.sprite.Group()
-        self.integral_creation_counter = 0
         self.integral_creation_rate = FPS*0.8
-        self.integral_list: list[Integral] = []
-
-        CombatManager.global_groups.append(self.integral_group)
 
         self.__duration = FPS * 10  # O Ataque dura 10 segundos
         self.__duration_counter = 0
 
-    def run(self):
-        self.__duration_counter += 1
-        self.integral_creation_counter += 1
+        # Duas integrais por vez, todas já criadas aqui e reaproveitadas
+        self.integral_pool = ProjectilePool(Integral, self.integral_group, int(2*self.__duration//self.integral_creation_rate))
 
-        for integral in self.integral_list:
-            integral.update()
+    def register(self):
+        """Registra as hitboxes e as camadas no CombatManager (Chamada no começo da luta)
+        """
+        CombatManager.add_layer(self, self.integral_group, PROJECTILES_LAYER)
+        CombatManager.register_hitbox(self, self.integral_pool, self.on_integrals_hit)
 
-            offset = (integral.rect.x - self.__player.rect.x, integral.rect.y - self.__player.rect.y)
+    def schedule(self, timeline):
+        # Uma integral subindo e outra descendo
+        for frame in timeline.every(self.integral_creation_rate, self.__duration):
+            timeline.add(frame, self.integral_pool.acquire, 1, 90)
+            timeline.add(frame, self.integral_pool.acquire, -1, 90)
 
-            if self.__player.mask.overlap(integral.mask, offset):
-                self.__player.take_damage(self.damage)
+    def run(self):
+        self.__duration_counter += 1
 
-        if self.integral_creation_counter >= self.integral_creation_rate:
-            self.integral_creation_counter = 0
-            self.integral_list.append(Integral(1, 90, self.integral_group))
-            self.integral_list.append(Integral(-1, 90, self.integral_group))
+        self.integral_pool.step()
+        self.play_timeline(self.__duration_counter)
         
         if self.__duration_counter >= self.__duration:
-            self.integral_list.clear()
-            self.integral_group.empty()
+            self.integral_pool.release_all()
             pygame.event.post(pygame.event.Event(PLAYER_TURN_EVENT))
+
+    def on_integrals_hit(self, integrals: list[Integral]):
+        for integral in integrals:
+            self.__player.take_damage(self.damage)
     
     def restart(self):
-        self.integral_list.clear()
-        self.integral_group.empty()
+        self.integral_pool.release_all()
         self.__duration_counter = 0
+        self.compile_timeline()
     
     @property
     def player(self):
@@ -373,7 +383,7 @@ class IntegralSwordAttack(Attack):
         # Lista com os flashes dos olhos
         self.eye_flashes: list[EyeFlash] = []
 
-        self.display = pygame.display.get_surface()
+        self.display = RenderManager.display
 
         self.eye_flashes_amount = 5
 
@@ -392,7 +402,11 @@ class IntegralSwordAttack(Attack):
         self.cutting_transition_duration = FPS/2
         self.wich_cut = 0
 
-        CombatManager.global_groups.append(self.eye_flashes_group)
+    def register(self):
+        """Registra as hitboxes e as camadas no CombatManager (Chamada no começo da luta)
+        """
+        CombatManager.add_layer(self, self.eye_flashes_group, PROJECTILES_LAYER)
+        CombatManager.register_hitbox(self, self.integral_sword.slash_group, self.on_slashes_hit)
 
     def run(self):
         if self.__duration_counter == 0:
@@ -404,9 +418,10 @@ class IntegralSwordAttack(Attack):
         if self.showing_attacks:
             if self.eye_flashes_counter >= self.eye_flashes_rate and len(self.eye_flashes) < self.eye_flashes_amount:
                 self.eye_flashes_counter = 0
+                rng = (self.timeline or self.compile_timeline()).rng  # Direção e tipo saem da seed do ataque
                 self.eye_flashes.append(EyeFlash(
-                    random.choice([1, -1]),
-                    random.choice([
+                    rng.choice([1, -1]),
+                    rng.choice([
                         'stop',
                         'movement'
                     ]),
@@ -449,6 +464,16 @@ class IntegralSwordAttack(Attack):
         if self.__duration_counter >= self.__duration:
             pygame.event.post(pygame.event.Event(PLAYER_TURN_EVENT))
             self.boss.can_laugh = True
+
+    def on_slashes_hit(self, slashes: list[Slash]):
+        # Os cortes azuis acertam quem se move e os laranjas quem está parado
+        for slash in slashes:
+            if slash.animating and (
+                (slash.type == 'movement' and self.__player.direction.length() == 0)
+                or
+                (slash.type == 'stop' and self.__player.direction.length() != 0)
+            ):
+                self.__player.take_damage(self.damage)
     
     def restart(self):
         self.__duration_counter = 0
@@ -464,6 +489,7 @@ class IntegralSwordAttack(Attack):
         self.wich_cut = 0
         self.boss.can_laugh = True
         self.integral_sword.restart()
+        self.compile_timeline()
     
     @property
     def player(self):
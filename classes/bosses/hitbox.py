@@ -0,0 +1,104 @@
+import pygame
+import math
+from abc import ABC, abstractmethod
+
+from utils import distance_point_and_segment
+
+
+class Hitbox(ABC):
+    """Forma geométrica de um objeto que dá dano. A colisão com o coração é calculada direto pela
+    forma, sem precisar de uma máscara de pixels (Que teria que ser refeita toda vez que o objeto muda)
+    """
+    @abstractmethod
+    def collide_rect(self, rect: pygame.Rect) -> bool:
+        """Testa se a forma encosta em um retângulo
+
+        Args:
+            rect (pygame.Rect): O retângulo (Normalmente o do coração)
+
+        Returns:
+            bool: Se as duas formas se sobrepõem
+        """
+
+
+class RectHitbox(Hitbox):
+    """Retângulo alinhado com os eixos"""
+    def __init__(self, rect: pygame.Rect):
+        self.rect = pygame.Rect(rect)
+
+    def collide_rect(self, rect):
+        return self.rect.colliderect(rect)
+
+
+class OrientedRectHitbox(Hitbox):
+    """Retângulo girado em torno do próprio centro"""
+    def __init__(self, center: tuple[float, float], size: tuple[float, float], angle: float):
+        """Inicialização da classe
+
+        Args:
+            center (tuple[float, float]): Centro do retângulo
+            size (tuple[float, float]): Largura e altura antes de girar
+            angle (float): Ângulo em graus, no mesmo sentido do pygame.transform.rotate
+        """
+        self.center = center
+        self.size = size
+        self.angle = angle
+
+    def collide_rect(self, rect):
+        # Teorema do eixo separador: basta um dos 4 eixos (2 de cada retângulo) separar as projeções
+        angle = math.radians(self.angle)
+        ux, uy = math.cos(angle), -math.sin(angle)  # Eixo da largura
+        vx, vy = math.sin(angle), math.cos(angle)  # Eixo da altura
+        half_width, half_height = self.size[0]/2, self.size[1]/2
+        rect_half_width, rect_half_height = rect.width/2, rect.height/2
+        dx, dy = rect.centerx - self.center[0], rect.centery - self.center[1]
+
+        return (
+            abs(dx) < rect_half_width + half_width*abs(ux) + half_height*abs(vx)
+            and abs(dy) < rect_half_height + half_width*abs(uy) + half_height*abs(vy)
+            and abs(dx*ux + dy*uy) < half_width + rect_half_width*abs(ux) + rect_half_height*abs(uy)
+            and abs(dx*vx + dy*vy) < half_height + rect_half_width*abs(vx) + rect_half_height*abs(vy)
+        )
+
+
+class CircleHitbox(Hitbox):
+    """Círculo"""
+    def __init__(self, center: tuple[float, float], radius: float):
+        self.center = center
+        self.radius = radius
+
+    def collide_rect(self, rect):
+        if self.radius <= 0:
+            return False
+
+        # Ponto do retângulo mais perto do centro do círculo
+        x = max(rect.left, min(self.center[0], rect.right))
+        y = max(rect.top, min(self.center[1], rect.bottom))
+        return (x - self.center[0])**2 + (y - self.center[1])**2 < self.radius**2
+
+
+class SegmentHitbox(Hitbox):
+    """Segmento de reta com espessura (Um raio, uma aresta de grafo)"""
+    def __init__(self, start: tuple[float, float], end: tuple[float, float], thickness: float):
+        self.start = start
+        self.end = end
+        self.thickness = thickness
+
+    def collide_rect(self, rect):
+        if self.start == self.end:  # Sem comprimento, vira um círculo
+            return CircleHitbox(self.start, self.thickness/2).collide_rect(rect)
+
+        if rect.clipline(self.start, self.end):  # O segmento atravessa o retângulo
+            return True
+
+        # Se não atravessa, a menor distância é de uma ponta do segmento ou de um canto do retângulo
+        distances = [
+            distance_point_and_segment(*corner, *self.start, *self.end)
+            for corner in (rect.topleft, rect.topright, rect.bottomleft, rect.bottomright)
+        ]
+        for x, y in (self.start, self.end):
+            closest_x = max(rect.left, min(x, rect.right))
+            closest_y = max(rect.top, min(y, rect.bottom))
+            distances.append(math.hypot(x - closest_x, y - closest_y))
+
+        return min(distances) < self.thickness/2
@@ -10,10 +10,12 @@ from config.eventmanager import EventManager
 from config.combatmanager import CombatManager
 from config.soundmanager import SoundManager
 from config.fontmanager import FontManager
+from config.rendermanager import RenderManager
 
 from classes.bosses import Boss, Attack
 from classes.battle.heart import Heart
 from classes.bosses.hp import BossHP
+from classes.bosses.pool import ProjectilePool
 
 from classes.bosses.attacks.snake import Snake
 from classes.bosses.attacks.coffee import *
@@ -22,17 +24,22 @@ from classes.text.dialogue_box import DialogueBox
 
 from classes.effects.explosion import Explosion
 
-from constants import PLAYER_TURN_EVENT, BOSS_TURN_EVENT, BOSS_ACT_EFFECT
+from constants import PLAYER_TURN_EVENT, BOSS_TURN_EVENT, BOSS_ACT_EFFECT, PROJECTILES_LAYER, OVERLAY_LAYER
 
 '''DIVIDIR EM EVENTOS PARA FAZER A XÍCARA DE CAFÉ'''
 class Pinho(Boss):
     name = 'Rafael Pinho'
+    images = [  # Imagens lidas ao criar o boss
+        os.path.join(GET_PROJECT_PATH(), 'sprites', 'bosses', 'pinho.png'),
+        DialogueBox.image_path,
+        os.path.join(GET_PROJECT_PATH(), 'sprites', 'effects', 'drop_coffee.png'),
+    ]
 
     def __init__(self, infos:dict, *groups):
         super().__init__(*groups)
 
         # Carregando o sprite do Pinho
-        self.image = pygame.image.load(os.path.join(GET_PROJECT_PATH(), 'sprites', 'bosses', 'pinho.png'))
+        self.image = CombatManager.load_image(os.path.join(GET_PROJECT_PATH(), 'sprites', 'bosses', 'pinho.png'))
         self.rect = self.image.get_rect()
         self.__state = 'idle'
         self.__counter = 0
@@ -257,9 +264,13 @@ class CoffeeAttack(Attack):
 
         self.max_drops = 60
 
-        # Adicionando os grupos aos grupos globais
-        CombatManager.global_groups.append(self.cup_group)
-        CombatManager.global_groups.append(self.drops_group)
+        # As gotas são reaproveitadas entre um disparo e outro
+        self.drops_pool = ProjectilePool(CoffeeDrop, self.drops_group, self.max_drops)
+
+    def register(self):
+        """Registra as hitboxes e as camadas no CombatManager (Chamada no começo da luta)
+        """
+        CombatManager.register_hitbox(self, self.drops_pool, self.on_drops_hit)
 
     def create_cups(self):
 
@@ -282,34 +293,20 @@ class CoffeeAttack(Attack):
 
         # Atualiza os grupos
         self.cup_group.update()
-        self.drops_group.update()
+        self.drops_pool.step()
 
         self.new_rect.width = self.battle_container.inner_rect.width
         self.new_rect.left = self.battle_container.inner_rect.left
 
+        # Gotas que caem durante o ataque todo
+        self.play_timeline(self._duration_counter)
+
         for cup in self.cup_group:
 
             # Gera gotas regularmente enquanto as xícaras estão girando
             if cup.flipping and self._duration_counter % int(self.drops_creation_rate) == 0:
-                drop = CoffeeDrop(self.drops_group)
-
-            # Gera gotas regularmente para o resto do ataque
-            if self._duration_counter % int(self.drops_creation_rate) == 0 and random.random()<0.4:
-                drop = CoffeeDrop(self.drops_group)
-
-        # Verifica colisões com o jogador
-        collisions = pygame.sprite.spritecollide(
-            self._player, self.drops_group, dokill=True, collided=pygame.sprite.collide_mask
-        )
-        if collisions:
-            SoundManager.play_sound("arrow.wav")
-            self._player.take_damage(CombatManager.enemy.damage)
+                self.drops_pool.acquire(*CoffeeDrop.plan(self.timeline.rng))
 
-        # Atualizando o retângulo
-        self.new_rect.height += self.fill_speed * len(collisions)
-        if self.new_rect.height >= 250:
-            self.new_rect.height = 250
-        
         for drop in self.drops_group:
             if drop.rect.y >= self.battle_container.inner_rect.bottom:
                 # Incrementa a altura do retângulo de acordo com a quantidade de gotas
@@ -330,33 +327,44 @@ class CoffeeAttack(Attack):
                 
                 # Matando os sprites
                 drop.kill()
-
-        # Desenhando tudo
-        self.draw(pygame.display.get_surface())
         
         # Finaliza o ataque apenas quando o tempo terminar e as gotas desaparecerem
         if self._duration_counter >= self._duration:
             pygame.event.post(pygame.event.Event(PLAYER_TURN_EVENT))
             self.cup_group.empty()
-            self.drops_group.empty()
-            self.drops_group.empty()
-            CombatManager.global_draw_functions.remove(self.draw_puddle)
+            self.drops_pool.release_all()
+
+    # Cada xícara tem 40% de chance de soltar uma gota a cada disparo, até o fim do ataque
+    def schedule(self, timeline):
+        for frame in timeline.every(self.drops_creation_rate, self._duration):
+            for _ in range(3):  # Uma chance por xícara
+                if timeline.rng.random() < 0.4:
+                    timeline.add(frame, self.drops_pool.acquire, *CoffeeDrop.plan(timeline.rng))
+
+    # As gotas que encostam no jogador somem, dão dano e enchem a poça
+    def on_drops_hit(self, drops: list[CoffeeDrop]):
+        for drop in drops:
+            drop.kill()
+        SoundManager.play_sound("arrow.wav")
+        self._player.take_damage(CombatManager.enemy.damage)
+
+        self.new_rect.height += self.fill_speed * len(drops)
+        if self.new_rect.height >= 250:
+            self.new_rect.height = 250
 
     # Reinicia o ataque quando necessário   
     def restart(self):
         self._duration_counter = 0
+        self.compile_timeline()
         self.cups_created = False
         self.cup_group.empty()
-        self.drops_group.empty()
-        self.drops_group.empty()
-        CombatManager.global_groups.remove(self.cup_group)
-        CombatManager.global_groups.remove(self.drops_group)
-        self.cup_group = pygame.sprite.Group()
-        self.drops_group = pygame.sprite.Group()
-        CombatManager.global_groups.append(self.cup_group)
-        CombatManager.global_groups.append(self.drops_group)
+        self.drops_pool.release_all()
+
+        # As xícaras, as gotas e a poça só existem enquanto o ataque durar
+        CombatManager.add_layer(self, self.cup_group, PROJECTILES_LAYER, 'attack')
+        CombatManager.add_layer(self, self.drops_group, PROJECTILES_LAYER, 'attack')
+        CombatManager.add_layer(self, self.draw_puddle, OVERLAY_LAYER, 'attack')
         self.new_rect.height = 0  # Reinicia o preenchimento
-        CombatManager.global_draw_functions.append(self.draw_puddle)
         self.new_rect =  pygame.Rect(
                 self.battle_container.inner_rect.left,
                 self.battle_container.inner_rect.bottom,
@@ -365,13 +373,9 @@ class CoffeeAttack(Attack):
         )
 
     def draw_puddle(self, *args, **kwargs):
-        pygame.draw.rect(pygame.display.get_surface(), (133, 77, 67), self.new_rect)
+        pygame.draw.rect(RenderManager.display, (133, 77, 67), self.new_rect)
 
     # Desenha tudo na tela
-    def draw(self, surface):
-        self.cup_group.draw(surface)
-        self.drops_group.draw(surface)
-
     @property
     def player(self):
         return self._player
@@ -393,48 +397,53 @@ class PythonAtatack(Attack):
         # Criando o grupo 
         self.snakes_group = pygame.sprite.Group()
 
-        # Adicionando no grupo global
-        CombatManager.global_groups.append(self.snakes_group)
-
         # 3 cobras a cada segundo serão criadas
-        self.snakes: list[Snake] = []
         self.snakes_creation_rate = FPS/5 
 
         # O Ataque dura 10 segundos
         self.__duration = FPS * 10 
         self.__duration_counter = 0
 
+        # Todas as cobras do ataque já são criadas aqui e reaproveitadas
+        self.snakes_pool = ProjectilePool(Snake, self.snakes_group, int(self.__duration//self.snakes_creation_rate))
+
+    def register(self):
+        """Registra as hitboxes e as camadas no CombatManager (Chamada no começo da luta)
+        """
+        CombatManager.add_layer(self, self.snakes_group, PROJECTILES_LAYER)
+        CombatManager.register_hitbox(self, self.snakes_pool, self.on_snakes_hit)
+
+    # Marca as cobras do ataque, já com o tipo e a posição sorteados
+    def schedule(self, timeline):
+        for frame in timeline.every(self.snakes_creation_rate, self.__duration):
+            timeline.add(frame, self.snakes_pool.acquire, *Snake.plan(timeline.rng))
+
     def run(self):
         self.__duration_counter += 1
-
-        if self.__duration_counter % self.snakes_creation_rate == 0:
-            self.snakes.append(Snake(self.snakes_group))
+        self.play_timeline(self.__duration_counter)
         
         # Verifica o turno com base na duração do ataque
         if self.__duration_counter >= self.__duration:
             pygame.event.post(pygame.event.Event(PLAYER_TURN_EVENT))
-            self.snakes_group.empty()
-            self.snakes.clear()
-        
-        # Atualiza as cobras
-        for snake in self.snakes:
-            snake.update(player_center=self.player.rect.center)
+            self.snakes_pool.release_all()
         
-        # Verifica colisões e aplica o efeito
-        for snake in self.snakes_group:
-            if self.__player.rect.colliderect(snake.rect):
-                offset = (snake.rect.x - self.__player.rect.x, snake.rect.y - self.__player.rect.y)
-                if self.__player.mask.overlap(snake.mask, offset):
-                    self.__player.take_damage(CombatManager.enemy.damage)
-                    if snake.type == 'Vanished':
-                        self.__player.apply_effect('vanished')
-                    snake.kill()
+        # Atualiza as cobras (Todas se movem de uma vez, depois as que ainda estão girando)
+        self.snakes_pool.step()
+        self.snakes_group.update(player_center=self.player.rect.center)
+
+    # Aplica o dano e o efeito das cobras que encostaram no jogador
+    def on_snakes_hit(self, snakes: list[Snake]):
+        for snake in snakes:
+            self.__player.take_damage(CombatManager.enemy.damage)
+            if snake.type == 'Vanished':
+                self.__player.apply_effect('vanished')
+            snake.kill()
         
     # Reinicia o aqtaque quando necessário
     def restart(self):
         self.__duration_counter = 0
-        self.snakes_group.empty()
-        self.snakes.clear()
+        self.snakes_pool.release_all()
+        self.compile_timeline()
 
     @property
     def player(self):
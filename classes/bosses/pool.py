@@ -0,0 +1,242 @@
+import pygame
+import numpy as np
+from typing import Callable
+
+from config import FPS
+
+
+class Projectile(pygame.sprite.Sprite):
+    """Base dos projéteis dos ataques. Eles são criados uma vez só pela ProjectilePool e reaproveitados,
+    então tudo que muda de um disparo para o outro deve ser colocado no método spawn.
+    O movimento não fica no update de cada projétil, ele é feito de uma vez para todos pela pool (set_motion)
+    """
+    # Imagens (E suas máscaras) compartilhadas entre todos os projéteis, carregadas uma vez só
+    assets: dict[tuple, tuple[pygame.Surface, pygame.mask.Mask]] = {}
+
+    lifetime: int = FPS*5  # Frames até o projétil sumir sozinho (None para durar até sair da tela)
+
+    def __init__(self, pool: 'ProjectilePool' = None):
+        super().__init__()
+        self.pool = pool
+        self.active = False  # Se ele está na tela ou guardado na pool
+        self.index = pool.add_slot(self) if pool is not None else None  # Posição do projétil nos arrays da pool
+
+    @classmethod
+    def get_asset(cls, key: tuple, build: Callable[[], pygame.Surface]) -> tuple[pygame.Surface, pygame.mask.Mask]:
+        """Retorna uma imagem compartilhada e a sua máscara, criando as duas apenas na primeira vez
+
+        Args:
+            key (tuple): Identificador único da imagem
+            build (Callable[[], pygame.Surface]): Função que cria a imagem
+
+        Returns:
+            tuple[pygame.Surface, pygame.mask.Mask]: A imagem e a máscara dela
+        """
+        if key not in cls.assets:
+            image = build()
+            cls.assets[key] = (image, pygame.mask.from_surface(image))
+        return cls.assets[key]
+
+    def spawn(self, *args, **kwargs):
+        """Coloca o projétil no estado inicial de um novo disparo
+        """
+
+    def set_motion(
+        self,
+        velocity: tuple[float, float],
+        acceleration: tuple[float, float] = (0, 0),
+        max_velocity: tuple[float, float] = (np.inf, np.inf)
+    ):
+        """Faz o projétil começar a se mover, junto com todos os outros da pool
+
+        Args:
+            velocity (tuple[float, float]): Quanto ele anda por frame
+            acceleration (tuple[float, float], optional): Quanto a velocidade muda por frame. Defaults to (0, 0).
+            max_velocity (tuple[float, float], optional): Velocidade máxima em cada eixo. Defaults to sem limite.
+        """
+        self.pool.velocity[self.index] = velocity
+        self.pool.acceleration[self.index] = acceleration
+        self.pool.max_velocity[self.index] = max_velocity
+        self.pool.moving[self.index] = True
+        self.sync()
+
+    def sync(self):
+        """Copia a posição e o tamanho do rect para os arrays da pool (Depois de trocar a imagem, por exemplo)
+        """
+        self.pool.position[self.index] = self.rect.topleft
+        self.pool.size[self.index] = self.rect.size
+
+    def kill(self):
+        """Tira o projétil de todos os grupos e devolve ele para a pool
+        """
+        super().kill()
+        if self.pool is not None and self.active:
+            self.active = False
+            self.pool.alive[self.index] = False
+            self.pool.moving[self.index] = False
+            self.pool.free.append(self)
+
+
+class ProjectilePool:
+    """Guarda os projéteis de um ataque para serem reaproveitados, assim o ataque não cria sprites novos a cada disparo.
+    A posição, velocidade e aceleração de todos eles ficam em arrays, então eles se movem e colidem todos de uma vez
+    """
+    margin = 100  # Quanto a área fora da tela ainda conta como tela
+
+    def __init__(self, projectile_class: type[Projectile], group: pygame.sprite.Group, size: int = 0, bounds: pygame.Rect = None):
+        """Inicialização da classe
+
+        Args:
+            projectile_class (type[Projectile]): Classe dos projéteis
+            group (pygame.sprite.Group): Grupo onde os projéteis ativos ficam
+            size (int, optional): Quantos projéteis já são criados de início. Defaults to 0.
+            bounds (pygame.Rect, optional): Área onde os projéteis continuam vivos. Defaults to a tela com uma margem.
+        """
+        self.projectile_class = projectile_class
+        self.group = group
+
+        # Projéteis que saem dessa área (E continuam se afastando) são destruídos
+        if bounds is None and pygame.display.get_surface():
+            bounds = pygame.display.get_surface().get_rect().inflate(self.margin*2, self.margin*2)
+        self.bounds = bounds
+
+        self.projectiles: list[Projectile] = []  # Todos os projéteis já criados, o índice de cada um é o seu id
+        self.position = np.zeros((0, 2))  # Canto superior esquerdo de cada projétil
+        self.velocity = np.zeros((0, 2))
+        self.acceleration = np.zeros((0, 2))
+        self.max_velocity = np.zeros((0, 2))
+        self.size = np.zeros((0, 2))
+        self.age = np.zeros(0)  # Há quantos frames o projétil foi disparado
+        self.lifetime = np.zeros(0)  # Com quantos frames ele some
+        self.alive = np.zeros(0, dtype=bool)  # Se o projétil está na tela
+        self.moving = np.zeros(0, dtype=bool)  # Se o projétil já começou a se mover
+
+        self.free: list[Projectile] = [projectile_class(self) for _ in range(size)]
+
+    def add_slot(self, projectile: Projectile) -> int:
+        """Reserva uma posição nos arrays para um projétil novo
+
+        Args:
+            projectile (Projectile): O projétil
+
+        Returns:
+            int: Índice do projétil nos arrays
+        """
+        index = len(self.projectiles)
+        self.projectiles.append(projectile)
+
+        if index >= len(self.alive):  # Dobro o tamanho dos arrays quando eles enchem
+            capacity = max(16, len(self.alive)*2)
+            for name in ('position', 'velocity', 'acceleration', 'max_velocity', 'size'):
+                array = np.zeros((capacity, 2))
+                array[:index] = getattr(self, name)[:index]
+                setattr(self, name, array)
+            for name in ('age', 'lifetime'):
+                array = np.zeros(capacity)
+                array[:index] = getattr(self, name)[:index]
+                setattr(self, name, array)
+            for name in ('alive', 'moving'):
+                array = np.zeros(capacity, dtype=bool)
+                array[:index] = getattr(self, name)[:index]
+                setattr(self, name, array)
+
+        return index
+
+    def acquire(self, *args, **kwargs) -> Projectile:
+        """Pega um projétil livre (Ou cria um se não tiver nenhum) e dispara ele
+
+        Returns:
+            Projectile: O projétil, já no grupo de ativos
+        """
+        projectile = self.free.pop() if self.free else self.projectile_class(self)
+        projectile.active = True
+        self.alive[projectile.index] = True
+        self.moving[projectile.index] = False
+        self.age[projectile.index] = 0
+        self.lifetime[projectile.index] = projectile.lifetime or np.inf
+        projectile.spawn(*args, **kwargs)
+        projectile.sync()
+        self.group.add(projectile)
+        return projectile
+
+    def step(self):
+        """Move todos os projéteis ativos de uma vez (Posição, depois velocidade) e destrói os que
+        saíram da tela ou passaram do tempo de vida
+        """
+        self.age[self.alive] += 1
+
+        indexes = np.flatnonzero(self.alive & self.moving)
+        if len(indexes):
+            self.move(indexes)
+
+        self.cull()
+
+    def move(self, indexes: np.ndarray):
+        """Move os projéteis pedidos
+
+        Args:
+            indexes (np.ndarray): Índices dos projéteis
+        """
+
+        # As posições são arredondadas a cada frame, igual o pygame faz ao somar um float em um Rect
+        self.position[indexes] = np.floor(self.position[indexes] + self.velocity[indexes] + 0.5)
+        self.velocity[indexes] = np.minimum(self.velocity[indexes] + self.acceleration[indexes], self.max_velocity[indexes])
+
+        projectiles = self.projectiles
+        for index, topleft in zip(indexes.tolist(), self.position[indexes].astype(int).tolist()):
+            projectiles[index].rect.topleft = topleft
+
+    def cull(self):
+        """Destrói os projéteis que passaram do tempo de vida ou saíram da tela se afastando dela
+        """
+        count = len(self.projectiles)
+        dead = self.alive[:count] & (self.age[:count] >= self.lifetime[:count])
+
+        if self.bounds:
+            position, size, velocity = self.position[:count], self.size[:count], self.velocity[:count]
+            moving = self.alive[:count] & self.moving[:count]
+            dead |= moving & (
+                ((position[:, 0] + size[:, 0] < self.bounds.left) & (velocity[:, 0] <= 0))
+                | ((position[:, 0] > self.bounds.right) & (velocity[:, 0] >= 0))
+                | ((position[:, 1] + size[:, 1] < self.bounds.top) & (velocity[:, 1] <= 0))
+                | ((position[:, 1] > self.bounds.bottom) & (velocity[:, 1] >= 0))
+            )
+
+        for index in np.flatnonzero(dead).tolist():
+            self.projectiles[index].kill()
+
+    def collide(self, rect: pygame.Rect, mask: pygame.mask.Mask) -> list[Projectile]:
+        """Testa todos os projéteis ativos contra um objeto (O coração do player)
+
+        Args:
+            rect (pygame.Rect): Retângulo do objeto
+            mask (pygame.mask.Mask): Máscara do objeto
+
+        Returns:
+            list[Projectile]: Projéteis que encostaram no objeto
+        """
+        count = len(self.projectiles)
+        position, size = self.position[:count], self.size[:count]
+
+        # Primeiro os retângulos, todos de uma vez, e só os que se sobrepõem testam a máscara
+        candidates = np.flatnonzero(
+            self.alive[:count]
+            & (position[:, 0] < rect.right) & (position[:, 0] + size[:, 0] > rect.left)
+            & (position[:, 1] < rect.bottom) & (position[:, 1] + size[:, 1] > rect.top)
+        )
+
+        collided = []
+        for index in candidates.tolist():
+            projectile = self.projectiles[index]
+            if mask.overlap(projectile.mask, (projectile.rect.x - rect.x, projectile.rect.y - rect.y)):
+                collided.append(projectile)
+        return collided
+
+    def release_all(self):
+        """Devolve todos os projéteis ativos para a pool
+        """
+        for projectile in self.group.sprites():
+            projectile.kill()
+
+    def __len__(self):
+        return len(self.group)
@@ -3,12 +3,14 @@ import os
 import random
 import math
 import networkx as nx
+import numpy as np
 
 from config import *
 from config.eventmanager import EventManager
 from config.combatmanager import CombatManager
 from config.soundmanager import SoundManager
 from config.fontmanager import FontManager
+from config.rendermanager import RenderManager
 
 from classes.bosses import Boss, Attack
 from classes.battle.heart import Heart
@@ -23,13 +25,17 @@ from classes.text.dialogue_box import DialogueBox
 
 from classes.effects.explosion import Explosion
 
-from constants import PLAYER_TURN_EVENT, BOSS_TURN_EVENT, BOSS_ACT_EFFECT
+from constants import PLAYER_TURN_EVENT, BOSS_TURN_EVENT, BOSS_ACT_EFFECT, OVERLAY_LAYER
 
-from utils import degrees_to_radians
+from utils import degrees_to_radians, distance_point_and_segments
 
 
 class Soledad(Boss):
     name = 'Soledad'
+    images = [  # Imagens lidas ao criar o boss
+        os.path.join(GET_PROJECT_PATH(), 'sprites', 'bosses', 'soledad.png'),
+        DialogueBox.image_path,
+    ]
 
     def __init__(self, infos: dict, *groups):
         """Inicialização da classe Yuri
@@ -42,7 +48,7 @@ class Soledad(Boss):
         
         # Carregando o sprite do Yuri
         self.image = pygame.transform.scale_by(
-            pygame.image.load(os.path.join(GET_PROJECT_PATH(), 'sprites', 'bosses', 'soledad.png')),
+            CombatManager.load_image(os.path.join(GET_PROJECT_PATH(), 'sprites', 'bosses', 'soledad.png')),
             0.5
         )
         self.rect = self.image.get_rect()
@@ -238,9 +244,8 @@ class GraphClosingAttack(Attack):
         self.__player: Heart = CombatManager.get_variable('player')
         self.damage = damage
 
-        self.display = pygame.display.get_surface()
+        self.display = RenderManager.display
 
-        self.graph_creation_counter = 0
         self.graph_creation_rate = FPS*1.5
 
         self.graphs_list: list[ClosingGraph] = []
@@ -248,11 +253,18 @@ class GraphClosingAttack(Attack):
         self.__duration = FPS * 10  # O Ataque dura 10 segundos
         self.__duration_counter = 0
 
-        CombatManager.global_draw_functions.append(self.draw_graphs)
+    def register(self):
+        """Registra as hitboxes e as camadas no CombatManager (Chamada no começo da luta)
+        """
+        CombatManager.add_layer(self, self.draw_graphs, OVERLAY_LAYER)
+        CombatManager.register_hitbox(self, self, self.on_edges_hit)
     
-    def create_graph(self):
-        graph = ClosingGraph()
-        return graph
+    def create_graph(self, *args):
+        self.graphs_list.append(ClosingGraph(*args))
+
+    def schedule(self, timeline):
+        for frame in timeline.every(self.graph_creation_rate, self.__duration):
+            timeline.add(frame, self.create_graph, *ClosingGraph.plan(timeline.rng))
 
     def draw_graphs(self, *args, **kwargs):
         for graph in self.graphs_list:
@@ -260,7 +272,6 @@ class GraphClosingAttack(Attack):
 
     def run(self):
         self.__duration_counter += 1
-        self.graph_creation_counter += 1
 
         for i, graph in enumerate(self.graphs_list):
             if graph.dead:
@@ -268,17 +279,30 @@ class GraphClosingAttack(Attack):
             else:
                 graph.update()
 
-        if self.graph_creation_counter >= self.graph_creation_rate:
-            self.graphs_list.append(self.create_graph())
-            self.graph_creation_counter = 0
+        self.play_timeline(self.__duration_counter)
         
         if self.__duration_counter >= self.__duration:
             self.graphs_list.clear()
             pygame.event.post(pygame.event.Event(PLAYER_TURN_EVENT))
+
+    def collide(self, rect: pygame.Rect, mask: pygame.mask.Mask) -> list[int]:
+        """Retorna as arestas de todos os grafos que passam a menos de 10 pixels do centro do coração
+        (Todas as distâncias são calculadas de uma vez)"""
+        if not self.graphs_list:
+            return []
+
+        starts = np.concatenate([graph.edges[0] for graph in self.graphs_list])
+        ends = np.concatenate([graph.edges[1] for graph in self.graphs_list])
+        return np.flatnonzero(distance_point_and_segments(*rect.center, starts, ends) <= 10).tolist()
+
+    def on_edges_hit(self, edges: list[int]):
+        for edge in edges:
+            self.__player.take_damage(5)
     
     def restart(self):
         self.__duration_counter = 0
         self.graphs_list.clear()
+        self.compile_timeline()
     
     @property
     def player(self):
@@ -298,12 +322,9 @@ class AttachedToGraph(Attack):
         self.__player: Heart = CombatManager.get_variable('player')
         self.damage = damage
 
-        self.display = pygame.display.get_surface()
+        self.display = RenderManager.display
         self.container = CombatManager.get_variable('battle_container')
 
-        self.helper_surface = pygame.Surface(pygame.display.get_surface().get_size(), pygame.SRCALPHA)
-
-        self.explosion_creation_counter = 0
         self.explosion_creation_rate = FPS/2
 
         self.player_graph = self.__player.graph
@@ -313,38 +334,33 @@ class AttachedToGraph(Attack):
         self.__duration = FPS * 10  # O Ataque dura 10 segundos
         self.__duration_counter = 0
 
-        CombatManager.global_draw_functions.append(self.draw)
+    def register(self):
+        """Registra as hitboxes e as camadas no CombatManager (Chamada no começo da luta)
+        """
+        CombatManager.register_hitbox(self, self.explosions, self.on_explosions_hit)
+        CombatManager.add_layer(self, self.draw, OVERLAY_LAYER)
     
     def draw(self, *args, **kwargs):
-        self.display.blit(self.helper_surface, self.helper_surface.get_rect())
-        self.helper_surface.fill((0,0,0,0))
-
         for node_explosion in self.explosions:
-            node_explosion.draw(self.helper_surface)
+            node_explosion.draw(self.display)
+
+    def create_explosion(self, node: str):
+        self.explosions.append(NodeExplosion(
+            self.player_graph[node]['pos'],
+            self.damage
+        ))
+
+    # Duas explosões por vez, em nós sorteados do grafo
+    def schedule(self, timeline):
+        for frame in timeline.every(self.explosion_creation_rate, self.__duration):
+            timeline.add(frame, self.create_explosion, timeline.rng.choice(['A','B','C','D','E','F','G','H','I']))
+            timeline.add(frame, self.create_explosion, timeline.rng.choice(['A','B','C','D','E','F','G','H','I']))
 
     def run(self):
         if self.__duration_counter == 0:
             self.__player.apply_effect('prisioned')
 
-        self.explosion_creation_counter += 1
-
-        if self.explosion_creation_counter >= self.explosion_creation_rate:
-            self.explosion_creation_counter = 0
-            random_node = random.choice([
-                'A','B','C','D','E','F','G','H','I'
-            ])
-            self.explosions.append(NodeExplosion(
-                self.player_graph[random_node]['pos'],
-                self.damage
-            ))
-
-            random_node = random.choice([
-                'A','B','C','D','E','F','G','H','I'
-            ])
-            self.explosions.append(NodeExplosion(
-                self.player_graph[random_node]['pos'],
-                self.damage
-            ))
+        self.play_timeline(self.__duration_counter + 1)
         
         for node_explosion in self.explosions:
             node_explosion.update()
@@ -354,10 +370,16 @@ class AttachedToGraph(Attack):
         if self.__duration_counter >= self.__duration:
             self.explosions.clear()
             pygame.event.post(pygame.event.Event(PLAYER_TURN_EVENT))
+
+    def on_explosions_hit(self, explosions: list[NodeExplosion]):
+        for node_explosion in explosions:
+            if node_explosion.state == 'boom':  # O aviso não dá dano
+                self.__player.take_damage(self.damage)
     
     def restart(self):
         self.__duration_counter = 0
         self.explosions.clear()
+        self.compile_timeline()
     
     @property
     def player(self):
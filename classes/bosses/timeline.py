@@ -0,0 +1,51 @@
+import random
+from typing import Callable
+
+
+class Timeline:
+    """Roteiro de um ataque: em qual frame cada coisa acontece e com quais parâmetros, tudo sorteado
+    de uma vez com uma seed antes do ataque começar. Com a mesma seed o ataque é sempre igual
+    """
+    def __init__(self, seed: int = None):
+        """Inicialização da classe
+
+        Args:
+            seed (int, optional): Seed dos sorteios. Defaults to uma seed aleatória.
+        """
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.rng = random.Random(self.seed)  # Todos os sorteios do ataque saem daqui
+        self.events: dict[int, list[tuple[Callable, tuple]]] = {}
+
+    def add(self, frame: int, action: Callable, *args):
+        """Marca uma ação para acontecer em um frame
+
+        Args:
+            frame (int): Frame do ataque (O primeiro é o 1)
+            action (Callable): O que vai ser chamado
+            *args: Parâmetros da ação, já sorteados
+        """
+        self.events.setdefault(int(frame), []).append((action, args))
+
+    def every(self, rate: int, duration: int) -> range:
+        """Frames em que algo que acontece a cada rate frames aparece durante o ataque
+
+        Args:
+            rate (int): De quantos em quantos frames
+            duration (int): Duração do ataque
+
+        Returns:
+            range: Os frames (rate, 2*rate, ... até duration)
+        """
+        return range(int(rate), int(duration) + 1, int(rate))
+
+    def play(self, frame: int):
+        """Executa as ações do frame
+
+        Args:
+            frame (int): Frame atual do ataque
+        """
+        for action, args in self.events.get(frame, ()):
+            action(*args)
+
+    def __len__(self):
+        return sum(len(actions) for actions in self.events.values())
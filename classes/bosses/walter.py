@@ -9,6 +9,7 @@ from config.eventmanager import EventManager
 from config.combatmanager import CombatManager
 from config.soundmanager import SoundManager
 from config.fontmanager import FontManager
+from config.rendermanager import RenderManager
 
 from classes.bosses import Boss, Attack
 from classes.battle.heart import Heart
@@ -18,13 +19,18 @@ from classes.text.dialogue_box import DialogueBox
 
 from classes.effects.explosion import Explosion
 from classes.bosses.attacks.dices import Dice
+from classes.bosses.pool import ProjectilePool
 from classes.bosses.attacks.histogram import Histogram
 
-from constants import PLAYER_TURN_EVENT, BOSS_TURN_EVENT, BOSS_ACT_EFFECT
+from constants import PLAYER_TURN_EVENT, BOSS_TURN_EVENT, BOSS_ACT_EFFECT, PROJECTILES_LAYER, OVERLAY_LAYER
 
 
 class Walter(Boss):
     name = 'Walter Sande'
+    images = [  # Imagens lidas ao criar o boss
+        os.path.join(GET_PROJECT_PATH(), 'sprites', 'bosses', 'walter.png'),
+        DialogueBox.image_path,
+    ]
 
     def __init__(self, infos: dict, *groups):
         """Inicialização da classe Yuri
@@ -37,7 +43,7 @@ class Walter(Boss):
         
         # Carregando o sprite do Yuri
         self.image = pygame.transform.scale_by(
-            pygame.image.load(os.path.join(GET_PROJECT_PATH(), 'sprites', 'bosses', 'walter.png')),
+            CombatManager.load_image(os.path.join(GET_PROJECT_PATH(), 'sprites', 'bosses', 'walter.png')),
             1
         )
         self.rect = self.image.get_rect()
@@ -238,7 +244,7 @@ class HistogramAttack(Attack):
         self.__player: Heart = CombatManager.get_variable('player')
         self.damage = damage
 
-        self.display = pygame.display.get_surface()
+        self.display = RenderManager.display
 
         self.__duration = FPS * 10  # O ataque dura 10 segundos
         self.__duration_counter = 0
@@ -247,6 +253,12 @@ class HistogramAttack(Attack):
         self.histogram = Histogram()  # Instância da classe Histogram
         self.histogram.randomize_bars()  # Inicializa as barras aleatoriamente
 
+    def register(self):
+        """Registra as hitboxes e as camadas no CombatManager (Chamada no começo da luta)
+        """
+        CombatManager.register_hitbox(self, self.histogram, self.on_bars_hit)
+        CombatManager.add_layer(self, self.histogram.draw_bars, OVERLAY_LAYER)
+
     def run(self):
         """Executa o ataque com duração controlada e animação de histograma."""
         if self.__duration_counter == 0:
@@ -256,17 +268,17 @@ class HistogramAttack(Attack):
         # Atualizar o histograma
         self.histogram.update()
 
-        # Verificar colisões entre o jogador e as barras
-        for rect in self.histogram.rects:
-            if self.__player.rect.colliderect(rect):  # Colisão com a barra
-                SoundManager.play_sound("arrow.wav")
-                self.__player.take_damage(self.damage)  # Aplicar dano ao jogador
-
         # Verificar se o tempo do ataque acabou
         if self.__duration_counter >= self.__duration:
             self.histogram.on_attack = False
             pygame.event.post(pygame.event.Event(PLAYER_TURN_EVENT))  # Evento para mudar o turno do jogador
 
+    def on_bars_hit(self, bars: list[pygame.Rect]):
+        """Aplica o dano das barras que encostaram no jogador"""
+        for bar in bars:
+            SoundManager.play_sound("arrow.wav")
+            self.__player.take_damage(self.damage)
+
     def restart(self):
         """Reinicia o ataque, resetando o contador de duração."""
         self.__duration_counter = 0
@@ -291,51 +303,55 @@ class DicesAttack(Attack):
         self.__player: Heart = CombatManager.get_variable('player')
         self.damage = damage
 
-        self.display = pygame.display.get_surface()
+        self.display = RenderManager.display
         self.container = CombatManager.get_variable('battle_container')
 
-        self.dice_creation_counter = 0
         self.dice_creation_rate = FPS
 
         self.player_graph = self.__player.graph
 
         self.dices_group = pygame.sprite.Group()
 
-        self.dices: list = []
-
         self.__duration = FPS * 10  # O Ataque dura 10 segundos
         self.__duration_counter = 0
 
-        CombatManager.global_groups.append(self.dices_group)
+        # Dois dados por vez, todos já criados aqui e reaproveitados
+        self.dices_pool = ProjectilePool(Dice, self.dices_group, int(2*self.__duration//self.dice_creation_rate))
 
-    def run(self):
-        if self.dice_creation_counter == 0:
-            self.player.apply_effect('confused')
-        self.dice_creation_counter += 1
+    def register(self):
+        """Registra as hitboxes e as camadas no CombatManager (Chamada no começo da luta)
+        """
+        CombatManager.register_hitbox(self, self.dices_pool, self.on_dices_hit)
 
-        if self.dice_creation_counter >= self.dice_creation_rate:
-            self.dice_creation_counter = 0
-            self.dices.append(Dice(self.dices_group))
-            self.dices.append(Dice(self.dices_group))
+        CombatManager.add_layer(self, self.dices_group, PROJECTILES_LAYER)
 
-        
-        for dice in self.dices:
-            dice.update()
+    def schedule(self, timeline):
+        # A cada leva de dois dados a confusão é renovada
+        for frame in timeline.every(self.dice_creation_rate, self.__duration):
+            timeline.add(frame - self.dice_creation_rate + 1, self.player.apply_effect, 'confused')
+            timeline.add(frame, self.dices_pool.acquire, *Dice.plan(timeline.rng))
+            timeline.add(frame, self.dices_pool.acquire, *Dice.plan(timeline.rng))
 
+    def run(self):
         self.__duration_counter += 1
+        self.play_timeline(self.__duration_counter)
+
+        self.dices_pool.step()
+        self.dices_group.update()  # Só a animação
 
-        if pygame.sprite.spritecollide(self.player, self.dices_group, True, pygame.sprite.collide_mask):
-            self.player.take_damage(self.damage)
-        
         if self.__duration_counter >= self.__duration:
-            self.dices.clear()
-            self.dices_group.empty()
+            self.dices_pool.release_all()
             pygame.event.post(pygame.event.Event(PLAYER_TURN_EVENT))
+
+    def on_dices_hit(self, dices: list[Dice]):
+        for dice in dices:
+            dice.kill()
+        self.player.take_damage(self.damage)
     
     def restart(self):
         self.__duration_counter = 0
-        self.dices.clear()
-        self.dices_group.empty()
+        self.dices_pool.release_all()
+        self.compile_timeline()
     
     @property
     def player(self):
@@ -8,10 +8,12 @@ from config.eventmanager import EventManager
 from config.combatmanager import CombatManager
 from config.soundmanager import SoundManager
 from config.fontmanager import FontManager
+from config.rendermanager import RenderManager
 
 from classes.bosses import Boss, Attack
 from classes.battle.heart import Heart
 from classes.bosses.hp import BossHP
+from classes.bosses.pool import ProjectilePool
 
 from classes.bosses.attacks.vector import Vector
 from classes.bosses.attacks.square_brackets import SquareBracket
@@ -22,11 +24,16 @@ from classes.text.dialogue_box import DialogueBox
 
 from classes.effects.explosion import Explosion
 
-from constants import PLAYER_TURN_EVENT, BOSS_TURN_EVENT, BOSS_ACT_EFFECT
+from constants import PLAYER_TURN_EVENT, BOSS_TURN_EVENT, BOSS_ACT_EFFECT, PROJECTILES_LAYER
 
 
 class Yuri(Boss):
     name = 'Yuri Saporito'
+    images = [  # Imagens lidas ao criar o boss
+        os.path.join(GET_PROJECT_PATH(), 'sprites', 'bosses', 'yuri.png'),
+        DialogueBox.image_path,
+        os.path.join(GET_PROJECT_PATH(), 'sprites', 'effects', 'square_brackets.png'),
+    ]
 
     def __init__(self, infos: dict, *groups):
         """Inicialização da classe Yuri
@@ -38,7 +45,7 @@ class Yuri(Boss):
         super().__init__(*groups)
         
         # Carregando o sprite do Yuri
-        self.image = pygame.image.load(os.path.join(GET_PROJECT_PATH(), 'sprites', 'bosses', 'yuri.png'))
+        self.image = CombatManager.load_image(os.path.join(GET_PROJECT_PATH(), 'sprites', 'bosses', 'yuri.png'))
         self.rect = self.image.get_rect()
         self.__state = 'idle'
         self.__counter = 0
@@ -234,42 +241,47 @@ class VectorAttack(Attack):
 
         self.vectors_group = pygame.sprite.Group()
 
-        CombatManager.global_groups.append(self.vectors_group)
-
-        self.vectors: list[Vector] = []
         self.vectors_creation_rate = FPS/5  # 3 Vetores a cada segundo serão criados
 
         self.__duration = FPS * 10  # O Ataque dura 10 segundos
         self.__duration_counter = 0
 
+        # Todos os vetores do ataque já são criados aqui e reaproveitados
+        self.vectors_pool = ProjectilePool(Vector, self.vectors_group, int(self.__duration//self.vectors_creation_rate))
+
+    def register(self):
+        """Registra as hitboxes e as camadas no CombatManager (Chamada no começo da luta)
+        """
+        CombatManager.add_layer(self, self.vectors_group, PROJECTILES_LAYER)
+        CombatManager.register_hitbox(self, self.vectors_pool, self.on_vectors_hit)
+
+    def schedule(self, timeline):
+        for frame in timeline.every(self.vectors_creation_rate, self.__duration):
+            timeline.add(frame, self.vectors_pool.acquire, *Vector.plan(timeline.rng))
+
     def run(self):
         self.__duration_counter += 1
-
-        if self.__duration_counter % self.vectors_creation_rate == 0:
-            self.vectors.append(Vector(self.vectors_group))
+        self.play_timeline(self.__duration_counter)
         
         if self.__duration_counter >= self.__duration:
             pygame.event.post(pygame.event.Event(PLAYER_TURN_EVENT))
-            self.vectors_group.empty()
-            self.vectors.clear()
+            self.vectors_pool.release_all()
         
-        for vector in self.vectors:
-            vector.update(player_center=self.player.rect.center)
-        
-        for vector in self.vectors_group:
-            if self.__player != vector:
-                if self.__player.rect.colliderect(vector.rect):
-                    offset = (vector.rect.x - self.__player.rect.x, vector.rect.y - self.__player.rect.y)
-                    if self.__player.mask.overlap(vector.mask, offset):
-                        self.__player.take_damage(self.damage)
-                        if vector.type == 'Inverted':
-                            self.__player.apply_effect('inverse')
-                        vector.kill()
+        # Todos os vetores se movem de uma vez, depois os que ainda estão girando
+        self.vectors_pool.step()
+        self.vectors_group.update(player_center=self.player.rect.center)
+
+    def on_vectors_hit(self, vectors: list[Vector]):
+        for vector in vectors:
+            self.__player.take_damage(self.damage)
+            if vector.type == 'Inverted':
+                self.__player.apply_effect('inverse')
+            vector.kill()
     
     def restart(self):
         self.__duration_counter = 0
-        self.vectors_group.empty()
-        self.vectors.clear()
+        self.vectors_pool.release_all()
+        self.compile_timeline()
     
     @property
     def player(self):
@@ -294,15 +306,11 @@ class EliminationAttack(Attack):
 
         self.brackets_group = pygame.sprite.Group()
 
-        CombatManager.global_groups.append(self.brackets_group)
-
         self.squared_bracked_to_right = SquareBracket(1, self.brackets_group)
         self.squared_bracked_to_left = SquareBracket(-1, self.brackets_group)
 
         self.horizontal_beans_group = pygame.sprite.Group()
 
-        CombatManager.global_groups.append(self.horizontal_beans_group)
-
         self.rows = 6  # Escolhendo qual linha o raio vai aparecer
         self.horizontal_beams: list[HorizontalBeam] = []
         self.horizontal_beam_creation_rate = FPS/4
@@ -314,6 +322,13 @@ class EliminationAttack(Attack):
 
         self.elimiation_matrices: list[ElimiationMatrix] = []
 
+    def register(self):
+        """Registra as hitboxes e as camadas no CombatManager (Chamada no começo da luta)
+        """
+        CombatManager.add_layer(self, self.brackets_group, PROJECTILES_LAYER)
+        CombatManager.add_layer(self, self.horizontal_beans_group, PROJECTILES_LAYER)
+        CombatManager.register_hitbox(self, self.horizontal_beans_group, self.on_beams_hit)
+
     def run(self):
         self.__duration_counter += 1
         self.horizontal_beam_counter += 1
@@ -350,10 +365,6 @@ class EliminationAttack(Attack):
         # Atualizando todos os raios
         for i, beam in enumerate(self.horizontal_beams):
             beam.update()
-            offset = (beam.rect.x - self.player.rect.x, beam.rect.y - self.player.rect.y)
-
-            if self.player.mask.overlap(beam.mask, offset) and beam.animating:
-                self.player.take_damage(self.damage)
 
             if beam.animating and beam.alpha <= 0:
                 beam.kill()
@@ -361,7 +372,7 @@ class EliminationAttack(Attack):
         # Desenhando o E da matriz de eliminação
         for i, matrix_text in enumerate(self.elimiation_matrices):
             matrix_text.update(self.squared_bracked_to_right)
-            matrix_text.draw(pygame.display.get_surface())
+            matrix_text.draw(RenderManager.display)
             if matrix_text.finished:
                 self.elimiation_matrices.pop(i)
 
@@ -373,6 +384,11 @@ class EliminationAttack(Attack):
             self.horizontal_beams.clear()
             pygame.event.post(pygame.event.Event(PLAYER_TURN_EVENT))
 
+    def on_beams_hit(self, beams: list[HorizontalBeam]):
+        for beam in beams:
+            if beam.dangerous:
+                self.player.take_damage(self.damage)
+
     def restart(self):
         self.__duration_counter = 0
         self.brackets_group.empty()
@@ -0,0 +1,79 @@
+import pygame
+
+
+class Compositor:
+    """Classe com os efeitos de transição e sobreposição (Fades, formas translúcidas), feitos sem
+    precisar de superfícies SRCALPHA do tamanho da tela
+    """
+    circles: dict[tuple, pygame.Surface] = {}  # Círculos translúcidos já desenhados (Cor e raio -> superfície)
+    fades: dict[tuple, pygame.Surface] = {}  # Superfícies opacas usadas nos fades (Cor e tamanho -> superfície)
+
+    @classmethod
+    def fade(cls, surface: pygame.Surface, color: pygame.Color, alpha: float, rect: pygame.Rect = None):
+        """Pinta uma cor por cima da superfície com a mesma opacidade em todos os pixels
+
+        Args:
+            surface (pygame.Surface): Superfície onde o fade vai ser aplicado
+            color (pygame.Color): Cor do fade
+            alpha (float): Opacidade do fade (0 a 255)
+            rect (pygame.Rect, optional): Área do fade. Defaults to a superfície inteira.
+        """
+        alpha = max(0, min(255, int(alpha)))
+        if alpha == 0:
+            return
+
+        rect = pygame.Rect(rect) if rect else surface.get_rect()
+        if alpha == 255:
+            surface.fill(color, rect)
+            return
+
+        # Uma superfície opaca com alpha da superfície inteira é bem mais barata que alpha por pixel
+        key = (tuple(pygame.Color(color)), surface.get_size())
+        if key not in cls.fades:
+            cls.fades[key] = pygame.Surface(surface.get_size()).convert(surface)
+            cls.fades[key].fill(color)
+
+        cls.fades[key].set_alpha(alpha)
+        surface.blit(cls.fades[key], rect, pygame.Rect(0, 0, *rect.size))
+
+    @classmethod
+    def draw_circle(cls, surface: pygame.Surface, color: pygame.Color, center: tuple[float], radius: float):
+        """Desenha um círculo, usando uma superfície pequena apenas se a cor for translúcida
+
+        Args:
+            surface (pygame.Surface): Superfície onde o círculo vai ser desenhado
+            color (pygame.Color): Cor do círculo (Pode ter alpha)
+            center (tuple[float]): Centro do círculo
+            radius (float): Raio do círculo
+        """
+        color = pygame.Color(color)
+        radius = int(radius)
+        if radius <= 0:
+            return
+
+        if color.a == 255:
+            pygame.draw.circle(surface, color, center, radius)
+            return
+
+        key = (tuple(color), radius)
+        if key not in cls.circles:
+            cls.circles[key] = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
+            pygame.draw.circle(cls.circles[key], color, (radius, radius), radius)
+
+        # O blit já recorta o que ficar fora da superfície
+        surface.blit(cls.circles[key], (center[0]-radius, center[1]-radius))
+
+    @staticmethod
+    def blur(surface: pygame.Surface, factor: int = 4) -> pygame.Surface:
+        """Borra uma superfície diminuindo e ampliando ela de novo (Bem mais barato que um blur de verdade)
+
+        Args:
+            surface (pygame.Surface): Superfície que vai ser borrada
+            factor (int, optional): Quantas vezes ela é diminuída. Defaults to 4.
+
+        Returns:
+            pygame.Surface: Nova superfície borrada, do mesmo tamanho
+        """
+        width, height = surface.get_size()
+        small = pygame.transform.smoothscale(surface, (max(1, width//factor), max(1, height//factor)))
+        return pygame.transform.smoothscale(small, (width, height))
@@ -7,6 +7,7 @@ from config.globalmanager import GlobalManager
 from config.fontmanager import FontManager
 from config.eventmanager import EventManager
 from config.soundmanager import SoundManager
+from config.rendermanager import RenderManager
 
 from classes.text.text import Text
 from classes.text.dynamic_text import DynamicText
@@ -18,7 +19,7 @@ class InfosHud:
     def __init__(self, items_group):
         chatbox_sprite = pygame.image.load(os.path.join(GET_PROJECT_PATH(), 'sprites', 'hud', 'chatbox.png'))
 
-        self.display = pygame.display.get_surface()   # Pego a superfície da tela
+        self.display = RenderManager.display   # Pego a superfície da tela
 
         self.stats_sprite_scale_dict = {
             'width': 4.71,
@@ -37,18 +38,11 @@ class InfosHud:
         self.stats_rect.y = self.display.get_height()/self.stats_sprite_scale_dict['y']
         self.stats_rect.x = self.display.get_width()/self.stats_sprite_scale_dict['x']
 
-        # Informações que serão mostradas no status
-        self.status_texts = [
-            Text(Player.name, FontManager.fonts['Gamer'], 50),
-            Text(f'HP {Player.life}/{Player.max_life}', FontManager.fonts['Gamer'], 30),
-            Text(f'LV {Player.level}', FontManager.fonts['Gamer'], 30)
-        ]
+        # Tamanho da fonte dos textos do inventário e dos status
+        self.text_size = int((450*100)/self.display.get_height())
 
-        for i, status in enumerate(self.status_texts):
-            status.rect.x = self.stats_rect.x+30
-            status.rect.y = self.stats_rect.y+(i)*(status.rect.height) + 20
-            if i > 0:
-                status.rect.y += 20
+        # Textos já renderizados, só são renderizados de novo se o conteúdo mudar
+        self.texts_cache: dict[str, tuple[str, Text]] = {}
 
         # DEFININDO O CONTEINER DAS OPÇÕES E AS OPÇÕES
         self.options_sprite_scale_dict = {  # Dicionário com as medidas de escala para divisão
@@ -107,14 +101,10 @@ class InfosHud:
         self.result_rect.x = self.display.get_width()/self.result_sprite_scale_dict['x']
 
         ########### Informações para o inventário
-        self.inventory_items = [
-            {
-                'text': Text(f'{item.name}', FontManager.fonts['Gamer'], int((450*100)/self.display.get_height())),
-                'item': item
-            } for item in Player.inventory
-        ]
+        # Os textos dos itens só são renderizados quando aparecem na página visível
+        self.inventory_items: list[dict] = []
 
-        self.items_per_column = math.floor(self.result_rect.height // self.inventory_items[0]['text'].rect.height)-3
+        self.items_per_column = math.floor(self.result_rect.height // pygame.font.Font(FontManager.fonts['Gamer'], self.text_size).get_height())-3
         self.items_per_page = self.items_per_column
         self.page = 0
         self.selected_item = 0
@@ -123,15 +113,15 @@ class InfosHud:
         ### Informações das ações que podem fazer num item
         self.inventory_actions = [
             {
-                'text': Text(f'USAR', FontManager.fonts['Gamer'], int((450*100)/self.display.get_height())),
+                'text': Text(f'USAR', FontManager.fonts['Gamer'], self.text_size),
                 'action': self.use_item
             },
             {
-                'text': Text(f'INFO', FontManager.fonts['Gamer'], int((450*100)/self.display.get_height())),
+                'text': Text(f'INFO', FontManager.fonts['Gamer'], self.text_size),
                 'action': self.show_item_description
             },
             {
-                'text': Text(f'LARGAR', FontManager.fonts['Gamer'], int((450*100)/self.display.get_height())),
+                'text': Text(f'LARGAR', FontManager.fonts['Gamer'], self.text_size),
                 'action': self.drop_item
             }
         ]
@@ -144,7 +134,7 @@ class InfosHud:
             '',
             FontManager.fonts['Gamer'],
             20,
-            int((450*100)/self.display.get_height()),
+            self.text_size,
             self.result_rect.width - 60,
             (
                 self.result_rect.x + 30,
@@ -153,39 +143,7 @@ class InfosHud:
             sound='text_1.wav'
         )
 
-        ########### Informações para o inventário
-        self.stats_name_text = Text(f'\"{Player.name}\"', FontManager.fonts['Gamer'], int((500*100)/self.display.get_height()))
-        self.stats_name_text.rect.x = self.result_rect.x + 20
-        self.stats_name_text.rect.y = self.result_rect.y + 40
-
-        self.stats_level_text = Text(f'LV {Player.level}', FontManager.fonts['Gamer'], int((450*100)/self.display.get_height()))
-        self.stats_level_text.rect.x = self.result_rect.x + 20
-        self.stats_level_text.rect.y = self.result_rect.y + self.result_rect.height/2.76
-
-        self.stats_xp_text = Text(f'EXP {Player.xp}', FontManager.fonts['Gamer'], int((450*100)/self.display.get_height()))
-        self.stats_xp_text.rect.x = self.result_rect.x + 20
-        self.stats_xp_text.rect.top = self.stats_level_text.rect.bottom
-
-        self.stats_hp_text = Text(f'HP {Player.life}/{Player.max_life}', FontManager.fonts['Gamer'], int((450*100)/self.display.get_height()))
-        self.stats_hp_text.rect.x = self.result_rect.x + 20
-        self.stats_hp_text.rect.top = self.stats_xp_text.rect.bottom
-
-        self.stats_weapon_text = Text(f'WEAPON {Player.inventory.equiped_weapon.name}', FontManager.fonts['Gamer'], int((450*100)/self.display.get_height()))
-        self.stats_weapon_text.rect.x = self.result_rect.x + 20
-        self.stats_weapon_text.rect.top = self.stats_hp_text.rect.bottom + 40
-
-        self.stats_weapon_damage_text = Text(f'ATK {Player.inventory.equiped_weapon.damage}', FontManager.fonts['Gamer'], int((450*100)/self.display.get_height()))
-        self.stats_weapon_damage_text.rect.x = self.result_rect.x + 20
-        self.stats_weapon_damage_text.rect.top = self.stats_weapon_text.rect.bottom
-
-        self.stats_menu_texts = [
-            self.stats_name_text,
-            self.stats_level_text,
-            self.stats_xp_text,
-            self.stats_hp_text,
-            self.stats_weapon_text,
-            self.stats_weapon_damage_text
-        ]
+        self.update_infos()
         
     def move_cursor(self, increment: int):
         """Função responsável por mover os cursores pelas telas do menu
@@ -208,45 +166,66 @@ class InfosHud:
         self.show_item_description_text = True
         self.item_description_text.restart(Player.inventory[self.selected_item].description)
     
+    def patch_text(self, key: str, content: str, size: int) -> Text:
+        """Retorna o texto de uma linha do HUD, renderizando de novo apenas se o conteúdo mudou
+
+        Args:
+            key (str): Identificador da linha
+            content (str): Conteúdo que a linha deve mostrar
+            size (int): Tamanho da fonte
+
+        Returns:
+            Text: O texto da linha
+        """
+        cached = self.texts_cache.get(key)
+        if cached and cached[0] == content:
+            return cached[1]
+
+        text = Text(content, FontManager.fonts['Gamer'], size)
+        self.texts_cache[key] = (content, text)
+        return text
+
     def update_infos(self):
+        """Atualiza apenas as linhas do HUD que mudaram (Status e itens do inventário)
+        """
         self.status_texts = [
-            Text(Player.name, FontManager.fonts['Gamer'], 50),
-            Text(f'HP {Player.life}/{Player.max_life}', FontManager.fonts['Gamer'], 30),
-            Text(f'LV {Player.level}', FontManager.fonts['Gamer'], 30)
-        ]
-        self.inventory_items = [
-            {
-                'text': Text(f'{item.name}', FontManager.fonts['Gamer'], int((450*100)/self.display.get_height())),
-                'item': item
-            } for item in Player.inventory
+            self.patch_text('status_name', Player.name, 50),
+            self.patch_text('status_hp', f'HP {Player.life}/{Player.max_life}', 30),
+            self.patch_text('status_level', f'LV {Player.level}', 30)
         ]
         for i, status in enumerate(self.status_texts):
             status.rect.x = self.stats_rect.x+30
             status.rect.y = self.stats_rect.y+(i)*(status.rect.height) + 20
             if i > 0:
                 status.rect.y += 20
-        
-        self.stats_name_text = Text(f'\"{Player.name}\"', FontManager.fonts['Gamer'], int((500*100)/self.display.get_height()))
+
+        # Reaproveito as linhas dos itens que continuam no inventário
+        previous_rows = {row['item'].id: row for row in self.inventory_items}
+        self.inventory_items = [
+            previous_rows.get(item.id, {'text': None, 'item': item}) for item in Player.inventory
+        ]
+
+        self.stats_name_text = self.patch_text('stats_name', f'\"{Player.name}\"', int((500*100)/self.display.get_height()))
         self.stats_name_text.rect.x = self.result_rect.x + 20
         self.stats_name_text.rect.y = self.result_rect.y + 40
 
-        self.stats_level_text = Text(f'LV {Player.level}', FontManager.fonts['Gamer'], int((450*100)/self.display.get_height()))
+        self.stats_level_text = self.patch_text('stats_level', f'LV {Player.level}', self.text_size)
         self.stats_level_text.rect.x = self.result_rect.x + 20
         self.stats_level_text.rect.y = self.result_rect.y + self.result_rect.height/2.76
 
-        self.stats_xp_text = Text(f'EXP {Player.xp}', FontManager.fonts['Gamer'], int((450*100)/self.display.get_height()))
+        self.stats_xp_text = self.patch_text('stats_xp', f'EXP {Player.xp}', self.text_size)
         self.stats_xp_text.rect.x = self.result_rect.x + 20
         self.stats_xp_text.rect.top = self.stats_level_text.rect.bottom
 
-        self.stats_hp_text = Text(f'HP {Player.life}/{Player.max_life}', FontManager.fonts['Gamer'], int((450*100)/self.display.get_height()))
+        self.stats_hp_text = self.patch_text('stats_hp', f'HP {Player.life}/{Player.max_life}', self.text_size)
         self.stats_hp_text.rect.x = self.result_rect.x + 20
         self.stats_hp_text.rect.top = self.stats_xp_text.rect.bottom
 
-        self.stats_weapon_text = Text(f'WEAPON {Player.inventory.equiped_weapon.name}', FontManager.fonts['Gamer'], int((450*100)/self.display.get_height()))
+        self.stats_weapon_text = self.patch_text('stats_weapon', f'WEAPON {Player.inventory.equiped_weapon.name}', self.text_size)
         self.stats_weapon_text.rect.x = self.result_rect.x + 20
         self.stats_weapon_text.rect.top = self.stats_hp_text.rect.bottom + 40
 
-        self.stats_weapon_damage_text = Text(f'ATK {Player.inventory.equiped_weapon.damage}', FontManager.fonts['Gamer'], int((450*100)/self.display.get_height()))
+        self.stats_weapon_damage_text = self.patch_text('stats_weapon_damage', f'ATK {Player.inventory.equiped_weapon.damage}', self.text_size)
         self.stats_weapon_damage_text.rect.x = self.result_rect.x + 20
         self.stats_weapon_damage_text.rect.top = self.stats_weapon_text.rect.bottom
 
@@ -259,6 +238,25 @@ class InfosHud:
             self.stats_weapon_damage_text
         ]
 
+    def place_item_text(self, index: int) -> Text:
+        """Renderiza (se ainda não foi renderizado) e posiciona o texto de um item do inventário
+
+        Args:
+            index (int): Índice do item no inventário
+
+        Returns:
+            Text: O texto do item
+        """
+        row = self.inventory_items[index]
+        if row['text'] is None:
+            row['text'] = Text(row['item'].name, FontManager.fonts['Gamer'], self.text_size)
+
+        item_text = row['text']
+        item_text.rect.x = self.result_rect.x + 10 + self.cursor_rect.width
+        item_text.rect.y = self.result_rect.y + item_text.rect.height*(index%self.items_per_column) + 30
+
+        return item_text
+
     def use_item(self):
         """Função que utiliza o item selecionado
         """
@@ -310,8 +308,9 @@ class InfosHud:
                 opt.rect.bottom = self.result_rect.bottom - 30
             
             if not self.item_is_selected:
-                self.cursor_rect.right = self.inventory_items[self.selected_item]['text'].rect.left
-                self.cursor_rect.centery = self.inventory_items[self.selected_item]['text'].rect.centery
+                selected_item_text = self.place_item_text(self.selected_item)
+                self.cursor_rect.right = selected_item_text.rect.left
+                self.cursor_rect.centery = selected_item_text.rect.centery
 
             if self.item_is_selected:
                 self.cursor_rect.left = self.inventory_actions[self.wich_inventory_action]['text'].rect.right
@@ -379,20 +378,14 @@ class InfosHud:
         if self.option_selected:
             self.display.blit(self.result_sprite, self.result_rect)
 
-        column = 0
         if not self.show_item_description_text:
             if self.option_selected == 'inventory':  # Se eu selecionar inventário
-                # Desenhando os itens que estão no inventário
+                # Desenhando apenas os itens da página visível
                 for i in range(self.items_per_page):
-                    if (i+self.items_per_page*self.page) >= len(Player.inventory):
+                    if (i+self.items_per_page*self.page) >= len(self.inventory_items):
                         break
-                    
-                    item_text = self.inventory_items[(i+self.items_per_page*self.page)]['text']
-
-                    item_text.rect.x = self.result_rect.x + 10*abs(column-1) + self.result_rect.width*column/2 + (1 - 2 * column)*self.cursor_rect.width
-                    item_text.rect.y = self.result_rect.y + item_text.rect.height*(i%self.items_per_column) + 30
 
-                    item_text.draw(self.display)
+                    self.place_item_text(i+self.items_per_page*self.page).draw(self.display)
                 
                 # Desenhando as opções do que pode fazer com os itens
                 for opt in self.inventory_actions:
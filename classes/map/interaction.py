@@ -3,6 +3,8 @@ import os
 from config import *
 from classes.text.dynamic_text import DynamicText
 from config.eventmanager import EventManager
+from config.soundmanager import SoundManager
+from config.combatmanager import CombatManager
 from config.globalmanager import GlobalManager
 from config.gamestatemanager import GameStateManager
 from config.savemanager import SaveManager
@@ -20,6 +22,18 @@ class BossIntercation(Interaction):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.boss = kwargs['boss']
+
+    def prefetch_music(self):
+        """Começa a ler a música do boss enquanto o diálogo antes da luta aparece
+        """
+        SoundManager.prefetch_music(os.path.join(GET_PROJECT_PATH(), 'sounds', GlobalManager.bosses[self.boss]['sound']))
+
+    def prewarm(self):
+        """Prepara a luta em segundo plano (Música e o boss com os seus ataques) assim que o player
+        chega perto do boss, para a troca para o combate ser imediata
+        """
+        self.prefetch_music()
+        CombatManager.prewarm_boss(GlobalManager.bosses[self.boss])
     
     def go_to_boss_fight(self):
         SaveManager.save()
@@ -74,6 +88,8 @@ class InteractionManager:
                     interaction.day == GlobalManager.day
                 )
             ):
+                if isinstance(interaction, BossIntercation) and interaction is not self.active_interaction:
+                    interaction.prewarm()  # O player acabou de entrar na área do boss
                 self.active_interaction = interaction
                 return interaction
 
@@ -102,6 +118,9 @@ class InteractionManager:
                         else:
                             self.dynamic_text.skip_text()
                     elif self.active_interaction:
+                        if isinstance(self.active_interaction, BossIntercation):
+                            self.active_interaction.prewarm()
+
                         # Inicia interação com texto dinâmico
                         self.dynamic_text = DynamicText(
                             text=f"{self.active_interaction.value}",
@@ -5,16 +5,20 @@ from config import *
 from classes.polygon.polygon import Polygon
 from classes.map.interaction import Interaction, BossIntercation, CamachoInteraction
 from config.globalmanager import GlobalManager
+from config.rendermanager import RenderManager
 
 from classes.item import Item
 
 
 # Carrega e renderiza mapas do tipo .tmx
 class MapLoader:
+    CHUNK_SIZE = 800  # Tamanho (em pixels, já ampliado) de cada pedaço do mapa
+
     def __init__(self, map_file):
         self.tmx_data = load_pygame(map_file)  # Carrega o mapa usando pytmx
         self.load_global_spawnpoint()
         self.walls = []
+        self.chunks: dict[tuple[int], pygame.Surface] = {}  # Pedaços do mapa já desenhados
     
     def load_global_spawnpoint(self):
         spawnpoint = self.tmx_data.get_layer_by_name('Spawnpoint')
@@ -77,33 +81,45 @@ class MapLoader:
                             GlobalManager.camera
                         )
 
-    def render_with_vector(self, surface, camera):
-        # Calcula os limites visíveis da tela com base na posição da câmera
-        screen_rect = pygame.Rect(camera.camera_rect.x, camera.camera_rect.y, camera.screen_width, camera.screen_height)
-        
-        # Itera sobre as camadas do mapa e renderiza apenas os tiles visíveis
+    def build_chunks(self):
+        """Desenha todas as camadas de tiles, já ampliadas, em pedaços grandes do mapa (Feito uma vez só)
+        """
+        self.chunks = {}
+        tile_size = (self.tmx_data.tilewidth * MAP_SCALE_FACTOR, self.tmx_data.tileheight * MAP_SCALE_FACTOR)
+        scaled_tiles = {}  # Cada imagem de tile é ampliada uma vez só
+
         for layer in self.tmx_data.layers:
             if hasattr(layer, 'tiles'):
                 for x, y, tile in layer.tiles():
                     if tile:
-                        # Calcula a posição do tile no mapa
-                        pos = (
-                            x * self.tmx_data.tilewidth * MAP_SCALE_FACTOR,
-                            y * self.tmx_data.tileheight * MAP_SCALE_FACTOR
-                        )
-                        # Cria um retângulo para o tile
-                        rect = pygame.Rect(
-                            *pos,
-                            self.tmx_data.tilewidth * MAP_SCALE_FACTOR,
-                            self.tmx_data.tileheight * MAP_SCALE_FACTOR
+                        pos = (x * tile_size[0], y * tile_size[1])
+                        chunk_index = (int(pos[0] // self.CHUNK_SIZE), int(pos[1] // self.CHUNK_SIZE))
+
+                        if chunk_index not in self.chunks:
+                            self.chunks[chunk_index] = pygame.Surface((self.CHUNK_SIZE, self.CHUNK_SIZE), pygame.SRCALPHA)
+                        if id(tile) not in scaled_tiles:
+                            scaled_tiles[id(tile)] = pygame.transform.scale_by(tile, MAP_SCALE_FACTOR)
+
+                        self.chunks[chunk_index].blit(
+                            scaled_tiles[id(tile)],
+                            (pos[0] - chunk_index[0]*self.CHUNK_SIZE, pos[1] - chunk_index[1]*self.CHUNK_SIZE)
                         )
-                        
-                        # Verifica se o tile está dentro dos limites da tela
-                        if screen_rect.colliderect(rect):
-                            surface.blit(
-                                pygame.transform.scale_by(tile, MAP_SCALE_FACTOR),
-                                camera.apply(rect)  # Aplica a câmera diretamente
-                            )
+
+        for chunk_index in self.chunks:
+            self.chunks[chunk_index] = self.chunks[chunk_index].convert_alpha()
+
+    def render_with_vector(self, surface, camera):
+        if not self.chunks:
+            self.build_chunks()
+
+        # Calcula os limites visíveis da tela com base na posição da câmera
+        screen_rect = pygame.Rect(camera.camera_rect.x, camera.camera_rect.y, camera.screen_width, camera.screen_height)
+
+        # Renderiza apenas os pedaços do mapa visíveis
+        for (i, j), chunk in self.chunks.items():
+            rect = pygame.Rect(i*self.CHUNK_SIZE, j*self.CHUNK_SIZE, self.CHUNK_SIZE, self.CHUNK_SIZE)
+            if screen_rect.colliderect(rect):
+                RenderManager.draw_static(f'map-{i}-{j}', chunk, camera.apply(rect))
 
 
     def render_objects_with_gid(self, surface, camera):
@@ -1,17 +1,20 @@
 import pygame
 import os
 from config import *
+from config.combatmanager import CombatManager
 from classes.text.dynamic_text import DynamicText
 
 
 class DialogueBox(pygame.sprite.Sprite):
+    image_path = os.path.join(GET_PROJECT_PATH(), 'sprites', 'hud', 'dialogue', 'dialogue-bubble.png')
+
     def __init__(self, text, font, letters_per_second, font_size, sound, *groups):
         super().__init__(*groups)
 
         self.__text = text
         self.scale = 2
         self.image = pygame.transform.scale_by(
-            pygame.image.load(os.path.join(GET_PROJECT_PATH(), 'sprites', 'hud', 'dialogue', 'dialogue-bubble.png')),
+            CombatManager.load_image(self.image_path),
             self.scale
         )
         self.rect = self.image.get_rect()
@@ -36,6 +39,14 @@ class DialogueBox(pygame.sprite.Sprite):
     def restart(self):
         self.dynamic_text.restart()
 
+    def prepare(self, text: str):
+        """Prepara em segundo plano um texto que ainda vai aparecer na caixa de diálogo
+
+        Args:
+            text (str): Texto que vai ser preparado
+        """
+        self.dynamic_text.prepare(text)
+
     def draw(self, screen: pygame.Surface):
         screen.blit(self.image, self.rect)
         # pygame.draw.rect(screen, (0,0,255),self.rect)
@@ -2,6 +2,9 @@ import pygame
 from config import FPS
 
 from config.soundmanager import SoundManager
+from config.textmanager import TextManager
+
+from classes.text.prepared_text import PreparedText
 
 
 class DynamicText:
@@ -30,6 +33,8 @@ class DynamicText:
 
         self.text = text  # Texto Completo
         self.progressive_text = ''  # Texto que vai ser alterado para dar o efeito de letra por letra
+        self.font_path = font
+        self.text_size = text_size
         self.font = pygame.font.Font(font, text_size)  # Fonte que vai ser usada
 
         self.max_length = max_length  # Largura máxima
@@ -49,6 +54,26 @@ class DynamicText:
 
         self.sound = sound
 
+        self.prepared: PreparedText = None  # Versão do texto já renderizada em segundo plano (Se houver)
+
+    def prepare(self, text: str, max_length: float = None):
+        """Pede para um texto que vai aparecer nesse DynamicText ser preparado em segundo plano
+
+        Args:
+            text (str): Texto que vai ser preparado
+            max_length (float, optional): Largura em que o texto vai ser mostrado. Defaults to a largura atual.
+        """
+        TextManager.prepare(text, self.font_path, self.text_size, max_length or self.max_length, self.color)
+
+    @property
+    def text(self):
+        return self.__text
+
+    @text.setter
+    def text(self, value: str):
+        self.__text = value
+        self.prepared = None
+
     def restart(self, new_text: str = None):
         if new_text:
             self.text = new_text
@@ -60,8 +85,14 @@ class DynamicText:
             self.font.render(self.progressive_text, True, self.color)
         ]
         self.finished = False
+        self.prepared = None
     
     def skip_text(self):
+        if self.prepared:  # O texto já está renderizado, só preciso mostrar todas as letras
+            self.letter_counter = len(self.text)
+            self.finished = True
+            return
+
         self.progressive_text = ''
         for letter in self.text:
             self.progressive_text += letter
@@ -87,13 +118,22 @@ class DynamicText:
 
         self.counter += 1  # Incrementa o contador
 
+        # Antes da primeira letra, vejo se o texto já foi preparado em segundo plano
+        if self.letter_counter == 0 and not self.prepared:
+            self.prepared = TextManager.get(self.text, self.font_path, self.text_size, self.max_length, self.color)
+
         # Se for hora de adicionar uma nova letra e ainda restarem letras a processar
         if self.counter >= self.letter_rate and not self.letter_counter >= len(self.text):
             self.counter = 0  # Reseta o contador
             
             if self.text[self.letter_counter] != ' ' and self.sound:
-                SoundManager.stop_sound(self.sound)
-                SoundManager.play_sound(self.sound)
+                SoundManager.play_voice(self.sound)
+
+            if self.prepared:  # As linhas já estão renderizadas, só revelo a próxima letra
+                self.letter_counter += 1
+                if self.letter_counter >= len(self.text):
+                    self.finished = True
+                return
 
             # Pegamos o texto restante
             remaining_text = self.text[self.letter_counter:]
@@ -134,6 +174,10 @@ class DynamicText:
 
 
     def draw(self, screen: pygame.Surface):
+        if self.prepared:
+            self.prepared.draw(screen, self.position, self.letter_counter)
+            return
+
         for i, text in enumerate(self.rows):
             text_rect = text.get_rect()
             text_rect.x = self.position[0]
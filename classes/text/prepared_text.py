@@ -0,0 +1,70 @@
+import pygame
+
+
+class PreparedText:
+    """Texto que já foi quebrado em linhas e renderizado, pronto para ser desenhado letra por letra
+    """
+    def __init__(self, text: str, font: pygame.font.Font, max_length: float, color: pygame.Color = (255,255,255)):
+        """Inicialização da classe (Pode ser executada fora da thread principal)
+
+        Args:
+            text (str): Texto completo
+            font (pygame.font.Font): Fonte usada para medir e renderizar o texto
+            max_length (float): Largura máxima de cada linha
+            color (pygame.Color, optional): Cor do texto. Defaults to (255,255,255).
+        """
+        self.text = text
+        self.max_length = max_length
+
+        self.lines = self.break_lines(font)  # Texto de cada linha
+        self.surfaces = [font.render(line, True, color) for line in self.lines]  # Linhas renderizadas
+
+        # Largura de cada linha até cada letra, usada para revelar a linha aos poucos
+        self.widths = [
+            [font.size(line[:i+1])[0] for i in range(len(line))] for line in self.lines
+        ]
+
+    def break_lines(self, font: pygame.font.Font) -> list[str]:
+        """Quebra o texto em linhas da mesma forma que o DynamicText faz letra por letra
+
+        Args:
+            font (pygame.font.Font): Fonte usada para medir o texto
+
+        Returns:
+            list[str]: Lista com o texto de cada linha
+        """
+        lines = ['']
+        for i, letter in enumerate(self.text):
+            remaining_text = self.text[i:]
+            next_space_index = remaining_text.find(' ')  # Índice do próximo espaço
+            if next_space_index == -1:
+                next_space_index = len(remaining_text)  # Última palavra
+
+            # Se a próxima palavra não couber, começo uma nova linha
+            if font.size(lines[-1] + remaining_text[:next_space_index + 1])[0] >= self.max_length:
+                lines.append('')
+
+            lines[-1] += letter
+
+        return lines
+
+    def draw(self, screen: pygame.Surface, position: tuple[float], letters: int):
+        """Desenha apenas as primeiras letras do texto
+
+        Args:
+            screen (pygame.Surface): Superfície onde o texto vai ser desenhado
+            position (tuple[float]): Posição da primeira linha
+            letters (int): Quantas letras devem aparecer
+        """
+        for i, surface in enumerate(self.surfaces):
+            if letters <= 0:
+                break
+
+            shown_letters = min(letters, len(self.widths[i]))
+            if shown_letters > 0:
+                screen.blit(
+                    surface,
+                    (position[0], position[1]+i*surface.get_height()),
+                    pygame.Rect(0, 0, self.widths[i][shown_letters-1], surface.get_height())
+                )
+            letters -= shown_letters
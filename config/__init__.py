@@ -6,5 +6,22 @@ GAME_NAME = 'EMApTale'  # Nome da Janela
 
 MAP_SCALE_FACTOR = 2.5
 
+# Resolução em que o jogo é desenhado, a imagem é ampliada uma vez por frame para a tela inteira (Por exemplo (1280, 720))
+# Com None o jogo desenha direto na resolução nativa do monitor
+LOGICAL_RESOLUTION = None
+
+# Como os frames são desenhados: 'software' (Surface.blit e display.flip) ou 'sdl2' (Renderer e texturas do SDL2)
+RENDER_BACKEND = 'software'
+
+# Como o jogo espera entre os frames: 'tick' (clock.tick), 'busy' (clock.tick_busy_loop, mais preciso
+# e gasta mais CPU) ou 'vsync' (Sincroniza com a tela, ainda limitado ao FPS máximo)
+FRAME_PACING = 'tick'
+
+# Enquanto o jogo está pausado o mapa fica congelado em um frame só, escurecido. Com isso o frame também é borrado
+PAUSE_BLUR = False
+
+# Mostra informações de debug na tela (Como quantos projéteis o ataque atual tem vivos)
+DEBUG = False
+
 def GET_PROJECT_PATH():  # Retorna a pasta do projeto independente do Sistema Operacional
     return os.getcwd()
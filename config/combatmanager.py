@@ -1,5 +1,8 @@
 import pygame
+import math
+from bisect import bisect_right
 from typing import Callable
+from concurrent.futures import ThreadPoolExecutor, Future
 
 class CombatManager:
     turn = 'player'
@@ -10,25 +13,37 @@ class CombatManager:
         'battle_container': None
     }
 
-    global_groups: list[pygame.sprite.Group] = []  # Alguns objetos tem que ser desenhados em cima de todo o resto, pra isso criei essa variável
-    global_draw_functions: list[Callable] = []
+    # Alguns objetos tem que ser desenhados em cima de todo o resto, pra isso criei essas camadas: (Ordem, escopo, dono, o que desenhar)
+    # Elas ficam ordenadas pela ordem e somem sozinhas quando o escopo acaba ('combat', 'turn' ou 'attack')
+    layers: list[tuple[int, str, object, pygame.sprite.AbstractGroup | Callable]] = []
+
+    # Objetos que dão dano no coração: (Dono, objetos, o que fazer quando encostam)
+    hitboxes: list[tuple[object, object, Callable[[list], None]]] = []
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='boss')  # Thread que lê as imagens dos bosses antes da luta
+    prepared_images: dict[str, Future] = {}  # Imagens lidas (ou sendo lidas) em segundo plano, pelo caminho
 
     @classmethod
     def set_player_turn(cls):
         """Método que coloca como turno do player"""
         cls.turn = 'player'
+        cls.clear_layers('turn', 'attack')  # O ataque acabou
     
     @classmethod
     def set_boss_turn(cls):
         """Método que coloca como turno do player"""
         cls.turn = 'boss'
+        cls.clear_layers('turn')
     
-    @classmethod
-    def set_boss(cls, infos: dict):
-        """Método que inicializa o meu inimigo do combate
+    @staticmethod
+    def boss_class(infos: dict) -> type:
+        """Retorna a classe do boss
 
         Args:
             infos (dict): Dicionário com as informações do Boss
+
+        Returns:
+            type: A classe do boss
         """
         from classes.bosses.yuri import Yuri
         from classes.bosses.branco import Branco
@@ -36,19 +51,63 @@ class CombatManager:
         from classes.bosses.pinho import Pinho
         from classes.bosses.walter import Walter
 
-
         if infos['name'] == 'Yuri Saporito':
-            cls.enemy = Yuri(infos)
+            return Yuri
         if infos['name'] == 'Branco Saraiva':
-            cls.enemy = Branco(infos)
+            return Branco
         if infos['name'] == 'Maria Soledad':
-            cls.enemy = Soledad(infos)
-        if infos['name'] == 'Yuri Saporito':
-            cls.enemy = Yuri(infos)
+            return Soledad
         if infos['name'] == 'Rafael Pinho':
-            cls.enemy = Pinho(infos)
+            return Pinho
         if infos['name'] == 'Walter Sande':
-            cls.enemy = Walter(infos)
+            return Walter
+
+    @classmethod
+    def prewarm_boss(cls, infos: dict):
+        """Começa a ler as imagens do boss em segundo plano (Chamada quando o player chega perto dele no mapa),
+        assim a luta começa sem travar o primeiro frame. A thread só lê e decodifica os arquivos, o boss é criado
+        no set_boss, na thread principal
+
+        Args:
+            infos (dict): Dicionário com as informações do Boss
+        """
+        for path in cls.boss_class(infos).images:
+            if path not in cls.prepared_images:
+                cls.prepared_images[path] = cls.executor.submit(pygame.image.load, path)
+
+    @classmethod
+    def load_image(cls, path: str) -> pygame.Surface:
+        """Carrega uma imagem, usando a que já foi lida no prewarm_boss se tiver uma
+
+        Args:
+            path (str): Caminho da imagem
+
+        Returns:
+            pygame.Surface: A imagem (Uma cópia, quem pediu pode alterar ela)
+        """
+        future = cls.prepared_images.get(path)
+        if future is None or future.cancelled():
+            return pygame.image.load(path)
+        return future.result().copy()  # Espera a imagem se ela ainda estiver sendo lida
+
+    @classmethod
+    def set_boss(cls, infos: dict):
+        """Método que inicializa o meu inimigo do combate
+
+        Args:
+            infos (dict): Dicionário com as informações do Boss
+        """
+        cls.enemy = cls.boss_class(infos)(infos)
+
+        # O que foi preparado para esse boss já foi usado, e o dos outros não vai ser
+        for future in cls.prepared_images.values():
+            future.cancel()
+        cls.prepared_images.clear()
+
+        # As hitboxes e camadas do boss anterior não valem mais
+        cls.hitboxes.clear()
+        cls.clear_layers()
+        cls.enemy.register()
     
     @classmethod
     def set_variable(cls, key: str, value):
@@ -73,11 +132,108 @@ class CombatManager:
         return cls.global_variables[key]
     
     @classmethod
-    def draw_global_groups(cls, screen):
-        for group in cls.global_groups:
-            group.draw(screen)
-    
+    def register_hitbox(cls, owner, source, on_hit: Callable[[list], None]):
+        """Registra objetos que colidem com o coração. Eles só são testados no check_collisions
+        enquanto o dono estiver atacando
+
+        Args:
+            owner (Attack | Boss): Ataque dono dos objetos (Ou o próprio boss, se valerem em todos os ataques)
+            source (ProjectilePool | pygame.sprite.Group | list | Any): Os objetos. Pools, grupos e listas são testados
+                direto, qualquer outra coisa precisa ter um método collide(rect, mask) que retorna o que encostou
+            on_hit (Callable[[list], None]): Chamada com tudo que encostou no coração naquele frame
+        """
+        cls.hitboxes.append((owner, source, on_hit))
+
     @classmethod
-    def execute_global_draws(cls, *args, **kwargs):
-        for callable_func in cls.global_draw_functions:
-            callable_func(*args, **kwargs)
+    def check_collisions(cls):
+        """Testa as hitboxes do ataque atual contra o coração e avisa os donos do que encostou
+        (Chamada uma vez por frame, depois do update do boss)
+        """
+        attack = cls.enemy.current_attack
+        if attack is None:
+            return
+
+        heart = cls.global_variables['player']
+        for owner, source, on_hit in cls.hitboxes:
+            if owner is not attack and owner is not cls.enemy:
+                continue
+
+            hits = cls.collide(source, heart.rect, heart.mask)
+            if hits:
+                on_hit(hits)
+
+    @staticmethod
+    def collide(source, rect: pygame.Rect, mask: pygame.mask.Mask) -> list:
+        """Retorna os objetos que encostam em um retângulo e na sua máscara
+
+        Args:
+            source (ProjectilePool | pygame.sprite.Group | list | Any): Os objetos
+            rect (pygame.Rect): Retângulo do alvo
+            mask (pygame.mask.Mask): Máscara do alvo
+
+        Returns:
+            list: Objetos que encostaram
+        """
+        if isinstance(source, pygame.sprite.AbstractGroup):
+            source = source.sprites()
+        elif not isinstance(source, list):
+            return source.collide(rect, mask)
+
+        hits = []
+        for obj in source:
+            # Objetos com uma forma (Hitbox) são testados pela geometria dela
+            hitbox = getattr(obj, 'hitbox', None)
+            if hitbox is not None:
+                if hitbox.collide_rect(rect):
+                    hits.append(obj)
+                continue
+
+            # Os outros pelo retângulo, e a máscara só em quem encostou (Sem máscara fica só o retângulo)
+            if not obj.rect.colliderect(rect):
+                continue
+            obj_mask = getattr(obj, 'mask', None)
+            if obj_mask is None or mask.overlap(obj_mask, (obj.rect.x - rect.x, obj.rect.y - rect.y)):
+                hits.append(obj)
+        return hits
+
+    @classmethod
+    def add_layer(cls, owner, drawable: pygame.sprite.AbstractGroup | Callable, z: int = 0, scope: str = 'combat'):
+        """Registra algo para ser desenhado por cima da batalha (Registrar de novo a mesma coisa não faz nada)
+
+        Args:
+            owner (Attack | Boss): Quem registrou a camada
+            drawable (pygame.sprite.AbstractGroup | Callable): Um grupo de sprites ou uma função que recebe display
+            z (int, optional): Ordem da camada, as menores são desenhadas primeiro. Defaults to 0.
+            scope (str, optional): Até quando a camada existe: 'combat' (Até o fim da luta), 'turn' (Até o turno mudar)
+                ou 'attack' (Até o ataque acabar). Defaults to 'combat'.
+        """
+        if any(layer[3] is drawable for layer in cls.layers):
+            return
+        index = bisect_right(cls.layers, z, key=lambda layer: layer[0])  # Na mesma ordem, a mais nova fica por cima
+        cls.layers.insert(index, (z, scope, owner, drawable))
+
+    @classmethod
+    def clear_layers(cls, *scopes: str):
+        """Tira todas as camadas dos escopos que acabaram
+
+        Args:
+            *scopes (str): Os escopos. Se nenhum for passado, tira todas as camadas
+        """
+        cls.layers[:] = [layer for layer in cls.layers if scopes and layer[1] not in scopes]
+
+    @classmethod
+    def draw_layers(cls, screen: pygame.Surface, start: int = -math.inf, stop: int = math.inf):
+        """Desenha as camadas com a ordem entre start (Incluso) e stop (Excluso)
+
+        Args:
+            screen (pygame.Surface): Onde desenhar
+            start (int, optional): Menor ordem desenhada. Defaults to todas.
+            stop (int, optional): Primeira ordem que não é desenhada. Defaults to todas.
+        """
+        for z, scope, owner, drawable in cls.layers:
+            if not start <= z < stop:
+                continue
+            if isinstance(drawable, pygame.sprite.AbstractGroup):
+                drawable.draw(screen)
+            else:
+                drawable(display=screen)
@@ -1,5 +1,7 @@
 from screens import State
 
+from config.soundmanager import SoundManager
+
 class GameStateManager:
     """Classe que gerencia qual a Cena do game está aparecendo
     """
@@ -45,5 +47,6 @@ class GameStateManager:
         cls.get_current_state().on_last_execution()
         cls.previous_state =  cls.current_state
         cls.current_state = current_state
+        SoundManager.prioritize_scene(current_state)  # Os efeitos da nova cena passam na frente na fila
         cls.get_current_state().variables = variables
 
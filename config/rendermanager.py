@@ -0,0 +1,179 @@
+import pygame
+import statistics
+from collections import deque
+from pygame._sdl2.video import Window, Renderer, Texture, error as SDLError
+
+from config import FPS, GAME_NAME, LOGICAL_RESOLUTION, RENDER_BACKEND, FRAME_PACING
+
+
+class RenderManager:
+    """Classe responsável por criar a janela e apresentar os frames, seja pelo pygame comum (software)
+    ou pelo Renderer do SDL2, onde as imagens estáticas viram texturas enviadas uma única vez.
+    É a única que mostra os frames na tela, as cenas só desenham
+    """
+    backend = 'software'  # 'software' ou 'sdl2'
+    pacing = 'tick'  # 'tick', 'busy' ou 'vsync'
+    clock = pygame.time.Clock()
+    frame_times: deque[int] = deque(maxlen=FPS*2)  # Milissegundos entre os últimos frames
+    display: pygame.Surface = None  # Superfície onde as cenas desenham
+
+    window: Window = None
+    renderer: Renderer = None
+    frame_texture: Texture = None  # Textura onde o frame é enviado, criada uma vez e atualizada todo frame
+    textures: dict[str, Texture] = {}  # Texturas das imagens estáticas, enviadas uma vez só
+    images: dict[str, pygame.Surface] = {}  # Imagens originais das texturas (Usadas para copiar o frame)
+    static_queue: list[tuple[str, pygame.Rect]] = []  # Imagens estáticas desenhadas nesse frame
+
+    @classmethod
+    def setup(cls, backend: str = RENDER_BACKEND, pacing: str = FRAME_PACING) -> pygame.Surface:
+        """Cria a janela do jogo
+
+        Args:
+            backend (str, optional): 'software' ou 'sdl2'. Defaults to RENDER_BACKEND.
+            pacing (str, optional): 'tick', 'busy' ou 'vsync'. Defaults to FRAME_PACING.
+
+        Returns:
+            pygame.Surface: Superfície onde as cenas vão desenhar
+        """
+        cls.backend = backend
+        cls.pacing = pacing
+        vsync = cls.pacing == 'vsync'
+
+        if cls.backend == 'sdl2':
+            size = LOGICAL_RESOLUTION or pygame.display.get_desktop_sizes()[0]
+
+            # A janela do pygame fica escondida, ela só serve para o pygame.display continuar respondendo o tamanho da tela.
+            # As cenas desenham em uma superfície com alpha: onde nada foi desenhado ela fica transparente
+            # e as texturas estáticas aparecem por baixo
+            pygame.display.set_mode(size, pygame.HIDDEN)
+            cls.display = pygame.Surface(size, pygame.SRCALPHA)
+
+            cls.window = Window(GAME_NAME, size, fullscreen_desktop=True)
+            try:
+                cls.renderer = Renderer(cls.window, accelerated=1, vsync=vsync)
+            except SDLError:  # Sem aceleração de vídeo, uso o renderizador por software do SDL
+                cls.renderer = Renderer(cls.window, accelerated=0, vsync=vsync)
+            cls.renderer.logical_size = size
+
+            cls.frame_texture = Texture(cls.renderer, size, streaming=True)
+            cls.frame_texture.blend_mode = pygame.BLENDMODE_BLEND
+        elif LOGICAL_RESOLUTION:
+            # O jogo é desenhado na resolução lógica e o SDL amplia a imagem para a tela inteira
+            cls.display = pygame.display.set_mode(LOGICAL_RESOLUTION, pygame.FULLSCREEN | pygame.SCALED, vsync=int(vsync))
+        else:
+            cls.display = pygame.display.set_mode((1280,720))
+            cls.display = pygame.display.set_mode((0,0), pygame.FULLSCREEN)
+            if vsync:  # O pygame só tem vsync com SCALED ou OPENGL
+                cls.pacing = 'tick'
+
+        return cls.display
+
+    @classmethod
+    def set_caption(cls, caption: str):
+        """Muda o nome da janela
+
+        Args:
+            caption (str): Nome da janela
+        """
+        pygame.display.set_caption(caption)
+        if cls.window:
+            cls.window.title = caption
+
+    @classmethod
+    def clear(cls, surface: pygame.Surface = None):
+        """Limpa a tela no começo do frame
+
+        Args:
+            surface (pygame.Surface, optional): Superfície que vai ser limpa. Defaults to a tela do jogo.
+        """
+        surface = surface or cls.display
+        if cls.backend == 'sdl2' and surface is cls.display:
+            surface.fill((0, 0, 0, 0))  # Deixo as texturas estáticas aparecerem
+        else:
+            surface.fill((0, 0, 0))
+
+    @classmethod
+    def draw_static(cls, key: str, image: pygame.Surface, rect: pygame.Rect | tuple):
+        """Desenha uma imagem que não muda. No SDL2 ela vira uma textura enviada uma vez só e fica
+        por baixo de tudo que foi desenhado na tela, então deve ser chamada antes dos outros desenhos
+
+        Args:
+            key (str): Nome único da imagem
+            image (pygame.Surface): A imagem
+            rect (pygame.Rect | tuple): Onde ela vai ser desenhada
+        """
+        if cls.backend != 'sdl2':
+            cls.display.blit(image, rect)
+            return
+
+        if key not in cls.textures:
+            cls.textures[key] = Texture.from_surface(cls.renderer, image)
+            cls.images[key] = image
+        cls.static_queue.append((key, pygame.Rect(rect[0], rect[1], *image.get_size())))
+
+    @classmethod
+    def snapshot(cls) -> pygame.Surface:
+        """Copia o que já foi desenhado nesse frame, incluindo as imagens estáticas
+
+        Returns:
+            pygame.Surface: Cópia opaca do frame
+        """
+        if cls.backend != 'sdl2':
+            return cls.display.copy()
+
+        # As imagens estáticas só existem como textura, então junto elas com a tela aqui
+        frame = pygame.Surface(cls.display.get_size()).convert()
+        for key, rect in cls.static_queue:
+            frame.blit(cls.images[key], rect)
+        frame.blit(cls.display, (0, 0))  # O alpha da tela deixa as estáticas aparecerem
+        return frame
+
+    @classmethod
+    def end_frame(cls):
+        """Mostra o frame na tela e espera o tempo do próximo (Chamada uma vez por frame, só pelo loop principal)
+        """
+        cls.__present()
+
+        # Mesmo com vsync o jogo é limitado ao FPS, já que a lógica das cenas conta frames
+        if cls.pacing == 'busy':
+            cls.clock.tick_busy_loop(FPS)
+        else:
+            cls.clock.tick(FPS)
+
+        cls.frame_times.append(cls.clock.get_time())
+
+    @classmethod
+    def get_frame_stats(cls) -> dict[str, float]:
+        """Retorna as estatísticas dos últimos frames
+
+        Returns:
+            dict[str, float]: FPS médio, tempo médio de cada frame e jitter (desvio padrão do tempo entre frames), em ms
+        """
+        if len(cls.frame_times) < 2:
+            return { 'fps': cls.clock.get_fps(), 'frame_time': 0, 'jitter': 0 }
+
+        return {
+            'fps': cls.clock.get_fps(),
+            'frame_time': statistics.fmean(cls.frame_times),
+            'jitter': statistics.pstdev(cls.frame_times),
+        }
+
+    @classmethod
+    def __present(cls):
+        """Mostra o frame na tela
+        """
+        if cls.backend != 'sdl2':
+            pygame.display.flip()
+            return
+
+        cls.renderer.draw_color = (0, 0, 0, 255)
+        cls.renderer.clear()
+
+        for key, rect in cls.static_queue:
+            cls.textures[key].draw(dstrect=rect)
+        cls.static_queue.clear()
+
+        # O resto do frame vai na mesma textura de sempre, com o alpha deixando as estáticas aparecerem
+        cls.frame_texture.update(cls.display)
+        cls.frame_texture.draw()
+        cls.renderer.present()
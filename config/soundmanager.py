@@ -1,40 +1,532 @@
 import pygame
 import os
+import io
+import json
+import hashlib
+import mmap
+import platform
+import threading
+from pathlib import Path
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
 from config import GET_PROJECT_PATH
 
 
 class SoundManager:
     """Classe responsável pelo gerenciamento dos sons do jogo
     """
-    audios: dict[str, pygame.mixer.Sound] = {
-    }  # Dicionários dos sons carregados
+    audios: OrderedDict[str, pygame.mixer.Sound] = OrderedDict(
+    )  # Dicionários dos sons carregados (Do menos para o mais recentemente tocado)
+    sizes: dict[str, int] = {}  # Quantos bytes cada som carregado ocupa
+    memory_used = 0  # Total de bytes ocupados pelos sons carregados
+    # Máximo de bytes que os sons podem ocupar antes de descarregar os menos usados. Todos os efeitos do manifesto
+    # decodificados ocupam ~4.2MB (44100Hz, 16 bits, estéreo), então eles sempre cabem juntos
+    memory_budget = 8 * 1024 * 1024
 
+    # Categorias dos sons, quanto maior a prioridade mais difícil de ser interrompido
+    categories: dict[str, dict[str, int]] = {
+        'ui': { 'priority': 3, 'limit': 2 },
+        'combat': { 'priority': 2, 'limit': 6 },
+        'voice': { 'priority': 1, 'limit': 2 },
+        'ambience': { 'priority': 0, 'limit': 2 },
+    }
     chanels: list[pygame.mixer.Channel] = [
-    ]
+    ]  # Canais do mixer controlados pelo SoundManager
+    chanels_owners: dict[int, tuple[str, int]] = {}  # Categoria e momento (ticks) do último som de cada canal
+    counters: dict[str, dict[str, int]] = {}  # Quantos sons de cada categoria foram tocados, interromperam outro ou foram descartados
+
+    manifest: dict[str, list[str]] = {
+        'music': [],  # Músicas, tocadas apenas por streaming no pygame.mixer.music
+        'sfx': [],  # Efeitos sonoros curtos, que ficam carregados na memória
+        'scenes': {},  # Efeitos que cada cena usa, carregados primeiro quando ela começa
+        'pinned': [],  # Efeitos que nunca são descarregados
+        'categories': {},  # Categoria dos efeitos que não são de combate
+    }  # Manifesto dos sons (infos/sounds.json)
+
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='sound')  # Threads que carregam os efeitos
+    pending: deque[str] = deque()  # Fila de efeitos esperando para serem carregados
+    loading: dict[str, threading.Event] = {}  # Efeitos já pedidos, o evento indica quando terminaram de carregar
+    wanted: set[str] = set()  # Efeitos pedidos com prioridade, que entram como mais recentes ao carregar
+    lock = threading.Lock()
+    load_timeout = 0.05  # Quantos segundos o play_sound espera por um efeito que ainda não carregou
+    use_cache = True  # Se os efeitos decodificados são guardados em disco para as próximas execuções
+    cache_index: dict[str, list] = None  # Hash de cada efeito pelo caminho: [mtime, tamanho, hash] (index.json no cache)
+
+    music_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='music')  # Thread que lê as músicas
+    music_files: dict[str, Future] = {}  # Músicas lidas (ou sendo lidas) em segundo plano
+    next_music: dict = None  # Música esperando a anterior terminar o fade ou o arquivo terminar de ser lido
+    music_max_wait = 500  # Quantos milisegundos esperar a leitura antes de carregar a música direto do disco
+
+    voice_max_rate = 15  # Máximo de vozes tocadas por segundo
+    last_voice_time = -1000
 
     volume = 1  # Volume geral (Todo som vai ter o mesmo volume)
 
     @classmethod
-    def add_chanel(cls):
-        cls.chanels.append(pygame.mixer.Channel(len(cls.chanels)))
+    def load_manifest(cls):
+        """Carrega o manifesto que separa as músicas dos efeitos sonoros
+        """
+        with open(os.path.join(GET_PROJECT_PATH(), 'infos', 'sounds.json'), encoding="utf-8") as file:
+            cls.manifest = json.load(file)
 
     @classmethod
-    def is_chanel_playing(cls, id: int):
-        return cls.chanels[id].get_busy()
-    
+    def is_music(cls, sound_name: str) -> bool:
+        """Retorna se o arquivo é uma música (Só pode ser tocado por streaming)
+
+        Args:
+            sound_name (str): Nome do arquivo
+        """
+        return sound_name in cls.manifest['music'] or 'msc' in sound_name.split('_')
+
+    @classmethod
+    def request_sounds(cls, sound_names: list[str], priority: bool = False):
+        """Coloca os efeitos na fila para serem carregados em segundo plano
+
+        Args:
+            sound_names (list[str]): Nomes dos arquivos
+            priority (bool, optional): Se os efeitos devem passar na frente da fila. Defaults to False.
+        """
+        with cls.lock:
+            # Na prioridade adiciono de trás para frente, assim a ordem passada é mantida no começo da fila
+            for sound_name in (reversed(sound_names) if priority else sound_names):
+                if sound_name in cls.audios:
+                    if priority:  # Vai ser usado em breve, então não deve ser descarregado
+                        cls.audios.move_to_end(sound_name)
+                    continue
+
+                if cls.is_music(sound_name):
+                    continue
+
+                if priority:
+                    cls.wanted.add(sound_name)
+
+                if sound_name in cls.loading:  # Já foi pedido
+                    if priority and sound_name in cls.pending:  # Mas ainda não começou a carregar
+                        cls.pending.remove(sound_name)
+                        cls.pending.appendleft(sound_name)
+                    continue
+
+                cls.loading[sound_name] = threading.Event()
+                if priority:
+                    cls.pending.appendleft(sound_name)
+                else:
+                    cls.pending.append(sound_name)
+
+                # Cada tarefa carrega o primeiro da fila, não necessariamente o que foi pedido agora
+                cls.executor.submit(cls.load_next_sound)
+
+    @staticmethod
+    def get_cache_path() -> str:
+        """Retorna a pasta onde ficam os efeitos já decodificados, criando ela caso não exista
+        """
+        if platform.system() == 'Windows':
+            cache_path = os.path.join(Path.home(), 'AppData', 'Local', 'emaptale', 'cache', 'sounds')
+        else:
+            cache_path = os.path.join(Path.home(), '.cache', 'emaptale', 'sounds')
+
+        os.makedirs(cache_path, exist_ok=True)
+        return cache_path
+
+    @classmethod
+    def load_cache_index(cls) -> dict[str, list]:
+        """Lê o índice de hashes do cache na primeira vez que ele é usado (Deve ser chamada com o lock)
+
+        Returns:
+            dict[str, list]: O índice
+        """
+        if cls.cache_index is None:
+            try:
+                with open(os.path.join(cls.get_cache_path(), 'index.json'), encoding='utf-8') as file:
+                    cls.cache_index = json.load(file)
+            except (OSError, ValueError):
+                cls.cache_index = {}
+        return cls.cache_index
+
+    @classmethod
+    def save_cache_index(cls):
+        """Salva o índice de hashes no cache (Deve ser chamada com o lock)
+        """
+        index_file = os.path.join(cls.get_cache_path(), 'index.json')
+        try:
+            with open(f'{index_file}.tmp', 'w', encoding='utf-8') as file:
+                json.dump(cls.cache_index, file)
+            os.replace(f'{index_file}.tmp', index_file)
+        except OSError:
+            pass  # Sem o índice os hashes só são calculados de novo na próxima execução
+
+    @classmethod
+    def get_file_hash(cls, sound_path: str) -> str:
+        """Retorna o hash do conteúdo de um efeito, lendo o arquivo só se o mtime ou o tamanho mudaram desde a última vez
+
+        Args:
+            sound_path (str): Caminho do arquivo original
+
+        Returns:
+            str: O hash do arquivo
+        """
+        stat = os.stat(sound_path)
+        with cls.lock:
+            entry = cls.load_cache_index().get(sound_path)
+
+        if entry and entry[:2] == [stat.st_mtime_ns, stat.st_size]:
+            return entry[2]
+
+        with open(sound_path, 'rb') as file:
+            file_hash = hashlib.sha1(file.read()).hexdigest()
+
+        with cls.lock:
+            cls.cache_index[sound_path] = [stat.st_mtime_ns, stat.st_size, file_hash]
+            cls.save_cache_index()
+        return file_hash
+
+    @classmethod
+    def get_cache_name(cls, sound_path: str, file_hash: str, mixer_settings: tuple) -> str:
+        """Retorna o nome do arquivo de cache de um efeito
+
+        Args:
+            sound_path (str): Caminho do arquivo original
+            file_hash (str): Hash do conteúdo do arquivo
+            mixer_settings (tuple): Formato do mixer (Frequência, formato, canais)
+        """
+        return f'{os.path.basename(sound_path)}-{file_hash}-{"_".join(str(s) for s in mixer_settings)}.pcm'
+
+    @classmethod
+    def get_cache_file(cls, sound_path: str) -> str | None:
+        """Retorna o arquivo de cache de um efeito, que depende do conteúdo do arquivo e do formato do mixer
+
+        Args:
+            sound_path (str): Caminho do arquivo original
+
+        Returns:
+            str | None: Caminho do arquivo de cache ou None se o mixer não foi iniciado
+        """
+        mixer_settings = pygame.mixer.get_init()  # (Frequência, formato, canais)
+        if not mixer_settings:
+            return None
+
+        return os.path.join(cls.get_cache_path(), cls.get_cache_name(sound_path, cls.get_file_hash(sound_path), mixer_settings))
+
+    @classmethod
+    def prune_cache(cls):
+        """Apaga os efeitos decodificados que nenhum arquivo atual usa (O arquivo mudou ou o formato do mixer é outro)
+        (Executada nas threads de carregamento)
+        """
+        mixer_settings = pygame.mixer.get_init()
+        if not mixer_settings:
+            return
+
+        try:
+            cache_path = cls.get_cache_path()
+            with cls.lock:
+                # Entradas de arquivos que mudaram ou não existem mais saem do índice
+                for sound_path, (mtime, size, _) in list(cls.load_cache_index().items()):
+                    try:
+                        stat = os.stat(sound_path)
+                    except OSError:
+                        stat = None
+                    if stat is None or (stat.st_mtime_ns, stat.st_size) != (mtime, size):
+                        del cls.cache_index[sound_path]
+                cls.save_cache_index()
+
+                keep = {
+                    cls.get_cache_name(sound_path, file_hash, mixer_settings)
+                    for sound_path, (_, _, file_hash) in cls.cache_index.items()
+                }
+
+                # Apago ainda com o lock: um arquivo com nome novo só é escrito depois do carregamento colocar o hash
+                # no índice (Com o lock), então nenhum cache criado durante o prune é apagado
+                for file_name in os.listdir(cache_path):
+                    if file_name.endswith('.pcm') and file_name not in keep:
+                        os.remove(os.path.join(cache_path, file_name))
+        except OSError:
+            pass  # O cache é só uma otimização
+
+    @classmethod
+    def decode_sound(cls, sound_name: str) -> pygame.mixer.Sound:
+        """Decodifica um efeito, reaproveitando o PCM salvo em disco por execuções anteriores
+
+        Args:
+            sound_name (str): Nome do arquivo
+
+        Returns:
+            pygame.mixer.Sound: O som decodificado
+        """
+        sound_path = os.path.join(GET_PROJECT_PATH(), 'sounds', sound_name)
+        try:
+            cache_file = cls.get_cache_file(sound_path) if cls.use_cache else None
+        except OSError:  # Sem permissão para criar a pasta de cache, só decodifico normalmente
+            cache_file = None
+
+        if cache_file and os.path.exists(cache_file) and os.path.getsize(cache_file) > 0:
+            # O PCM já está no formato do mixer, então só mapeio o arquivo e passo ele como buffer
+            with open(cache_file, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return pygame.mixer.Sound(buffer=buffer)
+
+        sound = pygame.mixer.Sound(sound_path)
+
+        if cache_file:
+            # Escrevo em um arquivo temporário e depois renomeio, assim nunca fica um cache pela metade
+            temporary_file = f'{cache_file}.{threading.get_ident()}.tmp'
+            try:
+                with open(temporary_file, 'wb') as file:
+                    file.write(sound.get_raw())
+                os.replace(temporary_file, cache_file)
+            except OSError:
+                pass  # O cache é só uma otimização, o som já foi decodificado
+
+        return sound
+
+    @classmethod
+    def load_next_sound(cls):
+        """Carrega o primeiro efeito da fila (Executada nas threads de carregamento)
+        """
+        with cls.lock:
+            if not cls.pending:
+                return
+            sound_name = cls.pending.popleft()
+            loaded = cls.loading[sound_name]  # O forget_sound pode tirar o evento do dicionário antes do fim
+
+        try:
+            sound = cls.decode_sound(sound_name)
+            with cls.lock:
+                cls.audios[sound_name] = sound
+                if sound_name not in cls.wanted:  # Carregado só por antecipação, é o primeiro a sair
+                    cls.audios.move_to_end(sound_name, last=False)
+                cls.wanted.discard(sound_name)
+
+                cls.sizes[sound_name] = memoryview(sound).nbytes
+                cls.memory_used += cls.sizes[sound_name]
+                cls.enforce_budget()
+        finally:
+            loaded.set()
+
+    @classmethod
+    def forget_sound(cls, sound_name: str):
+        """Remove um som da memória (Deve ser chamada com o lock)
+
+        Args:
+            sound_name (str): Nome do arquivo
+        """
+        del cls.audios[sound_name]
+        cls.memory_used -= cls.sizes.pop(sound_name)
+        cls.loading.pop(sound_name, None)  # Assim ele pode ser pedido de novo
+
+    @classmethod
+    def enforce_budget(cls):
+        """Descarrega os sons tocados há mais tempo até caber no orçamento de memória (Deve ser chamada com o lock)
+        """
+        for sound_name in list(cls.audios.keys()):
+            if cls.memory_used <= cls.memory_budget:
+                break
+
+            # Não descarrego os sons fixados nem os que estão tocando agora
+            if sound_name in cls.manifest['pinned'] or cls.audios[sound_name].get_num_channels() > 0:
+                continue
+
+            cls.forget_sound(sound_name)
+
+    @classmethod
+    def prioritize_scene(cls, scene: str):
+        """Passa os efeitos usados por uma cena para a frente da fila de carregamento
+
+        Args:
+            scene (str): Nome da cena
+        """
+        cls.request_sounds(cls.manifest['scenes'].get(scene, []), priority=True)
+
+    @classmethod
+    def get_sound(cls, sound_name: str, timeout: float = None) -> pygame.mixer.Sound | None:
+        """Retorna o som pelo nome, pedindo para ele ser carregado caso ainda não esteja na memória
+
+        Args:
+            sound_name (str): Nome do arquivo
+            timeout (float, optional): Quanto tempo esperar pelo carregamento. Defaults to load_timeout.
+
+        Raises:
+            ValueError: Se o arquivo for uma música, que deve ser tocada com play_music
+
+        Returns:
+            pygame.mixer.Sound | None: O som carregado ou None se ele não ficou pronto a tempo
+        """
+        with cls.lock:
+            if sound_name in cls.audios:
+                cls.audios.move_to_end(sound_name)  # Agora ele é o mais recente
+                return cls.audios[sound_name]
+
+        if cls.is_music(sound_name):
+            raise ValueError(f"{sound_name} é uma música, use o play_music")
+
+        cls.request_sounds([sound_name], priority=True)
+        with cls.lock:
+            loaded = cls.loading.get(sound_name)  # Sem evento, o som terminou de carregar (Ou já foi descarregado)
+        if loaded is not None:
+            loaded.wait(cls.load_timeout if timeout is None else timeout)
+        return cls.audios.get(sound_name)
+
+    @classmethod
+    def setup_channels(cls):
+        """Cria os canais de cada categoria e reserva eles, assim o mixer nunca escolhe um canal sozinho
+        """
+        if cls.chanels or not pygame.mixer.get_init():
+            return
+
+        total = sum(category['limit'] for category in cls.categories.values())
+        pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)
+        cls.chanels = [pygame.mixer.Channel(i) for i in range(total)]
+        cls.counters = { name: { 'played': 0, 'stolen': 0, 'dropped': 0 } for name in cls.categories }
+
     @classmethod
-    def play_music(cls, file: str, loop: int = 0, start: float = 0, fade_ms: int = 0):
-        """Dou play na música que foi passada
+    def get_category(cls, sound_name: str) -> str:
+        """Retorna a categoria de um efeito pelo manifesto (Por padrão é de combate)
+
+        Args:
+            sound_name (str): Nome do arquivo
+        """
+        for category, sounds in cls.manifest['categories'].items():
+            if sound_name in sounds:
+                return category
+        return 'combat'
+
+    @classmethod
+    def allocate_chanel(cls, category: str) -> pygame.mixer.Channel | None:
+        """Escolhe um canal para um som da categoria, interrompendo um som menos importante se precisar
+
+        Args:
+            category (str): Categoria do som
+
+        Returns:
+            pygame.mixer.Channel | None: O canal escolhido ou None se o som deve ser descartado
+        """
+        priority = cls.categories[category]['priority']
+        busy = [i for i, channel in enumerate(cls.chanels) if channel.get_busy()]
+        same_category = [i for i in busy if cls.chanels_owners[i][0] == category]
+
+        if len(same_category) >= cls.categories[category]['limit']:
+            # A categoria já está no limite, então interrompo o som mais antigo dela
+            chosen = min(same_category, key=lambda i: cls.chanels_owners[i][1])
+            cls.counters[category]['stolen'] += 1
+        else:
+            chosen = next((i for i, channel in enumerate(cls.chanels) if not channel.get_busy()), None)
+
+            if chosen is None:
+                # Nenhum canal livre, interrompo o som mais antigo da categoria menos importante
+                lower = [i for i in busy if cls.categories[cls.chanels_owners[i][0]]['priority'] < priority]
+                if not lower:
+                    cls.counters[category]['dropped'] += 1
+                    return None
+
+                chosen = min(lower, key=lambda i: (cls.categories[cls.chanels_owners[i][0]]['priority'], cls.chanels_owners[i][1]))
+                cls.counters[category]['stolen'] += 1
+
+        cls.chanels_owners[chosen] = (category, pygame.time.get_ticks())
+        cls.counters[category]['played'] += 1
+        return cls.chanels[chosen]
+
+    @classmethod
+    def play_voice(cls, sound_name: str):
+        """Toca o som de voz de um texto, limitando quantas vezes por segundo isso acontece
+
+        Args:
+            sound_name (str): Nome do arquivo da voz
+        """
+        now = pygame.time.get_ticks()
+        if now - cls.last_voice_time < 1000/cls.voice_max_rate:  # Tocou há pouco tempo, pulo essa letra
+            return
+
+        sound = cls.get_sound(sound_name)
+        if not sound or not cls.chanels:
+            return
+        cls.last_voice_time = now
+
+        # Se a mesma voz ainda estiver tocando, recomeço ela no mesmo canal
+        channel = next((channel for channel in cls.chanels if channel.get_sound() == sound), None)
+        if channel:
+            cls.chanels_owners[cls.chanels.index(channel)] = ('voice', now)
+        else:
+            channel = cls.allocate_chanel('voice')
+
+        if channel:
+            channel.play(sound)
+
+    @staticmethod
+    def read_music(file: str) -> bytes:
+        """Lê o arquivo da música inteiro (Executada na thread das músicas)
+
+        Args:
+            file (str): Caminho da música
+        """
+        with open(file, 'rb') as music_file:
+            return music_file.read()
+
+    @classmethod
+    def prefetch_music(cls, file: str):
+        """Começa a ler uma música em segundo plano, assim ela toca sem travar o jogo. Só uma música fica
+        antecipada por vez (Além da que está esperando para tocar), a anterior é descartada
+
+        Args:
+            file (str): Caminho da música
+        """
+        for other in list(cls.music_files):
+            if other != file and not (cls.next_music and cls.next_music['file'] == other):
+                cls.music_files.pop(other).cancel()  # Não foi tocada, então libero os bytes
+
+        if file not in cls.music_files:
+            cls.music_files[file] = cls.music_executor.submit(cls.read_music, file)
+
+    @classmethod
+    def play_music(cls, file: str, loop: int = 0, start: float = 0, fade_ms: int = 0, crossfade_ms: int = 0):
+        """Dou play na música que foi passada (Ela começa quando estiver pronta, sem travar o jogo)
 
         Args:
             file (str): Caminho da música
             loop (int, optional): Quantas vezes vai dar loop, -1 repete indefinidamente. Defaults to 0.
             start (int, float): Momento no tempo em que a música é tocada. Defaults to 0.
             fade_ms (int, optional): Em quantos milisegundos a música vai se esvair até o volume 0. Defaults to 0.
+            crossfade_ms (int, optional): Em quantos milisegundos a música atual some antes da nova entrar. Defaults to 0.
+        """
+        if cls.next_music and cls.next_music['file'] != file:  # A música que ia tocar foi trocada
+            cls.music_files.pop(cls.next_music['file'], None)
+
+        cls.prefetch_music(file)
+        cls.next_music = {
+            'file': file,
+            'loop': loop,
+            'start': start,
+            'fade_ms': fade_ms or crossfade_ms,  # A nova música entra com o mesmo fade da antiga
+            'requested': pygame.time.get_ticks(),
+            'deadline': pygame.time.get_ticks() + crossfade_ms,
+        }
+
+        if crossfade_ms and pygame.mixer.music.get_busy():
+            pygame.mixer.music.fadeout(crossfade_ms)
+
+        cls.update_music()
+
+    @classmethod
+    def update_music(cls):
+        """Começa a próxima música quando a anterior terminou o fade e o arquivo já foi lido (Chamada todo frame)
         """
-        pygame.mixer.music.unload()  
-        pygame.mixer.music.load(file)
-        pygame.mixer.music.play(loop, start, fade_ms)
+        if not cls.next_music:
+            return
+
+        now = pygame.time.get_ticks()
+        if pygame.mixer.music.get_busy() and now < cls.next_music['deadline']:  # Ainda no fade da anterior
+            return
+
+        future = cls.music_files[cls.next_music['file']]
+        if not future.done() and now - cls.next_music['requested'] < cls.music_max_wait:
+            return
+
+        music, cls.next_music = cls.next_music, None
+        del cls.music_files[music['file']]  # O pygame guarda os bytes enquanto a música toca
+
+        pygame.mixer.music.unload()
+        if future.done() and not future.exception():
+            pygame.mixer.music.load(io.BytesIO(future.result()), os.path.splitext(music['file'])[1][1:])
+        else:  # A leitura demorou ou falhou, carrego direto do disco
+            pygame.mixer.music.load(music['file'])
+        pygame.mixer.music.play(music['loop'], music['start'], music['fade_ms'])
     
     @staticmethod
     def unload_music(cls):
@@ -43,23 +535,31 @@ class SoundManager:
         pygame.mixer.music.unload()
     
     @classmethod
-    def load_all_sounds(cls):
-        """Carrega todos os sons da pasta de sons
+    def load_all_sounds(cls, scene: str = None):
+        """Começa a carregar em segundo plano todos os efeitos sonoros listados no manifesto
+
+        Args:
+            scene (str, optional): Cena que vai aparecer primeiro, os efeitos dela são carregados antes. Defaults to None.
         """
-        # Eu pego o local da pasta independente do sistema
-        base_path = os.path.join(GET_PROJECT_PATH(), 'sounds')
-        for sound in os.scandir(base_path):  # Para cada arquivo dentro da pasta de sons
-            if 'msc' not in sound.name.split('_'):
-                # Eu não carrego os arquivos do tipo "msc" pois
-                #são músicas de fundo (Longas), vou carregar apenas os efeitos sonoros
-                cls.audios[sound.name] = pygame.mixer.Sound(os.path.join(base_path, sound.name))
+        cls.load_manifest()
+        cls.setup_channels()
+
+        # As músicas não são carregadas, elas são longas e tocadas por streaming,
+        #então só decodifico os efeitos sonoros curtos
+        cls.request_sounds(cls.manifest['sfx'])
+        if scene:
+            cls.prioritize_scene(scene)
+
+        if cls.use_cache:
+            cls.executor.submit(cls.prune_cache)
     
     @classmethod
     def unload_sounds(cls):
         """Deleto todos os sons que eu carreguei
         """
-        for key in cls.audios.keys():
-            del cls.audios[key]
+        with cls.lock:
+            for sound_name in list(cls.audios.keys()):  # Copio as chaves, já que o dicionário muda
+                cls.forget_sound(sound_name)
     
     @classmethod
     def load_and_play(cls, sound):
@@ -68,19 +568,30 @@ class SoundManager:
         Args:
             sound (str): Nome do arquivo
         """
-        pygame.mixer.Sound(os.path.join(GET_PROJECT_PATH(), 'sounds', sound)).play()
+        channel = cls.allocate_chanel(cls.get_category(sound)) if cls.chanels else None
+        if channel:
+            channel.play(pygame.mixer.Sound(os.path.join(GET_PROJECT_PATH(), 'sounds', sound)))
     
     @classmethod
-    def play_sound(cls, sound_name: str, channel: int = None, loops: int = 0):
+    def play_sound(cls, sound_name: str, category: str = None, loops: int = 0) -> pygame.mixer.Channel | None:
         """Tocar um son pelo nome passado
 
         Args:
             sound_name (str): Nome do arquivo que deve ser tocado
+            category (str, optional): Categoria do som. Defaults to a categoria do manifesto.
+            loops (int, optional): Quantas vezes o som repete. Defaults to 0.
+
+        Returns:
+            pygame.mixer.Channel | None: Canal onde o som está tocando ou None se ele foi pulado
         """
-        if channel != None:
-            cls.chanels[channel].play(cls.audios[sound_name])
-        else:
-            cls.audios[sound_name].play(loops=loops)
+        sound = cls.get_sound(sound_name)
+        if not sound or not cls.chanels:  # Ainda não carregou, pulo esse som
+            return None
+
+        channel = cls.allocate_chanel(category or cls.get_category(sound_name))
+        if channel:
+            channel.play(sound, loops=loops)
+        return channel
 
     @classmethod
     def stop_sound(cls, sound_name: str):
@@ -89,12 +600,15 @@ class SoundManager:
         Args:
             sound_name (str): Nome do som
         """
-        cls.audios[sound_name].stop()
+        sound = cls.audios.get(sound_name)
+        if sound:  # Se ele não está carregado, não está tocando
+            sound.stop()
     
-    @staticmethod
-    def stop_music():
-        """Paro a música
+    @classmethod
+    def stop_music(cls):
+        """Paro a música (E cancelo a que estava esperando para tocar)
         """
+        cls.next_music = None
         pygame.mixer.music.stop()
     
     @staticmethod
@@ -109,11 +623,11 @@ class SoundManager:
         """
         pygame.mixer.music.unpause()
     
-    @staticmethod
-    def is_playing():
-        """Retorna se o canal de música está sendo utilizado
+    @classmethod
+    def is_playing(cls):
+        """Retorna se o canal de música está sendo utilizado (Ou se tem uma música para começar)
         """
-        return pygame.mixer.music.get_busy()
+        return pygame.mixer.music.get_busy() or cls.next_music is not None
     
 
     # @property
@@ -0,0 +1,69 @@
+import pygame
+from concurrent.futures import ThreadPoolExecutor, Future
+
+from classes.text.prepared_text import PreparedText
+
+
+class TextManager:
+    """Classe responsável por preparar os textos (quebrar em linhas e renderizar) em uma thread separada,
+    assim eles ficam prontos antes de aparecerem na tela
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='text')  # Thread que prepara os textos
+    prepared: dict[tuple, Future] = {}  # Textos que já foram pedidos (Texto, fonte, tamanho, largura máxima e cor -> resultado)
+    fonts: dict[tuple, pygame.font.Font] = {}  # Fontes usadas apenas pela thread dos textos
+
+    @classmethod
+    def get_font(cls, font: str, size: int) -> pygame.font.Font:
+        """Retorna a fonte usada para preparar os textos, carregando ela na primeira vez
+
+        Args:
+            font (str): Caminho da fonte
+            size (int): Tamanho da fonte
+        """
+        if (font, size) not in cls.fonts:
+            cls.fonts[(font, size)] = pygame.font.Font(font, size)
+        return cls.fonts[(font, size)]
+
+    @classmethod
+    def prepare(cls, text: str, font: str, size: int, max_length: float, color: pygame.Color = (255,255,255)):
+        """Pede para o texto ser preparado em segundo plano
+
+        Args:
+            text (str): Texto completo
+            font (str): Caminho da fonte
+            size (int): Tamanho da fonte
+            max_length (float): Largura máxima de cada linha
+            color (pygame.Color, optional): Cor do texto. Defaults to (255,255,255).
+        """
+        key = (text, font, size, max_length, tuple(color))
+        if key in cls.prepared:  # Já foi pedido com a mesma largura
+            return
+
+        cls.prepared[key] = cls.executor.submit(PreparedText, text, cls.get_font(font, size), max_length, color)
+
+    @classmethod
+    def get(cls, text: str, font: str, size: int, max_length: float, color: pygame.Color = (255,255,255)) -> PreparedText | None:
+        """Retorna o texto preparado, caso ele já esteja pronto
+
+        Args:
+            text (str): Texto completo
+            font (str): Caminho da fonte
+            size (int): Tamanho da fonte
+            max_length (float): Largura em que o texto vai ser mostrado (As linhas só servem se foram quebradas nela)
+            color (pygame.Color, optional): Cor do texto. Defaults to (255,255,255).
+
+        Returns:
+            PreparedText | None: O texto preparado ou None se ele não foi pedido nessa largura ou ainda não terminou
+        """
+        future = cls.prepared.get((text, font, size, max_length, tuple(color)))
+        if future is None or not future.done() or future.cancelled() or future.exception():
+            return None
+        return future.result()
+
+    @classmethod
+    def clear(cls):
+        """Descarta todos os textos preparados (Os que ainda não começaram nem chegam a ser preparados)
+        """
+        for future in cls.prepared.values():
+            future.cancel()
+        cls.prepared.clear()
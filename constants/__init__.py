@@ -11,3 +11,7 @@ BOSS_ACT_EFFECT = pygame.USEREVENT + 4
 
 STOP_HEART_COLOR = (5, 153, 245)
 MOVE_HEART_COLOR = (255, 145, 0)
+
+# Ordem das camadas desenhadas por cima da batalha (CombatManager.add_layer)
+PROJECTILES_LAYER = 0  # Projéteis, embaixo do coração
+OVERLAY_LAYER = 100  # Por cima de tudo, inclusive do coração
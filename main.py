@@ -8,6 +8,7 @@ from config.gamestatemanager import GameStateManager
 from config.fontmanager import FontManager
 from config.savemanager import SaveManager
 from config.eventmanager import EventManager
+from config.rendermanager import RenderManager
 
 from classes.player import Player
 
@@ -38,20 +39,16 @@ class Game:
         # Player.load_infos()
         
         # Colocando o tamanho da Tela
-        self.display = pygame.display.set_mode((1280,720))
-        self.display = pygame.display.set_mode((0,0), pygame.FULLSCREEN)
+        self.display = RenderManager.setup()
 
         # Variável que indica se o jogo da rodando
         self.running = True
 
         # Colocando o nome da tela
-        pygame.display.set_caption(GAME_NAME)
-
-        # Criando o objeto do relógio
-        self.clock = pygame.time.Clock()
+        RenderManager.set_caption(GAME_NAME)
 
         # Inicializando outras coisas
-        SoundManager.load_all_sounds()  # Carregando todos os efeitos sonoros do jogo
+        SoundManager.load_all_sounds(GameStateManager.current_state)  # Carregando em segundo plano todos os efeitos sonoros do jogo
 
         # === Definindo as cenas do jogo ===
         # Cenas do Menu
@@ -105,20 +102,18 @@ class Game:
     def run(self):
         while self.running:
             self.handle_events()
+            SoundManager.update_music()  # Começa a próxima música quando ela estiver pronta
 
-            game.display.fill((0, 0, 0))
+            RenderManager.clear(game.display)
 
             # Trocando de Cena
             GameStateManager.get_current_state().run()
 
-            # Atualizando
-            pygame.display.flip()
-
-            # Limitando FPS
-            self.clock.tick(FPS)
+            # Atualizando e limitando o FPS
+            RenderManager.end_frame()
     
     def change_window_name(self, name: str):
-        pygame.display.set_caption(name)
+        RenderManager.set_caption(name)
 
 
 if __name__ == '__main__':
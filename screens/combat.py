@@ -15,13 +15,16 @@ from classes.battle.menus.fight_menu import FightMenu
 from classes.battle.menus.mercy_menu import MercyMenu
 
 from classes.text.dynamic_text import DynamicText
+from classes.effects.compositor import Compositor
 from classes.text.text import Text
 
 from config.globalmanager import GlobalManager
 from config.soundmanager import SoundManager
 from config.fontmanager import FontManager
 from config.combatmanager import CombatManager
+from config.textmanager import TextManager
 from config.eventmanager import EventManager
+from config.rendermanager import RenderManager
 from config.gamestatemanager import GameStateManager
 
 from classes.battle.heart import Heart
@@ -50,10 +53,6 @@ class Combat(State):
         self.player_group = pygame.sprite.Group()  # Grupo do player
         CombatManager.set_variable('player_group', self.player_group)
 
-        # Adiciono dois canais específicos
-        SoundManager.add_chanel()
-        SoundManager.add_chanel()
-
         # ============ VARIÁVEIS DO HUD ============
         # Carregando o background da batalha
         self.background = pygame.transform.scale(
@@ -110,32 +109,28 @@ class Combat(State):
     def on_first_execution(self):
         # Limpando os sons
         self.__execution_counter += 1
-        SoundManager.stop_music()
         self.act_menu.options.clear()
         self.act_menu.options = self.__variables['enemy']['act']
 
         CombatManager.turn = 'player'
         BattleMenuManager.active_menu = 'MainMenu'
 
-        SoundManager.play_music(os.path.join(GET_PROJECT_PATH(), 'sounds', CombatManager.enemy.music))
+        SoundManager.play_music(os.path.join(GET_PROJECT_PATH(), 'sounds', CombatManager.enemy.music), crossfade_ms=500)
 
         self.starter_text.restart(self.__variables['enemy']['starter_text'])
 
         Player.load_infos()
 
         # Variáveis para quando o Boss morrer
-        self.opacity_helper_surface = pygame.Surface(self.__display.get_size(), pygame.SRCALPHA)
-        self.opacity_helper_surface.fill(pygame.Color(0,0,0,0))
-
         self.transition_rate = FPS
 
         self.transition_counter = 0
+        self.cymbal_chanel: pygame.mixer.Channel = None  # Canal do som que toca quando o boss morre
+        self.brake_heart_stage = None  # Etapa da animação de Game Over ('broken' ou 'sherds')
 
-        self.white_transition_surface = pygame.Surface(self.__display.get_size(), pygame.SRCALPHA)
-        self.transition_alpha = 0
+        self.transition_alpha = 0  # Opacidade do branco adicionado a cada frame
+        self.transition_opacity = 0  # Opacidade acumulada do branco que cobre a tela
         self.transition_counter = 0
-        self.white_transition_surface.fill(pygame.Color(255,255,255,self.transition_alpha))
-        self.opacity_helper_surface.blit(self.white_transition_surface, self.white_transition_surface.get_rect())
 
         self.go_to_next_screen_transition_time = FPS  # Demora 1 segundo para sair do combate e ir pro próximo dia
         self.go_to_next_screen_transition_measurer = 0
@@ -160,65 +155,58 @@ class Combat(State):
                 )
 
 
-    def brake_heart_animation(self, heart_position, sprites):
-        scale_factor = 1.3  
-        broken = sprites[0]
-        sherd_1 = pygame.transform.scale_by(sprites[1], scale_factor)
-        sherd_2 = pygame.transform.scale_by(sprites[2], scale_factor)
-        sherd_3 = pygame.transform.scale_by(sprites[3], scale_factor)
-        sherd_4 = pygame.transform.scale_by(sprites[3], scale_factor)
-        sherd_5 = pygame.transform.scale_by(sprites[2], scale_factor)
-        sherd_6 = pygame.transform.scale_by(sprites[2], scale_factor)
-
-        # Variáveis para manipular o movimento dos cacos
-        sherd_positions = [list(heart_position) for n in range(6)]
-        sherd_speed = [(-1, -3), (0, -3), (2, -3), (-2, 1), (-1, -5), (-2, -1)]  # Velocidades iniciais (x, y)
-        gravity = 0.1
-
-        # Delay
-        delay_broken_to_sherds = 2000  
-        start_time = pygame.time.get_ticks() 
+    def start_brake_heart_animation(self):
+        """Começa a animação do coração quebrando (Game Over)
+        """
+        # Parar todas as ações
+        pygame.time.set_timer(BOSS_TURN_EVENT, 0)
+        pygame.time.set_timer(PLAYER_TURN_EVENT, 0)
+        SoundManager.stop_music()
+        SoundManager.play_sound('break_heart_1.wav')
 
-        stage = "broken"  
-        running = True
+        scale_factor = 1.3
+        self.heart_position = self.player.rect.center  # Posição do coração quando o player morreu
+        self.sherds = [  # Sprites dos cacos
+            pygame.transform.scale_by(self.heart_sherd[i], scale_factor) for i in (1, 2, 3, 3, 2, 2)
+        ]
 
-        while running:
-            current_time = pygame.time.get_ticks()
-            elapsed_time = current_time - start_time  
+        # Variáveis para manipular o movimento dos cacos
+        self.sherd_positions = [list(self.heart_position) for n in range(6)]
+        self.sherd_speed = [(-1, -3), (0, -3), (2, -3), (-2, 1), (-1, -5), (-2, -1)]  # Velocidades iniciais (x, y)
 
-            # Limpar tela
-            self.__display.fill((0, 0, 0))
+        self.brake_heart_stage = 'broken'
+        self.brake_heart_start_time = pygame.time.get_ticks()
 
-            if stage == "broken":
-                broken_rect = broken.get_rect(center=heart_position)
-                self.__display.blit(broken, broken_rect)
+    def brake_heart_animation(self):
+        """Desenha um frame da animação do coração quebrando
+        """
+        gravity = 0.1
+        delay_broken_to_sherds = 2000
+        elapsed_time = pygame.time.get_ticks() - self.brake_heart_start_time
 
-                if elapsed_time >= delay_broken_to_sherds:
-                    SoundManager.play_sound('break_heart_2.wav')
-                    stage = "sherds"  
+        # Limpar tela
+        self.__display.fill((0, 0, 0))
 
-            elif stage == "sherds":
-                for i, (vx, vy) in enumerate(sherd_speed):
-                    sherd_positions[i][0] += vx  # Atualizar posição x
-                    sherd_positions[i][1] += vy  # Atualizar posição y
-                    sherd_speed[i] = (vx, vy + gravity)  
+        if self.brake_heart_stage == 'broken':
+            broken_rect = self.heart_sherd[0].get_rect(center=self.heart_position)
+            self.__display.blit(self.heart_sherd[0], broken_rect)
 
-                # Desenhar os cacos
-                self.__display.blit(sherd_1, sherd_positions[0])
-                self.__display.blit(sherd_2, sherd_positions[1])
-                self.__display.blit(sherd_3, sherd_positions[2])
-                self.__display.blit(sherd_4, sherd_positions[3])
-                self.__display.blit(sherd_5, sherd_positions[4])
-                self.__display.blit(sherd_6, sherd_positions[5])
+            if elapsed_time >= delay_broken_to_sherds:
+                SoundManager.play_sound('break_heart_2.wav')
+                self.brake_heart_stage = 'sherds'
 
-            pygame.display.flip()
+        elif self.brake_heart_stage == 'sherds':
+            for i, (vx, vy) in enumerate(self.sherd_speed):
+                self.sherd_positions[i][0] += vx  # Atualizar posição x
+                self.sherd_positions[i][1] += vy  # Atualizar posição y
+                self.sherd_speed[i] = (vx, vy + gravity)
 
-            clock = pygame.time.Clock()
-            clock.tick(60)
+            # Desenhar os cacos
+            for sherd, position in zip(self.sherds, self.sherd_positions):
+                self.__display.blit(sherd, position)
 
-            if elapsed_time > 4500:
-                GameStateManager.set_state('gameover_cutscene')
-                return
+        if elapsed_time > 4500:
+            GameStateManager.set_state('gameover_cutscene')
 
 
     def run(self):
@@ -228,19 +216,10 @@ class Combat(State):
         
         # ============ GAME OVER ============
         if Player.life == 0:
-            # Parar todas as ações, deixar fundo preto
-            pygame.time.set_timer(BOSS_TURN_EVENT, 0)
-            pygame.time.set_timer(PLAYER_TURN_EVENT, 0)
-            self.__display.fill((0, 0, 0))
-            SoundManager.stop_music()
-
-            # Obter a posição do coração
-            heart_position = self.player.rect.center
-    
-            # Desenhar o coração na última posição
-            self.player_group.draw(self.__display)
-            SoundManager.play_sound('break_heart_1.wav')
-            self.brake_heart_animation(heart_position, self.heart_sherd)    
+            # A animação roda um frame por vez, o loop principal que apresenta cada um
+            if not self.brake_heart_stage:
+                self.start_brake_heart_animation()
+            self.brake_heart_animation()
             return
 
 
@@ -259,7 +238,7 @@ class Combat(State):
         ]
 
         # ============ DESENHANDO O BACKGROUND ============
-        self.__display.blit(self.background, self.background_rect)
+        RenderManager.draw_static('battle-background', self.background, self.background_rect)
 
         # ============ DANDO UPDATE NOS ELEMENTOS GERAIS ============
         self.battle_container.update()
@@ -267,6 +246,7 @@ class Combat(State):
         self.battle_container.update()
         self.main_menu.update()
         CombatManager.enemy.update()
+        CombatManager.check_collisions()
 
         # ============ DESENHANDO TUDO ============
         CombatManager.enemy.draw(self.__display)
@@ -274,7 +254,7 @@ class Combat(State):
         text_player_name.draw(self.__display)
         hp_container.draw(self.__display)
         self.main_menu.draw()
-        CombatManager.draw_global_groups(self.__display)
+        CombatManager.draw_layers(self.__display, stop=OVERLAY_LAYER)
 
         # Ajustando o container da batalha para ficar em cima da vida do jogador
         self.battle_container.out_rect.bottom = hp_container.inner_rect.bottom - 50
@@ -332,7 +312,7 @@ class Combat(State):
         if CombatManager.enemy.dead:
             if self.transition_counter == 0:
                 SoundManager.stop_music()
-                SoundManager.play_sound('cymbal.ogg', 1)
+                self.cymbal_chanel = SoundManager.play_sound('cymbal.ogg', 'ui')
                 self.go_to_next_screen_transition_measurer = pygame.time.get_ticks()
             
             self.transition_counter += 1
@@ -340,22 +320,35 @@ class Combat(State):
             if self.transition_counter%self.transition_rate == 0 and self.transition_alpha + 1 <= 255:
                 self.transition_alpha += 1
 
-            self.white_transition_surface.fill(pygame.Color(255,255,255,self.transition_alpha))
-
-            self.opacity_helper_surface.blit(self.white_transition_surface, self.white_transition_surface.get_rect())    
-
-            self.__display.blit(self.opacity_helper_surface, self.opacity_helper_surface.get_rect())
+            # Cada frame o branco se acumula por cima do anterior, até cobrir a tela inteira
+            self.transition_opacity = self.transition_alpha + self.transition_opacity*(255-self.transition_alpha)/255
+            Compositor.fade(self.__display, (255,255,255), self.transition_opacity)
 
-            if not SoundManager.is_chanel_playing(1):
+            if not self.cymbal_chanel or not self.cymbal_chanel.get_busy():
                 actual_ticks = pygame.time.get_ticks()
                 if actual_ticks - self.go_to_next_screen_transition_measurer >= 2000:
                     GameStateManager.set_state('show_day')
         
-        CombatManager.execute_global_draws(display=self.__display)
+        CombatManager.draw_layers(self.__display, start=OVERLAY_LAYER)
+
+        if DEBUG:
+            self.draw_debug()
+
+    def draw_debug(self):
+        """Desenha o FPS, quantas camadas estão registradas e quantos projéteis o ataque atual tem vivos
+        """
+        info = f'{RenderManager.get_frame_stats()["fps"]:.0f} FPS | {len(CombatManager.layers)} camadas'
+
+        attack = CombatManager.enemy.current_attack
+        if attack is not None:
+            info += f' | {type(attack).__name__}: {CombatManager.enemy.count_entities()} projéteis'
+
+        Text(info, FontManager.fonts['Gamer'], 30).draw(self.__display)
 
     def on_last_execution(self):
         self.__execution_counter = 0
         CombatManager.enemy.restart_attacks()
+        CombatManager.clear_layers()  # Fim da luta, nada dela é desenhado de novo
 
     @property
     def execution_counter(self):
@@ -369,6 +362,17 @@ class Combat(State):
     def name(self):
         return self.__name
 
+    def prepare_texts(self):
+        """Pede para os textos da batalha serem quebrados em linhas e renderizados em segundo plano
+        """
+        TextManager.clear()
+
+        # O texto inicial aparece no primeiro frame, com o container ainda do tamanho atual
+        self.starter_text.prepare(self.__variables['enemy']['starter_text'], self.battle_container.inner_rect.width-20)
+
+        for dialogue in self.__variables['enemy'].get('attacks_dialogues', []):
+            CombatManager.enemy.dialogue.prepare(dialogue)
+
     @property
     def variables(self):
         return self.__variables
@@ -380,3 +384,5 @@ class Combat(State):
         self.__variables = value
 
         CombatManager.set_boss(self.__variables['enemy'])
+        SoundManager.request_sounds([self.__variables['enemy']['voice']], priority=True)
+        self.prepare_texts()
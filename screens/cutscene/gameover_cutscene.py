@@ -106,8 +106,6 @@ class GameoverCutscene(State):
                     SoundManager.stop_music()
                     GameStateManager.set_state('emap')
 
-        pygame.display.flip()
-
     def on_last_execution(self):    
         self.__execution_counter = 0
         SoundManager.play_music
@@ -9,6 +9,9 @@ from config.globalmanager import GlobalManager
 from config.eventmanager import EventManager
 from config.gamestatemanager import GameStateManager
 from config.soundmanager import SoundManager
+from config.rendermanager import RenderManager
+
+from classes.effects.compositor import Compositor
 
 from classes.map.interaction import InteractionManager
 from classes.map.loader import MapLoader
@@ -74,6 +77,11 @@ class EMAp(State):
         GlobalManager.on_inventory = False
         self.infos_hud: InfosHud = None
 
+        # Enquanto está pausado ou no inventário o mapa não muda, então ele é desenhado uma vez só
+        self.frozen_frame: pygame.Surface = None  # Último frame do mapa antes de pausar
+        self.paused_frame: pygame.Surface = None  # O mesmo frame, escurecido para o menu de pause
+        self.item_collided = []  # Itens que o jogador está encostando
+
     def on_first_execution(self):
         if GameStateManager.previous_state == 'show_day':
             self.player.reset_position()
@@ -83,8 +91,7 @@ class EMAp(State):
         self.player.reset_position()
         SaveManager.load()
         GlobalManager.load_infos()
-        SoundManager.stop_music()
-        SoundManager.play_music(os.path.join(GET_PROJECT_PATH(), "sounds", "map_audio.wav"))
+        SoundManager.play_music(os.path.join(GET_PROJECT_PATH(), "sounds", "map_audio.wav"), crossfade_ms=500)
         self.camera.empty()
         self.items_group.empty()
         self.player.load_infos()
@@ -93,22 +100,20 @@ class EMAp(State):
         self.map_loader.load_walls()  # Carrega as áreas de colisão do mapa
         self.map_loader.load_interactions()
         self.map_loaded = True
-        self.infos_hud = InfosHud(self.items_group)
+        self.infos_hud = None  # O HUD só é construído quando o jogador abrir o inventário
 
         if Player.previous_map_position and GameStateManager.previous_state == 'start':
             self.player.reset_position(Player.previous_map_position)
 
         GlobalManager.paused = False
+        self.frozen_frame = None
+        self.paused_frame = None
 
-    def run(self):
-        if not self.__execution_counter > 0:
-            self.on_first_execution()
-            self.__execution_counter += 1
-        
-        keys = pygame.key.get_pressed()
-
+    def draw_world(self):
+        """Desenha o mapa, os objetos, o jogador e as interações
+        """
         # Limpa a tela
-        self.__display.fill((0, 0, 0))
+        RenderManager.clear(self.__display)
 
         # Atualiza a posição da câmera para seguir o jogador
         self.camera.update(self.player.rect)
@@ -134,22 +139,51 @@ class EMAp(State):
         self.interaction_manager.handle_interaction()
         self.interaction_manager.render_interaction(self.__display)
 
-        item_collided = pygame.sprite.spritecollide(self.player, self.items_group, False, pygame.sprite.collide_mask)
+        self.item_collided = pygame.sprite.spritecollide(self.player, self.items_group, False, pygame.sprite.collide_mask)
 
-        if item_collided:
+        if self.item_collided:
             key_rect = self.tecla_f_image.get_rect(center=self.player.rect.center)
             key_rect.bottom = self.player.rect.top - 20
             self.__display.blit(self.tecla_f_image, self.camera.apply(key_rect))
 
+    def get_frozen_frame(self) -> pygame.Surface:
+        """Retorna o frame congelado do mapa, escurecido (E borrado, se configurado) quando o jogo está pausado
+
+        Returns:
+            pygame.Surface: Frame que fica por baixo do menu
+        """
+        if not GlobalManager.paused:
+            return self.frozen_frame
+
+        if self.paused_frame is None:
+            self.paused_frame = Compositor.blur(self.frozen_frame) if PAUSE_BLUR else self.frozen_frame.copy()
+            Compositor.fade(self.paused_frame, (0, 0, 0), 200)
+        return self.paused_frame
+
+    def run(self):
+        if not self.__execution_counter > 0:
+            self.on_first_execution()
+            self.__execution_counter += 1
+        
+        # Pausado ou no inventário, só o menu muda, o mapa fica congelado
+        if self.frozen_frame is not None and (GlobalManager.paused or GlobalManager.on_inventory):
+            self.__display.blit(self.get_frozen_frame(), (0, 0))
+        else:
+            self.frozen_frame = None
+            self.paused_frame = None
+            self.draw_world()
+
         # Checando se pausou
         for event in EventManager.events:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     GlobalManager.paused = not GlobalManager.paused
-                if event.key == pygame.K_f and item_collided:
-                    self.player.inventory.add_item(item_collided[0])
-                    item_collided[0].kill()
-                    self.infos_hud.update_infos()
+                if event.key == pygame.K_f and self.item_collided:
+                    self.player.inventory.add_item(self.item_collided[0])
+                    self.item_collided[0].kill()
+                    self.item_collided = self.item_collided[1:]
+                    if self.infos_hud:
+                        self.infos_hud.update_infos()
                 if event.key == pygame.K_e:
                     GlobalManager.on_inventory = not GlobalManager.on_inventory
 
@@ -162,14 +196,25 @@ class EMAp(State):
                 keys = pygame.key.get_pressed()
                 self.player.move(keys)
         else:
+            if self.frozen_frame is None:  # Acabou de pausar, o mapa desse frame é o que fica congelado
+                self.frozen_frame = RenderManager.snapshot()
+                self.__display.blit(self.get_frozen_frame(), (0, 0))
+
             if GlobalManager.paused:  # Se o jogo estiver pausado
                 self.pause_menu.run()
             elif GlobalManager.on_inventory:  # Se o jogador estiver no inventário
-                self.infos_hud.update()
+                self.get_infos_hud().update()
                 self.infos_hud.draw()
 
-        # Atualiza a tela
-        pygame.display.flip()
+    def get_infos_hud(self) -> InfosHud:
+        """Retorna o HUD de informações, construindo ele apenas na primeira vez que o inventário é aberto
+
+        Returns:
+            InfosHud: O HUD de informações do jogador
+        """
+        if self.infos_hud is None:
+            self.infos_hud = InfosHud(self.items_group)
+        return self.infos_hud
 
     def on_last_execution(self):
         self.__execution_counter = 0
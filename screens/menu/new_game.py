@@ -41,8 +41,36 @@ class NewGameConfirmation(State):
         # Informações sobre o cursor que marca qual a opção selecionada
         self.cursor_icon = pygame.transform.scale_by(pygame.image.load(os.path.join(GET_PROJECT_PATH(), 'sprites', 'player', 'hearts', 'heart.png')), 1.5)
         self.cursor_rect = self.cursor_icon.get_rect()
+
+        self.static_layer: list[tuple[pygame.Surface, pygame.Rect]] = None  # Textos já posicionados, montados uma vez só
+        self.save_exists = False
     
+    def build_static_layer(self) -> list[tuple[pygame.Surface, pygame.Rect]]:
+        """Monta o texto de confirmação e posiciona as opções, que não mudam enquanto a cena está aberta
+
+        Returns:
+            list[tuple[pygame.Surface, pygame.Rect]]: Imagens e onde cada uma é desenhada
+        """
+        for i, option in enumerate(self.menu_options):
+            # Matemática para centralizar as opções
+            option['label'].rect.center = (
+                (self.option_measures[0]/2) + (self.option_measures[0]*(i)) + (self.display_info.current_w-self.option_measures[0]*len(self.menu_options))/2,
+                self.display_info.current_h/2,
+            )
+
+        # Fazendo o texto de confirmação
+        text_object = Text('Deseja sobrescrever seu progresso com um novo jogo?', FontManager.fonts['Gamer'], 60)
+        text_object.rect.center = (
+            self.__display.get_width()/2,
+            self.__display.get_height()/2-60
+        )
+
+        return [(option['label'].img, option['label'].rect) for option in self.menu_options] + [(text_object.img, text_object.rect)]
+
     def on_first_execution(self):
+        self.save_exists = SaveManager.save_exists()  # Só checo o arquivo uma vez
+        self.static_layer = self.build_static_layer()
+
         # Checo se ele não iniciou a cena segurando o botão de confirmar
         EventManager.clear()
 
@@ -66,17 +94,9 @@ class NewGameConfirmation(State):
             self.on_first_execution()
             self.__execution_counter += 1
 
-        # Fazendo o texto de confirmação
-        text_confirmation = ''
-        if SaveManager.save_exists():
-            text_confirmation = 'Deseja sobrescrever seu progresso com um novo jogo?'
-        else:
+        # Sem save não tem o que sobrescrever
+        if not self.save_exists:
             GameStateManager.set_state('new_name')
-        text_object = Text(text_confirmation, FontManager.fonts['Gamer'], 60)
-        text_object.rect.center = (
-            self.__display.get_width()/2,
-            self.__display.get_height()/2-60
-        )
 
         for event in EventManager.events:
             if event.type == pygame.KEYDOWN:
@@ -96,21 +116,9 @@ class NewGameConfirmation(State):
         # Ajustando o cursor
         self.cursor_rect.topleft = self.menu_options[self.selected_option]['label'].rect.topright
 
-        # Desenho cada uma das opções
-        for i, option in enumerate(self.menu_options):
-            # Matemática para centralizar as opções
-            option['label'].rect.center = (
-                # self.display_info.current_w/2,
-                # (self.option_measures[1]/2) + (self.option_measures[1]*(i)) + (self.display_info.current_h-self.option_measures[1]*len(self.menu_options))/2,
-                (self.option_measures[0]/2) + (self.option_measures[0]*(i)) + (self.display_info.current_w-self.option_measures[0]*len(self.menu_options))/2,
-                self.display_info.current_h/2,
-            )
-            
-            # Desenhando o texto da opção
-            option['label'].draw(self.__display)
-        
+        # Desenho as opções e o texto de uma vez só
+        self.__display.blits(self.static_layer, False)
         self.__display.blit(self.cursor_icon, self.cursor_rect)
-        text_object.draw(self.__display)
 
     def on_last_execution(self):
         self.__execution_counter = 0
@@ -30,8 +30,31 @@ class NewName(State):
         self.font_size = 60
         self.max_player_name_size = 10
         self.player_name_text = Text('', FontManager.fonts['Gamer'], self.font_size)
+
+        self.static_layer: list[tuple[pygame.Surface, pygame.Rect]] = None  # Textos fixos já posicionados, montados uma vez só
     
+    def build_static_layer(self) -> list[tuple[pygame.Surface, pygame.Rect]]:
+        """Monta os textos fixos da cena, acima e abaixo do nome que está sendo digitado
+
+        Returns:
+            list[tuple[pygame.Surface, pygame.Rect]]: Imagens e onde cada uma é desenhada
+        """
+        center = self.__display.get_rect().center
+
+        set_your_name_text = Text('DIGITE O SEU NOME', FontManager.fonts['Gamer'], self.font_size)
+        confirm_text = Text('APERTE ENTER PARA CONFIRMAR', FontManager.fonts['Gamer'], self.font_size - 30)
+
+        set_your_name_text.rect.center = center
+        set_your_name_text.rect.centery -= 50
+
+        confirm_text.rect.center = center
+        confirm_text.rect.centery += 50
+
+        return [(set_your_name_text.img, set_your_name_text.rect), (confirm_text.img, confirm_text.rect)]
+
     def on_first_execution(self):
+        self.static_layer = self.build_static_layer()
+
         # Checo se ele não iniciou a cena segurando o botão de confirmar
         EventManager.clear()
 
@@ -56,21 +79,12 @@ class NewName(State):
                     SaveManager.create_new_save_file(self.player_name)
                     GameStateManager.set_state('intro_cutscene')
         
-        set_your_name_text = Text('DIGITE O SEU NOME', FontManager.fonts['Gamer'], self.font_size)
-        confirm_text = Text('APERTE ENTER PARA CONFIRMAR', FontManager.fonts['Gamer'], self.font_size - 30)
-
         self.player_name_text.rect.centerx = self.__display.get_rect().width/2
         self.player_name_text.rect.centery = self.__display.get_rect().height/2
 
-        set_your_name_text.rect.center = self.player_name_text.rect.center
-        set_your_name_text.rect.centery -= 50
-
-        confirm_text.rect.center = self.player_name_text.rect.center
-        confirm_text.rect.centery += 50
-
+        # Só o nome muda, os outros textos já estão prontos
         self.player_name_text.draw(self.display)
-        set_your_name_text.draw(self.display)
-        confirm_text.draw(self.display)
+        self.display.blits(self.static_layer, False)
 
     def on_last_execution(self):
         self.__execution_counter = 0
@@ -46,8 +46,26 @@ class Options(State):
         # de confirmação selecionado (Enter ou Z), assim eu posso evitar que ele entre
         # na tela ja selecionando a opção por acidente
         self.entered_holding_confirm_button = False
+
+        self.static_layer: list[tuple[pygame.Surface, pygame.Rect]] = None  # Opções já posicionadas, montadas uma vez só
     
+    def build_static_layer(self) -> list[tuple[pygame.Surface, pygame.Rect]]:
+        """Posiciona as opções do menu, que não mudam enquanto a cena está aberta
+
+        Returns:
+            list[tuple[pygame.Surface, pygame.Rect]]: Imagens e onde cada uma é desenhada
+        """
+        for i, option in enumerate(self.menu_options):
+            # Matemática para centralizar as opções
+            option['label'].rect.center = (
+                self.display_info.current_w/2,
+                (self.option_measures[1]/2) + (self.option_measures[1]*(i)) + (self.display_info.current_h-self.option_measures[1]*len(self.menu_options))/2,
+            )
+        return [(option['label'].img, option['label'].rect) for option in self.menu_options]
+
     def on_first_execution(self):
+        self.static_layer = self.build_static_layer()
+
         # Checo se ele não iniciou a cena segurando o botão de confirmar
         keys = pygame.key.get_pressed()
         if keys[pygame.K_RETURN] or keys[pygame.K_z]:
@@ -94,16 +112,8 @@ class Options(State):
             self.menu_options[self.selected_option]['label'].rect.center[1]  # Centralizando o cursor
         )
 
-        # Desenho cada uma das opções
-        for i, option in enumerate(self.menu_options):
-            # Matemática para centralizar as opções
-            option['label'].rect.center = (
-                self.display_info.current_w/2,
-                (self.option_measures[1]/2) + (self.option_measures[1]*(i)) + (self.display_info.current_h-self.option_measures[1]*len(self.menu_options))/2,
-            )
-            # Desenhando o texto da opção
-            option['label'].draw(self.__display)
-        
+        # Desenho as opções de uma vez só
+        self.__display.blits(self.static_layer, False)
         self.__display.blit(self.cursor_icon, self.cursor_rect)
 
     def on_last_execution(self):
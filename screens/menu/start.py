@@ -50,12 +50,30 @@ class Start(State):
         # Informações sobre o cursor que marca qual a opção selecionada
         self.cursor_icon = pygame.transform.scale_by(pygame.image.load(os.path.join(GET_PROJECT_PATH(), 'sprites', 'player', 'hearts', 'heart.png')), 1.5)
         self.cursor_rect = self.cursor_icon.get_rect()
+
+        self.static_layer: list[tuple[pygame.Surface, pygame.Rect]] = None  # Opções já posicionadas, montadas uma vez só
     
+    def build_static_layer(self) -> list[tuple[pygame.Surface, pygame.Rect]]:
+        """Posiciona as opções do menu, que não mudam enquanto a cena está aberta
+
+        Returns:
+            list[tuple[pygame.Surface, pygame.Rect]]: Imagens e onde cada uma é desenhada
+        """
+        for i, option in enumerate(self.menu_options):
+            # Matemática para centralizar as opções
+            option['label'].rect.center = (
+                self.display_info.current_w/2,
+                (self.option_measures[1]/2) + (self.option_measures[1]*(i)) + (self.display_info.current_h-self.option_measures[1]*len(self.menu_options))/2,
+            )
+        return [(option['label'].img, option['label'].rect) for option in self.menu_options]
+
     def on_first_execution(self):
         # Inicializando a Música
         if not SoundManager.is_playing():
             SoundManager.play_music(os.path.join(GET_PROJECT_PATH(), 'sounds', 'msc_the_field_of_dreams.mp3'))
 
+        self.static_layer = self.build_static_layer()
+
         # Checo se ele não iniciou a cena segurando o botão de confirmar
         EventManager.clear()
 
@@ -92,17 +110,8 @@ class Start(State):
             self.menu_options[self.selected_option]['label'].rect.center[1]  # Centralizando o cursor
         )
 
-        # Desenho cada uma das opções
-        for i, option in enumerate(self.menu_options):
-            # Matemática para centralizar as opções
-            option['label'].rect.center = (
-                self.display_info.current_w/2,
-                (self.option_measures[1]/2) + (self.option_measures[1]*(i)) + (self.display_info.current_h-self.option_measures[1]*len(self.menu_options))/2,
-            )
-            
-            # Desenhando o texto da opção
-            option['label'].draw(self.__display)
-        
+        # Desenho as opções de uma vez só
+        self.__display.blits(self.static_layer, False)
         self.__display.blit(self.cursor_icon, self.cursor_rect)
 
     def on_last_execution(self):
@@ -53,17 +53,6 @@ class PauseMenu(State):
         self.option_measures = [500, 105]  # Medidas de cada Opção
         self.display_info = pygame.display.Info()  # Informações sobre a tela
 
-        self.auxiliar_surface = pygame.Surface((
-            self.display_info.current_w,
-            self.display_info.current_h
-        ), pygame.SRCALPHA)
-
-        self.background = pygame.Surface(
-            self.auxiliar_surface.get_size(),
-            pygame.SRCALPHA
-        )
-        self.background.fill((0,0,0,200))
-
         # Informações sobre o cursor que marca qual a opção selecionada
         self.cursor_icon = pygame.transform.scale_by(pygame.image.load(os.path.join(GET_PROJECT_PATH(), 'sprites', 'player', 'hearts', 'heart.png')), 1.5)
         self.cursor_rect = self.cursor_icon.get_rect()
@@ -76,7 +65,30 @@ class PauseMenu(State):
         self.save_response_text = None
         self.save_response_text_maximum_time = FPS*5
         self.save_response_text_time_counter = 0
+
+        # Opções e aviso de save já posicionados (Volta a ser None quando algum deles muda)
+        self.static_layer: list[tuple[pygame.Surface, pygame.Rect]] = None
     
+    def build_static_layer(self) -> list[tuple[pygame.Surface, pygame.Rect]]:
+        """Posiciona as opções do menu e o aviso de save, se ele estiver aparecendo
+
+        Returns:
+            list[tuple[pygame.Surface, pygame.Rect]]: Imagens e onde cada uma é desenhada
+        """
+        layer = []
+        if self.save_response_text and self.save_response_text_time_counter <= self.save_response_text_maximum_time:
+            layer.append((self.save_response_text.img, self.save_response_text.rect))
+
+        for i, option in enumerate(self.menu_options):
+            # Matemática para centralizar as opções
+            option['label'].rect.center = (
+                self.display_info.current_w/2,
+                (self.option_measures[1]/2) + (self.option_measures[1]*(i)) + (self.display_info.current_h-self.option_measures[1]*len(self.menu_options))/2,
+            )
+            layer.append((option['label'].img, option['label'].rect))
+
+        return layer
+
     def save_game(self):
         try:
             SaveManager.save()
@@ -86,9 +98,10 @@ class PauseMenu(State):
             self.save_response_text = Text('JOGO SALVO COM SUCESSO', FontManager.fonts['Gamer'], 70, (252, 219, 3))
         finally:
             self.save_response_text_time_counter = 0
+            self.static_layer = None  # O aviso entra na camada
 
     def on_first_execution(self):
-        pass
+        self.static_layer = self.build_static_layer()
 
     def move_cursor(self, increment):
         if self.selected_option + increment >= len(self.menu_options):
@@ -104,9 +117,6 @@ class PauseMenu(State):
             self.on_first_execution()
             self.__execution_counter += 1
 
-        self.__display.blit(self.auxiliar_surface, self.auxiliar_surface.get_rect())
-        self.__display.blit(self.background, self.background.get_rect())
-
         for event in EventManager.events:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_DOWN:
@@ -125,18 +135,14 @@ class PauseMenu(State):
 
         if self.save_response_text and self.save_response_text_time_counter <= self.save_response_text_maximum_time:
             self.save_response_text_time_counter += 1
-            self.save_response_text.draw(self.__display)
+            if self.save_response_text_time_counter > self.save_response_text_maximum_time:
+                self.static_layer = None  # O tempo do aviso acabou, ele sai da camada
 
-        # Desenho cada uma das opções
-        for i, option in enumerate(self.menu_options):
-            # Matemática para centralizar as opções
-            option['label'].rect.center = (
-                self.display_info.current_w/2,
-                (self.option_measures[1]/2) + (self.option_measures[1]*(i)) + (self.display_info.current_h-self.option_measures[1]*len(self.menu_options))/2,
-            )
-            # Desenhando o texto da opção
-            option['label'].draw(self.__display)
-        
+        if self.static_layer is None:
+            self.static_layer = self.build_static_layer()
+
+        # Desenho as opções (E o aviso) de uma vez só
+        self.__display.blits(self.static_layer, False)
         self.__display.blit(self.cursor_icon, self.cursor_rect)
 
     def on_last_execution(self):
@@ -0,0 +1,102 @@
+import unittest
+import os
+import sys
+import pygame
+from types import SimpleNamespace
+from unittest import mock
+sys.path.append(os.getcwd())
+from config.combatmanager import CombatManager
+
+
+class Box(pygame.sprite.Sprite):
+    def __init__(self, x, mask=True, *groups):
+        super().__init__(*groups)
+        self.rect = pygame.Rect(x, 0, 4, 4)
+        if mask:
+            self.mask = pygame.mask.Mask((4, 4))  # Máscara vazia, nunca encosta
+
+
+class CombatManagerTests(unittest.TestCase):
+    def setUp(self):
+        self.heart = SimpleNamespace(rect=pygame.Rect(0, 0, 10, 10), mask=pygame.mask.Mask((10, 10), fill=True))
+        CombatManager.set_variable('player', self.heart)
+        CombatManager.hitboxes.clear()
+
+    def tearDown(self):
+        CombatManager.hitboxes.clear()
+        CombatManager.clear_layers()
+        CombatManager.enemy = None
+        CombatManager.set_variable('player', None)
+
+    def test_group_collision(self):
+        """Testa se os sprites do grupo passam pelo retângulo e depois pela máscara (Quando têm uma)"""
+        group = pygame.sprite.Group()
+        without_mask = Box(2, False, group)
+        Box(4, True, group)
+        Box(50, False, group)
+
+        hits = CombatManager.collide(group, self.heart.rect, self.heart.mask)
+        self.assertEqual(hits, [without_mask])
+
+    def test_only_current_attack(self):
+        """Testa se só as hitboxes do ataque atual (E do boss) são testadas"""
+        current, other = object(), object()
+        CombatManager.enemy = SimpleNamespace(current_attack=current)
+
+        group = pygame.sprite.Group(Box(0, False))
+        reports = []
+        CombatManager.register_hitbox(current, group, lambda hits: reports.append('current'))
+        CombatManager.register_hitbox(other, group, lambda hits: reports.append('other'))
+        CombatManager.register_hitbox(CombatManager.enemy, group, lambda hits: reports.append('boss'))
+
+        CombatManager.check_collisions()
+        self.assertEqual(reports, ['current', 'boss'])
+
+        CombatManager.enemy.current_attack = None
+        CombatManager.check_collisions()
+        self.assertEqual(len(reports), 2)
+
+    def test_prewarmed_boss(self):
+        """Testa se a luta usa as imagens lidas em segundo plano, descarta as outras e só mantém as hitboxes do boss novo"""
+        image = pygame.Surface((4, 4))
+        CombatManager.prepared_images['boss.png'] = CombatManager.executor.submit(lambda: image)
+        CombatManager.prepared_images['outro.png'] = CombatManager.executor.submit(lambda: image)
+        self.assertIsNot(CombatManager.load_image('boss.png'), image)
+        self.assertEqual(CombatManager.load_image('boss.png').get_size(), (4, 4))
+
+        class Boss:
+            def __init__(self, infos):
+                self.attacks = []
+
+            def register(self):
+                CombatManager.register_hitbox(self, [], print)
+
+        CombatManager.register_hitbox(object(), [], print)  # Do boss anterior
+        with mock.patch.object(CombatManager, 'boss_class', return_value=Boss):
+            CombatManager.set_boss({'name': 'Teste'})
+
+        self.assertIsInstance(CombatManager.enemy, Boss)
+        self.assertEqual(CombatManager.prepared_images, {})
+        self.assertEqual([hitbox[0] for hitbox in CombatManager.hitboxes], [CombatManager.enemy])
+
+    def test_layers(self):
+        """Testa se as camadas são desenhadas pela ordem e somem quando o escopo acaba"""
+        drawn = []
+        overlay = lambda display: drawn.append('overlay')
+        attack = lambda display: drawn.append('attack')
+        combat = lambda display: drawn.append('combat')
+
+        CombatManager.add_layer(None, overlay, 100)
+        CombatManager.add_layer(None, attack, 0, 'attack')
+        CombatManager.add_layer(None, combat, 0)
+        CombatManager.add_layer(None, combat, 0)  # Repetida, não entra de novo
+
+        CombatManager.draw_layers(None)
+        self.assertEqual(drawn, ['attack', 'combat', 'overlay'])
+
+        drawn.clear()
+        CombatManager.draw_layers(None, stop=100)
+        self.assertEqual(drawn, ['attack', 'combat'])
+
+        CombatManager.set_player_turn()
+        self.assertEqual([layer[3] for layer in CombatManager.layers], [combat, overlay])
@@ -0,0 +1,37 @@
+import unittest
+import os
+import sys
+import pygame
+sys.path.append(os.getcwd())
+from classes.bosses.hitbox import RectHitbox, OrientedRectHitbox, CircleHitbox, SegmentHitbox
+
+
+class HitboxTests(unittest.TestCase):
+    def setUp(self):
+        self.heart = pygame.Rect(100, 100, 20, 20)
+
+    def test_rect(self):
+        """Testa se o retângulo só colide quando sobrepõe o coração, não quando só encosta na borda"""
+        self.assertTrue(RectHitbox((110, 110, 50, 5)).collide_rect(self.heart))
+        self.assertFalse(RectHitbox((120, 100, 5, 5)).collide_rect(self.heart))  # Só encostando na borda
+
+    def test_oriented_rect(self):
+        """Testa se o retângulo girado usa a forma girada, não o retângulo que envolve ele"""
+        diamond = OrientedRectHitbox((90, 90), (20, 20), 45)
+        self.assertFalse(diamond.collide_rect(self.heart))  # O retângulo que envolve o losango encostaria
+        self.assertTrue(OrientedRectHitbox((80, 80), (60, 4), -45).collide_rect(self.heart))
+        self.assertFalse(OrientedRectHitbox((80, 80), (60, 4), 45).collide_rect(self.heart))
+        self.assertTrue(OrientedRectHitbox((110, 110), (2, 2), 30).collide_rect(self.heart))
+
+    def test_circle(self):
+        """Testa se o círculo usa a distância até o retângulo, não o retângulo que envolve ele"""
+        self.assertTrue(CircleHitbox((110, 90), 11).collide_rect(self.heart))
+        self.assertFalse(CircleHitbox((92, 92), 10).collide_rect(self.heart))  # Perto do canto, mas fora
+        self.assertFalse(CircleHitbox((110, 110), 0).collide_rect(self.heart))
+
+    def test_segment(self):
+        """Testa se o segmento colide pela distância até o coração, levando em conta a espessura"""
+        self.assertTrue(SegmentHitbox((0, 0), (200, 200), 1).collide_rect(self.heart))  # Atravessa
+        self.assertTrue(SegmentHitbox((0, 95), (200, 95), 12).collide_rect(self.heart))  # Passa perto
+        self.assertFalse(SegmentHitbox((0, 95), (200, 95), 8).collide_rect(self.heart))
+        self.assertFalse(SegmentHitbox((125, 125), (125, 125), 4).collide_rect(self.heart))
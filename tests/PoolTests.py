@@ -0,0 +1,117 @@
+import unittest
+import os
+import sys
+import pygame
+sys.path.append(os.getcwd())
+from classes.bosses.pool import Projectile, ProjectilePool
+
+
+class Dummy(Projectile):
+    def spawn(self, x=0):
+        self.image = pygame.Surface((4, 4))
+        self.rect = self.image.get_rect(x=x)
+
+
+class ProjectilePoolTests(unittest.TestCase):
+    def test_preallocation(self):
+        """Testa se os projéteis são criados de início e reaproveitados"""
+        pool = ProjectilePool(Dummy, pygame.sprite.Group(), 3)
+        created = list(pool.free)
+
+        projectiles = [pool.acquire(i) for i in range(3)]
+        self.assertEqual(len(pool), 3)
+        self.assertEqual(len(pool.free), 0)
+        self.assertCountEqual(projectiles, created)
+
+    def test_kill_returns_to_pool(self):
+        """Testa se um projétil destruído volta para a pool uma vez só"""
+        pool = ProjectilePool(Dummy, pygame.sprite.Group())
+        projectile = pool.acquire(10)
+
+        projectile.kill()
+        projectile.kill()
+        self.assertEqual(len(pool), 0)
+        self.assertEqual(pool.free, [projectile])
+
+        self.assertIs(pool.acquire(20), projectile)
+        self.assertEqual(projectile.rect.x, 20)
+
+    def test_release_all(self):
+        """Testa se todos os projéteis ativos são devolvidos"""
+        group = pygame.sprite.Group()
+        pool = ProjectilePool(Dummy, group)
+        for _ in range(5):
+            pool.acquire()
+
+        pool.release_all()
+        self.assertEqual(len(group), 0)
+        self.assertEqual(len(pool.free), 5)
+
+    def test_step(self):
+        """Testa se o movimento em lote anda como um Rect somando floats (Arredondando a cada frame)"""
+        pool = ProjectilePool(Dummy, pygame.sprite.Group())
+        projectile = pool.acquire(0)
+        projectile.set_motion((0.5, 1), (0, 2), (10, 4))
+
+        rect = projectile.rect.copy()
+        velocity = [0.5, 1]
+        for _ in range(5):
+            pool.step()
+            rect.x += velocity[0]
+            rect.y += velocity[1]
+            velocity[1] = min(velocity[1] + 2, 4)
+        self.assertEqual(projectile.rect.topleft, rect.topleft)
+
+    def test_collide(self):
+        """Testa se só os projéteis ativos que encostam no objeto colidem"""
+        pool = ProjectilePool(Dummy, pygame.sprite.Group())
+        for x in (0, 10, 100):
+            pool.acquire(x).mask = pygame.mask.Mask((4, 4), fill=True)
+        target = pygame.Rect(2, 0, 10, 4)
+
+        collided = pool.collide(target, pygame.mask.Mask(target.size, fill=True))
+        self.assertEqual(sorted(p.rect.x for p in collided), [0, 10])
+
+        collided[0].kill()
+        self.assertEqual(len(pool.collide(target, pygame.mask.Mask(target.size, fill=True))), 1)
+
+    def test_cull_off_screen(self):
+        """Testa se só os projéteis que saíram da área e continuam se afastando são destruídos"""
+        pool = ProjectilePool(Dummy, pygame.sprite.Group(), bounds=pygame.Rect(0, 0, 100, 100))
+        leaving = pool.acquire(98)
+        leaving.set_motion((5, 0))
+        coming = pool.acquire(200)
+        coming.set_motion((-5, 0))
+        waiting = pool.acquire(300)
+
+        for _ in range(3):
+            pool.step()
+        self.assertFalse(leaving.active)
+        self.assertTrue(coming.active)
+        self.assertTrue(waiting.active)
+
+    def test_lifetime(self):
+        """Testa se o projétil some sozinho depois do tempo de vida"""
+        class ShortLived(Dummy):
+            lifetime = 3
+
+        pool = ProjectilePool(ShortLived, pygame.sprite.Group())
+        projectile = pool.acquire()
+
+        pool.step()
+        pool.step()
+        self.assertTrue(projectile.active)
+        pool.step()
+        self.assertFalse(projectile.active)
+
+    def test_shared_assets(self):
+        """Testa se a imagem compartilhada é criada uma vez só"""
+        calls = []
+        def build():
+            calls.append(1)
+            return pygame.Surface((2, 2))
+
+        first = Dummy.get_asset(('test_shared_assets',), build)
+        second = Dummy.get_asset(('test_shared_assets',), build)
+        self.assertIs(first[0], second[0])
+        self.assertEqual(len(calls), 1)
@@ -0,0 +1,93 @@
+import unittest
+import os
+import sys
+import pygame
+sys.path.append(os.getcwd())
+from classes.bosses import Attack
+from classes.bosses.pool import Projectile, ProjectilePool
+from classes.bosses.timeline import Timeline
+
+
+def build(seed, calls):
+    timeline = Timeline(seed)
+    for frame in timeline.every(30, 100):
+        timeline.add(frame, calls.append, timeline.rng.random())
+    return timeline
+
+
+class Dot(Projectile):
+    lifetime = None
+
+    def spawn(self, x):
+        self.image = pygame.Surface((4, 4))
+        self.rect = self.image.get_rect(x=x)
+
+
+class DotsAttack(Attack):
+    """Ataque mínimo: um projétil parado a cada 10 frames, numa posição sorteada"""
+    def __init__(self):
+        self.dots_pool = ProjectilePool(Dot, pygame.sprite.Group())
+        self.__duration = 100
+        self.__duration_counter = 0
+
+    def schedule(self, timeline):
+        for frame in timeline.every(10, self.__duration):
+            timeline.add(frame, self.dots_pool.acquire, timeline.rng.randint(0, 1000))
+
+    def run(self):
+        self.__duration_counter += 1
+        self.play_timeline(self.__duration_counter)
+
+    def restart(self):
+        self.__duration_counter = 0
+        self.dots_pool.release_all()
+        self.compile_timeline()
+
+    @property
+    def player(self):
+        return None
+
+    @property
+    def duration(self):
+        return self.__duration
+
+    @property
+    def duration_counter(self):
+        return self.__duration_counter
+
+
+class TimelineTests(unittest.TestCase):
+    def test_same_seed(self):
+        """Testa se a mesma seed gera o mesmo roteiro"""
+        calls = []
+        self.assertEqual(build(42, calls).events, build(42, calls).events)
+        self.assertNotEqual(build(42, calls).events, build(43, calls).events)
+
+    def test_play(self):
+        """Testa se as ações só acontecem no frame delas"""
+        timeline = Timeline(0)
+        calls = []
+        for frame in timeline.every(30, 100):
+            timeline.add(frame, calls.append, frame)
+
+        self.assertEqual(len(timeline), 3)
+        for frame in range(1, 101):
+            timeline.play(frame)
+        self.assertEqual(calls, [30, 60, 90])
+
+    def test_seek_same_seed(self):
+        """Testa se o mesmo ataque avançado com a mesma seed fica no mesmo estado"""
+        attack = DotsAttack()
+        attack.seek(55, seed=7)
+        first = sorted(dot.rect.x for dot in attack.dots_pool.group)
+
+        attack.seek(55, seed=7)
+        self.assertEqual(sorted(dot.rect.x for dot in attack.dots_pool.group), first)
+        self.assertEqual(attack.count_entities(), 5)
+
+    def test_seek_stops_at_frame(self):
+        """Testa se o seek para no frame pedido"""
+        attack = DotsAttack()
+        attack.seek(30, seed=1)
+        self.assertEqual(attack.duration_counter, 30)
+        self.assertEqual(attack.count_entities(), 3)
@@ -3,7 +3,8 @@ import os
 import sys
 import math
 sys.path.append(os.getcwd())
-from utils import radians_to_degrees, reduce_angle, get_positive_angle
+import numpy as np
+from utils import radians_to_degrees, reduce_angle, get_positive_angle, distance_point_and_segment, distance_point_and_segments
 
 
 class RadiansToDegreesTest(unittest.TestCase):
@@ -83,3 +84,15 @@ class PositiveAngleCorrectionTest(unittest.TestCase):
             get_positive_angle(complex(1, 2))
             get_positive_angle(())
             get_positive_angle({})
+
+
+class DistancePointAndSegmentsTest(unittest.TestCase):
+    def test_same_as_single_segment(self):
+        """Testa se a versão em lote dá o mesmo resultado que a de um segmento só"""
+        starts = np.array([[0, 0], [10, 10], [-5, 3], [2, 2]])
+        ends = np.array([[10, 0], [20, 30], [5, -3], [2, 2]])
+        distances = distance_point_and_segments(4, 7, starts, ends)
+
+        for distance, start, end in zip(distances[:3], starts[:3], ends[:3]):
+            self.assertAlmostEqual(distance, distance_point_and_segment(4, 7, *start, *end), places=6)
+        self.assertAlmostEqual(distances[3], math.hypot(2, 5), places=6)  # Segmento sem comprimento vira um ponto
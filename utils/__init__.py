@@ -55,6 +55,27 @@ def distance_point_and_segment(px: float, py: float, x1: float, y1: float, x2: f
     return dist
 
 
+def distance_point_and_segments(px: float, py: float, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Calcula a distância de um ponto até vários segmentos de reta de uma vez
+
+    Args:
+        px (float): x do ponto
+        py (float): y do ponto
+        starts (np.ndarray): Pontos A dos segmentos, com formato (n, 2)
+        ends (np.ndarray): Pontos B dos segmentos, com formato (n, 2)
+
+    Returns:
+        np.ndarray: A distância entre o ponto e cada segmento
+    """
+    starts = np.asarray(starts, dtype=float)
+    AP = np.array([px, py], dtype=float) - starts
+    AB = np.asarray(ends, dtype=float) - starts
+    ab2 = np.einsum('ij,ij->i', AB, AB)
+    ap_ab = np.einsum('ij,ij->i', AP, AB)
+    t = np.clip(np.divide(ap_ab, ab2, out=np.zeros_like(ap_ab), where=ab2 > 0), 0, 1)  # Restringe t ao intervalo [0, 1]
+    return np.linalg.norm(AP - t[:, None]*AB, axis=1)
+
+
 def line_between_two_points(point1: tuple[float], point2: tuple[float]):
     """Função que calcula a equação da reta entre dois pontos
 